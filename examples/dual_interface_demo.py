@@ -8,22 +8,20 @@ Dual Interface Communication Demo
 
 import asyncio
 import numpy as np
-from inspire_demos.inspire_modbus import InspireHandModbus
-from inspire_demos.inspire_serial import InspireHandSerial
+from inspire_demos.inspire_modbus_async import AsyncInspireHandModbus
+from inspire_demos.inspire_serial_async import AsyncInspireHandSerial
 
 async def main():
     print("=== Simple Control + Monitor Demo ===")
     
     # Setup: Serial for control, Modbus for monitoring
-    serial_hand = InspireHandSerial(port="COM3", generation=4)  # Control
-    modbus_hand = InspireHandModbus(ip="192.168.11.210", generation=4)  # Monitor
+    serial_hand = AsyncInspireHandSerial(port="COM3", generation=4)  # Control (native asyncio)
+    modbus_hand = AsyncInspireHandModbus(ip="192.168.11.210", generation=4)  # Monitor (native asyncio)
     
     # Connect
     print("Connecting...")
-    loop = asyncio.get_event_loop()
-    
-    serial_ok = await loop.run_in_executor(None, serial_hand.connect)
-    modbus_ok = await loop.run_in_executor(None, modbus_hand.connect)
+    serial_ok = await serial_hand.connect()
+    modbus_ok = await modbus_hand.connect()
     
     print(f"Serial (control): {'✓' if serial_ok else '✗'}")
     print(f"Modbus (monitor): {'✓' if modbus_ok else '✗'}")
@@ -55,7 +53,7 @@ async def main():
                 # Send command via Serial
                 if serial_ok:
                     angles_array = np.array(angles, dtype=np.int32)
-                    await loop.run_in_executor(None, serial_hand.set_angle, angles_array)
+                    await serial_hand.set_angle(angles_array)
                     print("→ Command sent via Serial")
                 
                 # Wait for movement
@@ -64,19 +62,17 @@ async def main():
                 # Read position via Modbus
                 if modbus_ok:
                     try:
-                        position = await loop.run_in_executor(None, modbus_hand.get_angle_actual)
+                        position = await modbus_hand.get_angle_actual()
                         print(f"← Position from Modbus: {position.tolist()}")
                         
                         # Read tactile data
-                        tactile = await loop.run_in_executor(None, modbus_hand.get_tactile_data)
-                        if tactile:
-                            print(f"← Tactile sensors: {len(tactile)} active")
-                            # Example: Print palm sensor data shape and sample values
-                            if 'palm' in tactile:
-                                palm_shape = tactile['palm'].shape
-                                palm_mean = tactile['palm'].mean()
-                                palm_max = tactile['palm'].max()
-                                print(f"← Palm sensor: {palm_shape[0]}x{palm_shape[1]} matrix | Mean: {palm_mean:.1f} | Max: {palm_max}")
+                        tactile = await modbus_hand.get_all_tactile_data()
+                        # Example: Print palm sensor data shape and sample values
+                        if tactile.palm.size > 0:
+                            palm_shape = tactile.palm.shape
+                            palm_mean = tactile.palm.mean()
+                            palm_max = tactile.palm.max()
+                            print(f"← Palm sensor: {palm_shape[0]}x{palm_shape[1]} matrix | Mean: {palm_mean:.1f} | Max: {palm_max}")
                         
                     except Exception as e:
                         print(f"← Monitor error: {e}")
@@ -93,9 +89,9 @@ async def main():
     # Cleanup
     print("\nDisconnecting...")
     if serial_ok:
-        await loop.run_in_executor(None, serial_hand.disconnect)
+        await serial_hand.disconnect()
     if modbus_ok:
-        await loop.run_in_executor(None, modbus_hand.disconnect)
+        await modbus_hand.disconnect()
     
     print("Done!")
 
@@ -5,41 +5,12 @@ Demonstrates the new structured approach with data classes.
 """
 
 from inspire_demos.inspire_modbus import InspireHandModbus, TactileData
+from inspire_demos.inspire_features import SENSOR_NAMES, TactileFeatureEngine
+from inspire_demos.inspire_recording import SessionRecorder
 import numpy as np
-import json
-import os
 from pathlib import Path
 from datetime import datetime as date
 
-def save_tactile_data_to_jsonl(tactile_data: TactileData, session_dir: str):
-    """Save tactile data to JSONL format."""
-    # Create the recording directory if it doesn't exist
-    recording_path = Path("./recording") / session_dir
-    recording_path.mkdir(parents=True, exist_ok=True)
-    
-    # Prepare the JSONL file path
-    jsonl_file = recording_path / "tactile_data.jsonl"
-    
-    # Convert numpy arrays to lists for JSON serialization
-    def convert_arrays_to_lists(data):
-        if isinstance(data, np.ndarray):
-            return data.tolist()
-        elif hasattr(data, '__dict__'):
-            return {key: convert_arrays_to_lists(value) for key, value in data.__dict__.items()}
-        else:
-            return data
-    
-    # Convert the tactile data to a JSON-serializable format
-    json_data = convert_arrays_to_lists(tactile_data)
-    
-    # Append to JSONL file
-    with open(jsonl_file, 'a', encoding='utf-8') as f:
-        json.dump(json_data, f)
-        f.write('\n')
-    
-    print(f"Tactile data saved to: {jsonl_file}")
-    return jsonl_file
-
 def main():
     # Create session directory based on current timestamp
     session_timestamp = date.now().strftime("%Y%m%d_%H%M%S")
@@ -57,9 +28,15 @@ def main():
         print("=== New TactileData Class Structure ===")
         # Get all tactile data using the new TactileData class
         tactile_data: TactileData = hand.get_all_tactile_data()
+        if tactile_data.palm.size == 0:
+            print("Failed to read tactile data")
+            return
         
-        # Save data to JSONL file
-        save_tactile_data_to_jsonl(tactile_data, session_dir)
+        # Save data to a binary recording (see inspire_recording.open_recording)
+        recording_file = Path("./recording") / session_dir / "tactile_data.bin"
+        with SessionRecorder(recording_file, metadata={"generation": 4}) as recorder:
+            recorder.record(tactile_data, hand.read_state())
+        print(f"Tactile data saved to: {recording_file}")
         
         print(f"Timestamp: {tactile_data.timestamp}")
         print("Sensor data shapes:")
@@ -149,6 +126,12 @@ def main():
             palm_mean = np.mean(tactile_data.palm)
             print(f"Palm pressure summary: {palm_mean:.2f} (avg)")
         
+        print("\n=== Vectorized Features (all sensors in one pass) ===")
+        engine = TactileFeatureEngine(contact_threshold=50)
+        features = engine.compute(tactile_data)
+        for name, total, peak, area in zip(SENSOR_NAMES, features.total, features.peak, features.area):
+            print(f"  {name}: total={total:.0f} peak={peak:.0f} contact taxels={area}")
+
         print("\n=== Timestamp Usage ===")
         print(f"Data collected at Unix timestamp: {tactile_data.timestamp}")
         import datetime
@@ -157,7 +140,7 @@ def main():
         
         print(f"\n=== Data Recording ===")
         print(f"Session directory: ./recording/{session_dir}")
-        print("Data has been saved to tactile_data.jsonl")
+        print("Data has been saved to tactile_data.bin")
         
     except Exception as e:
         print(f"Error: {e}")
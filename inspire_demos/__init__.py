@@ -4,12 +4,25 @@ Inspire Hand Control Library
 A Python library for controlling the Inspire Hand robotic hand via serial and Modbus TCP communication.
 """
 
+from .inspire_adaptive import AdaptiveTactilePoller
+from .inspire_bus import SerialBusScheduler
+from .inspire_compression import TactileCodec
+from .inspire_diagnostics import FrameCapture
+from .inspire_features import TactileFeatureEngine
+from .inspire_instrumentation import TransactionInstrumentation
 from .inspire_modbus import InspireHandModbus
+from .inspire_modbus_async import AsyncInspireHandModbus
+from .inspire_recording import SessionReader, SessionRecorder
 from .inspire_serial import InspireHandSerial
+from .inspire_serial_async import AsyncInspireHandSerial
+from .inspire_shm import TactileRingReader, TactileRingWriter
+from .inspire_streaming import SetpointStreamer
+from .inspire_tactile import TactileFrame, TactileSubscription
+from .inspire_telemetry import TelemetryPoller
 
 __version__ = "0.2.0"
 __author__ = "TechShare Inc."
 __email__ = "contact@techshare.com"
 __description__ = "Python interface for controlling the Inspire Hand robotic hand"
 
-__all__ = ["InspireHandSerial", "inspire_modbus"]
+__all__ = ["InspireHandSerial", "inspire_modbus", "InspireHandModbus", "AsyncInspireHandModbus", "AsyncInspireHandSerial", "SetpointStreamer", "SerialBusScheduler", "TelemetryPoller", "TactileFrame", "TactileRingWriter", "TactileRingReader", "SessionRecorder", "SessionReader", "TactileCodec", "TactileSubscription", "AdaptiveTactilePoller", "TactileFeatureEngine", "TransactionInstrumentation", "FrameCapture"]
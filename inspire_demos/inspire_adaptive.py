@@ -0,0 +1,206 @@
+"""
+Adaptive tactile polling driven by contact activity.
+
+AdaptiveTactilePoller samples every tactile sensor of an InspireHandModbus at
+a low background rate. A sensor whose peak crosses the contact threshold, or
+whose taxels change quickly between samples, is switched to the active rate
+and stays there for a dwell time after the activity ends. Each tick reads only
+the sensors that are due, through a TactileSubscription, so an idle hand costs
+a fraction of the bus bandwidth of fixed-rate polling.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional
+
+import numpy as np
+from loguru import logger
+
+from inspire_demos.inspire_tactile import (
+    TACTILE_SENSORS,
+    TactileData,
+    TactileFrame,
+    TactileSubscription,
+    sensor_view,
+)
+
+MAX_CACHED_SUBSCRIPTIONS = 256  # Distinct due-sensor sets whose read plans are kept
+
+
+class _SensorState:
+    """Scheduling state and counters for one sensor."""
+
+    __slots__ = ("next_due", "active_until", "samples", "activations", "last_update")
+
+    def __init__(self, now: float):
+        self.next_due = now
+        self.active_until = 0.0
+        self.samples = 0
+        self.activations = 0
+        self.last_update = 0.0
+
+
+class AdaptiveTactilePoller:
+    """Polls tactile sensors at an idle or an active rate depending on contact.
+
+    Args:
+        hand: Connected Gen4 InspireHandModbus
+        idle_rate_hz: Background rate of sensors without activity
+        active_rate_hz: Rate of active sensors (the loop tick rate)
+        contact_threshold: A sensor is active while any taxel is at or above this raw value
+        change_threshold: A sensor is active when any taxel changes by at least this much between samples
+        dwell: Seconds a sensor stays active after its last activity
+        sensors: Register names to poll, all 17 sensors by default
+        on_frame: Called from the polling thread with (TactileData, updated sensor names) after each read
+    """
+
+    _logger = logger
+
+    def __init__(self, hand: Any, idle_rate_hz: float = 5.0, active_rate_hz: float = 100.0,
+                 contact_threshold: int = 50, change_threshold: int = 20, dwell: float = 1.0,
+                 sensors: Optional[Iterable[str]] = None,
+                 on_frame: Optional[Callable[[TactileData, FrozenSet[str]], None]] = None):
+        if idle_rate_hz <= 0 or active_rate_hz < idle_rate_hz:
+            raise ValueError(f"Rates must satisfy 0 < idle_rate_hz <= active_rate_hz, got {idle_rate_hz} and {active_rate_hz}")
+        if dwell < 0:
+            raise ValueError(f"dwell must be >= 0, got {dwell}")
+        self._hand = hand
+        self._idle_period = 1.0 / idle_rate_hz
+        self._active_period = 1.0 / active_rate_hz
+        self._contact_threshold = contact_threshold
+        self._change_threshold = change_threshold
+        self._dwell = dwell
+        self._on_frame = on_frame
+        self._names = tuple(sensors) if sensors is not None else tuple(TACTILE_SENSORS)
+        TactileSubscription(self._names)  # Validate the names in the caller's thread
+
+        self._frame = TactileFrame()
+        self._previous = self._frame.buffer.copy()
+        self._views = {name: self._frame.sensor(name) for name in self._names}
+        self._previous_views = {name: sensor_view(self._previous, name) for name in self._names}
+        self._subscriptions: Dict[FrozenSet[str], TactileSubscription] = {}
+        self._sensors: Dict[str, _SensorState] = {}
+        self._latest: Optional[TactileData] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+        self._reads = 0
+        self._failures = 0
+        self._registers = 0
+
+    def start(self) -> "AdaptiveTactilePoller":
+        """Start the polling thread."""
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self.reset_stats()
+        self._thread = threading.Thread(target=self._run, name="inspire-adaptive-tactile", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the polling thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "AdaptiveTactilePoller":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def latest(self) -> Optional[TactileData]:
+        """Newest tactile data (a private copy), or None before the first read."""
+        return self._latest
+
+    def get_active_sensors(self) -> FrozenSet[str]:
+        """Sensors currently polled at the active rate."""
+        now = time.monotonic()
+        return frozenset(name for name, state in self._sensors.items() if state.active_until > now)
+
+    def get_sensor_rates(self) -> Dict[str, float]:
+        """Effective sample rate per sensor in Hz since start() or reset_stats()."""
+        elapsed = time.monotonic() - self._started
+        return {name: state.samples / elapsed if elapsed > 0 else 0.0 for name, state in self._sensors.items()}
+
+    def get_stats(self) -> dict:
+        """Read counters, registers per second and per-sensor activations."""
+        elapsed = time.monotonic() - self._started
+        return {
+            "reads": self._reads,
+            "failures": self._failures,
+            "registers_per_second": self._registers / elapsed if elapsed > 0 else 0.0,
+            "activations": {name: state.activations for name, state in self._sensors.items()},
+        }
+
+    def reset_stats(self) -> None:
+        now = time.monotonic()
+        self._started = now
+        self._reads = self._failures = self._registers = 0
+        for name in self._names:
+            state = self._sensors.get(name) or _SensorState(now)
+            state.samples = state.activations = 0
+            self._sensors[name] = state
+
+    def _subscription(self, due: FrozenSet[str]) -> TactileSubscription:
+        subscription = self._subscriptions.get(due)
+        if subscription is None:
+            if len(self._subscriptions) >= MAX_CACHED_SUBSCRIPTIONS:
+                self._subscriptions.clear()
+            subscription = self._subscriptions[due] = TactileSubscription(name for name in self._names if name in due)
+        return subscription
+
+    def _run(self) -> None:
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            now = time.monotonic()
+            due = frozenset(name for name, state in self._sensors.items() if state.next_due <= now)
+            if due:
+                self._poll(due)
+
+            next_tick += self._active_period
+            now = time.monotonic()
+            if next_tick < now:
+                next_tick = now  # Fell behind: skip the missed ticks
+            # Sleep through ticks where nothing is due
+            earliest = min(state.next_due for state in self._sensors.values())
+            self._stop.wait(max(next_tick, earliest) - now)
+
+    def _poll(self, due: FrozenSet[str]) -> None:
+        subscription = self._subscription(due)
+        try:
+            ok = self._hand.read_into(self._frame, subscription)
+        except Exception as e:
+            self._logger.error(f"Adaptive tactile poll failed: {e}")
+            ok = False
+        now = time.monotonic()
+        if not ok:
+            self._failures += 1
+            for name in due:
+                self._sensors[name].next_due = now + self._active_period
+            return
+
+        self._reads += 1
+        self._registers += subscription.registers
+        for name in due:
+            view = self._views[name]
+            previous = self._previous_views[name]
+            state = self._sensors[name]
+            active = view.max() >= self._contact_threshold
+            if not active and state.samples:
+                active = np.abs(view - previous).max() >= self._change_threshold
+            if active:
+                if state.active_until <= now:
+                    state.activations += 1
+                state.active_until = now + self._dwell
+            previous[...] = view
+            state.samples += 1
+            state.last_update = now
+            state.next_due = now + (self._active_period if state.active_until > now else self._idle_period)
+
+        self._latest = self._frame.copy()
+        if self._on_frame is not None:
+            self._on_frame(self._latest, due)
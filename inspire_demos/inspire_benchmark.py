@@ -0,0 +1,389 @@
+"""
+Reproducible latency benchmarks for both transports.
+
+HandBenchmark times standard scenarios against a connected InspireHandSerial
+or InspireHandModbus with perf_counter_ns() and collects the latencies in
+LatencyHistograms:
+
+- set_get: set_angle() followed by get_angle_set(), checked for equality
+- state: read_state(), the full actuator status window
+- tactile: read_into() of all tactile sensors (Modbus, Gen4)
+- multi_hand: read_state() round-robin over several hand IDs (serial bus)
+
+Results are written as JSON together with the environment and configuration,
+and compare() flags percentile regressions against a saved baseline. The CLI
+runs headless against real devices or the simulators in inspire_sim:
+
+    python -m inspire_demos.inspire_benchmark --transport modbus --simulate --output bench.json
+    python -m inspire_demos.inspire_benchmark --transport serial --port /dev/ttyUSB0 --hand-ids 1 2
+    python -m inspire_demos.inspire_benchmark --simulate --baseline bench.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+from loguru import logger
+
+from inspire_demos.inspire_histogram import LatencyHistogram
+from inspire_demos.inspire_tactile import TactileFrame
+
+SCENARIOS = ("set_get", "state", "tactile", "multi_hand")
+SCHEMA_VERSION = 1
+REPORTED_PERCENTILES = ("p50", "p90", "p99", "p99.9")
+
+# Alternating targets so every set_angle() actually changes the registers
+_COMMANDS = (
+    np.array([0, 0, 0, 0, 200, 1000], dtype=np.int32),
+    np.array([1000, 1000, 1000, 1000, 1000, 1000], dtype=np.int32),
+    np.array([500, 500, 500, 500, 600, 900], dtype=np.int32),
+)
+
+
+@dataclass
+class BenchmarkResult:
+    """Latencies of one scenario.
+
+    Attributes:
+        scenario: Scenario name, see SCENARIOS
+        transport: "serial" or "modbus"
+        iterations: Operations attempted (warmup excluded)
+        failures: Operations that failed or returned wrong data; not in the histogram
+        elapsed: Wall time of the measured operations in seconds
+        histogram: Latencies of the successful operations in nanoseconds
+    """
+    scenario: str
+    transport: str
+    iterations: int
+    failures: int
+    elapsed: float
+    histogram: LatencyHistogram
+
+    @property
+    def throughput(self) -> float:
+        """Successful operations per second"""
+        return self.histogram.count / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scenario": self.scenario,
+            "transport": self.transport,
+            "iterations": self.iterations,
+            "failures": self.failures,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "latency_ns": self.histogram.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        return cls(data["scenario"], data["transport"], data["iterations"], data["failures"],
+                   data["elapsed"], LatencyHistogram.from_dict(data["latency_ns"]))
+
+
+class HandBenchmark:
+    """Runs the benchmark scenarios against one connected hand object.
+
+    Args:
+        hand: Connected InspireHandSerial or InspireHandModbus
+        hand_ids: Hand IDs on a serial bus; the first is used by the single-hand scenarios
+        warmup: Untimed operations before each scenario
+        significant_figures: Histogram precision
+    """
+
+    _logger = logger
+
+    def __init__(self, hand: Any, hand_ids: Sequence[int] = (1,), warmup: int = 20, significant_figures: int = 3):
+        if not hand_ids:
+            raise ValueError("At least one hand ID is required")
+        self._hand = hand
+        self._hand_ids = tuple(hand_ids)
+        self._warmup = warmup
+        self._figures = significant_figures
+        self._transport = _transport_name(hand)
+        self._frame = TactileFrame()
+        self._step = 0
+
+    @property
+    def transport(self) -> str:
+        return self._transport
+
+    def supported(self, scenario: str) -> bool:
+        """Whether scenario applies to this transport and generation."""
+        if scenario == "tactile":
+            return self._transport == "modbus" and self._hand.get_generation() == 4
+        if scenario == "multi_hand":
+            return self._transport == "serial"
+        return scenario in SCENARIOS
+
+    def run(self, scenario: str, iterations: int = 1000, duration: Optional[float] = None) -> BenchmarkResult:
+        """Time one scenario.
+
+        Args:
+            scenario: One of SCENARIOS
+            iterations: Number of timed operations
+            duration: Stop early after this many seconds, if given
+        """
+        if scenario not in SCENARIOS:
+            raise ValueError(f"Unknown scenario '{scenario}'. Available scenarios: {list(SCENARIOS)}")
+        if not self.supported(scenario):
+            raise ValueError(f"Scenario '{scenario}' is not supported over {self._transport}")
+        operation = self._operation(scenario)
+
+        for _ in range(self._warmup):
+            self._attempt(operation)
+
+        histogram = LatencyHistogram(self._figures)
+        latencies = np.empty(iterations, dtype=np.int64)
+        succeeded = 0
+        failures = 0
+        clock = time.perf_counter_ns
+        deadline = None if duration is None else clock() + int(duration * 1e9)
+        attempted = 0
+        start = clock()
+        for _ in range(iterations):
+            t0 = clock()
+            ok = self._attempt(operation)
+            t1 = clock()
+            attempted += 1
+            if ok:
+                latencies[succeeded] = t1 - t0
+                succeeded += 1
+            else:
+                failures += 1
+            if deadline is not None and t1 >= deadline:
+                break
+        elapsed = (clock() - start) / 1e9
+        histogram.record_many(latencies[:succeeded])
+        return BenchmarkResult(scenario, self._transport, attempted, failures, elapsed, histogram)
+
+    def run_all(self, scenarios: Optional[Sequence[str]] = None, iterations: int = 1000,
+                duration: Optional[float] = None) -> List[BenchmarkResult]:
+        """Run the given (default: all supported) scenarios in order."""
+        results = []
+        for scenario in scenarios or [s for s in SCENARIOS if self.supported(s)]:
+            self._logger.info(f"Benchmarking {scenario} over {self._transport} ({iterations} iterations)")
+            results.append(self.run(scenario, iterations, duration))
+        return results
+
+    def _attempt(self, operation: Callable[[], bool]) -> bool:
+        try:
+            return bool(operation())
+        except Exception as e:
+            self._logger.debug(f"Benchmark operation failed: {e}")
+            return False
+
+    def _operation(self, scenario: str) -> Callable[[], bool]:
+        hand = self._hand
+        hand_id = self._hand_ids[0]
+        serial = self._transport == "serial"
+
+        if scenario == "set_get":
+            def set_get() -> bool:
+                command = _COMMANDS[self._step % len(_COMMANDS)]
+                self._step += 1
+                if serial:
+                    hand.set_angle(command, hand_id)
+                    readback = hand.get_angle_set(hand_id)
+                else:
+                    hand.set_angle(command)
+                    readback = hand.get_angle_set()
+                return len(readback) == len(command) and np.array_equal(readback, command)
+            return set_get
+
+        if scenario == "state":
+            if serial:
+                return lambda: hand.read_state(hand_id) is not None
+            return lambda: hand.read_state() is not None
+
+        if scenario == "tactile":
+            return lambda: hand.read_into(self._frame)
+
+        def multi_hand() -> bool:
+            hand_id = self._hand_ids[self._step % len(self._hand_ids)]
+            self._step += 1
+            return hand.read_state(hand_id) is not None
+        return multi_hand
+
+
+def _transport_name(hand: Any) -> str:
+    from inspire_demos.inspire_modbus import InspireHandModbus
+    from inspire_demos.inspire_serial import InspireHandSerial
+
+    if isinstance(hand, InspireHandSerial):
+        return "serial"
+    if isinstance(hand, InspireHandModbus):
+        return "modbus"
+    raise TypeError(f"Expected InspireHandSerial or InspireHandModbus, got {type(hand).__name__}")
+
+
+def environment_info() -> Dict[str, str]:
+    """Library, interpreter and host details stored with every result file."""
+    from inspire_demos import __version__
+
+    return {
+        "inspire_demos": __version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+    }
+
+
+def write_json(results: Sequence[BenchmarkResult], path: Union[str, Path],
+               config: Optional[Dict[str, Any]] = None) -> None:
+    """Write results, environment and run configuration as JSON."""
+    document = {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "environment": environment_info(),
+        "config": config or {},
+        "results": [result.to_dict() for result in results],
+    }
+    Path(path).write_text(json.dumps(document, indent=2))
+
+
+def load_json(path: Union[str, Path]) -> List[BenchmarkResult]:
+    """Read the results of a file written by write_json()."""
+    document = json.loads(Path(path).read_text())
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported benchmark schema {document.get('schema')} in {path}")
+    return [BenchmarkResult.from_dict(result) for result in document["results"]]
+
+
+def compare(baseline: Sequence[BenchmarkResult], current: Sequence[BenchmarkResult],
+            tolerance: float = 0.10, percentiles: Sequence[float] = (50.0, 99.0)) -> List[str]:
+    """Regressions of current against baseline.
+
+    A scenario regresses when one of the percentiles grew by more than
+    tolerance (a fraction), or when it failed more often. Scenarios missing
+    from either side are skipped.
+
+    Returns:
+        List[str]: One message per regression, empty if there are none
+    """
+    previous = {(result.transport, result.scenario): result for result in baseline}
+    regressions = []
+    for result in current:
+        reference = previous.get((result.transport, result.scenario))
+        if reference is None:
+            continue
+        name = f"{result.transport}/{result.scenario}"
+        for p in percentiles:
+            old, new = reference.histogram.percentile(p), result.histogram.percentile(p)
+            if old and new > old * (1 + tolerance):
+                regressions.append(f"{name} p{p:g}: {old / 1e6:.3f} ms -> {new / 1e6:.3f} ms (+{(new / old - 1) * 100:.1f}%)")
+        old_rate = reference.failures / reference.iterations if reference.iterations else 0.0
+        new_rate = result.failures / result.iterations if result.iterations else 0.0
+        if new_rate > old_rate + tolerance / 10:
+            regressions.append(f"{name} failure rate: {old_rate:.2%} -> {new_rate:.2%}")
+    return regressions
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """Plain-text table of the results in milliseconds."""
+    header = f"{'transport':<10}{'scenario':<12}{'ok':>8}{'fail':>6}" + "".join(
+        f"{p:>10}" for p in REPORTED_PERCENTILES) + f"{'max':>10}{'ops/s':>10}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        histogram = result.histogram
+        row = f"{result.transport:<10}{result.scenario:<12}{histogram.count:>8}{result.failures:>6}"
+        row += "".join(f"{value / 1e6:>10.3f}" for value in histogram.percentiles().values())
+        row += f"{histogram.max / 1e6:>10.3f}{result.throughput:>10.1f}"
+        lines.append(row)
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Inspire Hand latency benchmarks")
+    parser.add_argument("--transport", choices=("modbus", "serial"), default="modbus")
+    parser.add_argument("--simulate", action="store_true", help="Run against the built-in simulator")
+    parser.add_argument("--ip", default="192.168.11.210", help="Modbus TCP address")
+    parser.add_argument("--modbus-port", type=int, default=6000)
+    parser.add_argument("--port", default=None, help="Serial port")
+    parser.add_argument("--baudrate", type=int, default=115200)
+    parser.add_argument("--generation", type=int, default=4, choices=(3, 4))
+    parser.add_argument("--hand-ids", type=int, nargs="+", default=[1])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=None)
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=None, help="Time limit per scenario in seconds")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated reply delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Simulated Modbus jitter in seconds")
+    parser.add_argument("--loss", type=float, default=0.0, help="Simulated request loss probability")
+    parser.add_argument("--seed", type=int, default=0, help="Simulator seed")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", default=None, help="Compare against a previous JSON result file")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed percentile growth vs. baseline")
+    args = parser.parse_args(argv)
+
+    from inspire_demos.inspire_modbus import InspireHandModbus
+    from inspire_demos.inspire_serial import InspireHandSerial
+    from inspire_demos.inspire_sim import ModbusHandSimulator, SerialHandEmulator, SimulatedHand
+
+    simulator: Any = None
+    if args.transport == "modbus":
+        ip, port = args.ip, args.modbus_port
+        if args.simulate:
+            simulator = ModbusHandSimulator(hand=SimulatedHand(args.generation, seed=args.seed), latency=args.latency,
+                                            jitter=args.jitter, loss=args.loss, seed=args.seed)
+            simulator.start_in_thread()
+            ip, port = simulator.host, simulator.port
+        hand = InspireHandModbus(ip=ip, port=port, generation=args.generation)
+    else:
+        port = args.port
+        if args.simulate:
+            hands = {hand_id: SimulatedHand(args.generation, hand_id, seed=args.seed) for hand_id in args.hand_ids}
+            simulator = SerialHandEmulator(hands, args.baudrate, turnaround=args.latency, loss=args.loss, seed=args.seed)
+            port = simulator.start()
+        elif port is None:
+            parser.error("--port is required for the serial transport without --simulate")
+        hand = InspireHandSerial(port=port, baudrate=args.baudrate, generation=args.generation)
+
+    connected = False
+    try:
+        benchmark = HandBenchmark(hand, args.hand_ids, args.warmup)
+        unsupported = [scenario for scenario in args.scenarios or () if not benchmark.supported(scenario)]
+        if unsupported:
+            parser.error(f"scenarios {unsupported} are not supported over {benchmark.transport} "
+                         f"with generation {args.generation}")
+        connected = hand.connect()
+        if not connected:
+            logger.error("Could not connect to the hand")
+            return 2
+        results = benchmark.run_all(args.scenarios, args.iterations, args.duration)
+    finally:
+        if connected:
+            hand.disconnect()
+        if isinstance(simulator, ModbusHandSimulator):
+            simulator.stop_thread()
+        elif simulator is not None:
+            simulator.stop()
+
+    print(format_results(results))
+    if args.output:
+        config = {key: value for key, value in vars(args).items() if key not in ("output", "baseline")}
+        write_json(results, args.output, config)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(load_json(args.baseline), results, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+        print("No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+RS-485 bus scheduler for several Inspire Hands sharing one serial port.
+
+SerialBusScheduler owns an InspireHandSerial and runs every transaction on a
+single thread. Hand IDs are polled round-robin at their own rates with
+read_state(), the latest snapshot per hand is cached, and commands submitted
+from any thread are executed between polls. Cycle times stay predictable and
+frames from different callers can never interleave on the bus.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+import numpy.typing as npt
+from loguru import logger
+
+from inspire_demos.inspire_serial import HandState, InspireHandSerial
+
+
+class _PolledHand:
+    """Scheduling state and statistics for one hand ID."""
+
+    __slots__ = ("hand_id", "period", "next_due", "polls", "failures", "overruns",
+                 "last_duration", "max_duration", "first_poll", "last_poll")
+
+    def __init__(self, hand_id: int, rate_hz: float, now: float):
+        self.hand_id = hand_id
+        self.period = 1.0 / rate_hz
+        self.next_due = now
+        self.polls = 0
+        self.failures = 0
+        self.overruns = 0
+        self.last_duration = 0.0
+        self.max_duration = 0.0
+        self.first_poll = 0.0
+        self.last_poll = 0.0
+
+
+class SerialBusScheduler:
+    """Serializes all traffic on one RS-485 bus and polls a set of hand IDs.
+
+    Args:
+        hand: Serial interface owning the port, connected by start() if needed
+        poll_rates: Mapping of hand ID -> state polling rate in Hz
+    """
+
+    _logger = logger
+
+    def __init__(self, hand: InspireHandSerial, poll_rates: Optional[Dict[int, float]] = None):
+        self._hand = hand
+        self._hands: Dict[int, _PolledHand] = {}
+        self._states: Dict[int, HandState] = {}
+        self._commands: "queue.Queue[tuple]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        for hand_id, rate_hz in (poll_rates or {}).items():
+            self.add_hand(hand_id, rate_hz)
+
+    def add_hand(self, hand_id: int, rate_hz: float) -> None:
+        """Poll hand_id at rate_hz (replaces an existing entry)."""
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        with self._lock:
+            self._hands[hand_id] = _PolledHand(hand_id, rate_hz, time.monotonic())
+        self._commands.put(None)  # Wake the scheduler to re-plan
+
+    def remove_hand(self, hand_id: int) -> None:
+        """Stop polling hand_id and drop its cached snapshot."""
+        with self._lock:
+            self._hands.pop(hand_id, None)
+            self._states.pop(hand_id, None)
+
+    def start(self) -> "SerialBusScheduler":
+        """Connect the port if needed and start the scheduler thread."""
+        if self._running:
+            return self
+        if self._hand._ser is None and not self._hand.connect():
+            raise ConnectionError(f"Failed to open serial port {self._hand._port}")
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="inspire-bus-scheduler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the scheduler thread. Commands still queued are cancelled."""
+        if not self._running:
+            return
+        self._running = False
+        self._commands.put(None)
+        self._thread.join()
+        self._thread = None
+        while True:
+            try:
+                item = self._commands.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+
+    def __enter__(self) -> "SerialBusScheduler":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Run fn(*args, **kwargs) on the bus thread between polls.
+
+        fn is typically a bound method of the owned InspireHandSerial.
+
+        Returns:
+            Future: Resolves with the return value of fn
+        """
+        future: Future = Future()
+        self._commands.put((future, fn, args, kwargs))
+        return future
+
+    def set_angle(self, hand_id: int, angles: npt.NDArray[np.integer]) -> Future:
+        """Queue set_angle for one hand on the bus."""
+        return self.submit(self._hand.set_angle, angles, hand_id=hand_id)
+
+    def set_speed(self, hand_id: int, speeds: npt.NDArray[np.integer]) -> Future:
+        """Queue set_speed for one hand on the bus."""
+        return self.submit(self._hand.set_speed, speeds, hand_id=hand_id)
+
+    def set_force(self, hand_id: int, forces: npt.NDArray[np.integer]) -> Future:
+        """Queue set_force for one hand on the bus."""
+        return self.submit(self._hand.set_force, forces, hand_id=hand_id)
+
+    def get_state(self, hand_id: int) -> Optional[HandState]:
+        """Latest cached snapshot for hand_id (no bus traffic), or None before the first poll."""
+        return self._states.get(hand_id)
+
+    def get_states(self) -> Dict[int, HandState]:
+        """Latest cached snapshots of every polled hand."""
+        return dict(self._states)
+
+    def get_cycle_stats(self) -> Dict[int, dict]:
+        """Per-hand polling statistics (durations in seconds, rates in Hz)."""
+        stats = {}
+        with self._lock:
+            for hand_id, entry in self._hands.items():
+                elapsed = entry.last_poll - entry.first_poll
+                stats[hand_id] = {
+                    "target_rate": 1.0 / entry.period,
+                    "effective_rate": (entry.polls - 1) / elapsed if entry.polls > 1 and elapsed > 0 else 0.0,
+                    "polls": entry.polls,
+                    "failures": entry.failures,
+                    "overruns": entry.overruns,
+                    "last_duration": entry.last_duration,
+                    "max_duration": entry.max_duration,
+                }
+        return stats
+
+    def _run(self) -> None:
+        while self._running:
+            # Commands take priority over polling
+            self._drain_commands()
+
+            with self._lock:
+                entry = min(self._hands.values(), key=lambda e: e.next_due, default=None)
+            now = time.monotonic()
+            if entry is None or entry.next_due > now:
+                timeout = None if entry is None else entry.next_due - now
+                try:
+                    item = self._commands.get(timeout=timeout)
+                except queue.Empty:
+                    continue
+                if item is not None:
+                    self._execute(item)
+                continue
+
+            self._poll(entry)
+
+    def _drain_commands(self) -> None:
+        while True:
+            try:
+                item = self._commands.get_nowait()
+            except queue.Empty:
+                return
+            if item is not None:
+                self._execute(item)
+
+    def _execute(self, item: tuple) -> None:
+        future, fn, args, kwargs = item
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+    def _poll(self, entry: _PolledHand) -> None:
+        start = time.monotonic()
+        try:
+            state = self._hand.read_state(entry.hand_id)
+        except Exception as e:
+            self._logger.error(f"Polling hand {entry.hand_id} failed: {e}")
+            state = None
+        end = time.monotonic()
+
+        with self._lock:
+            if self._hands.get(entry.hand_id) is not entry:
+                return  # Removed (or re-added) while the poll was on the bus
+            if state is None:
+                entry.failures += 1
+            else:
+                self._states[entry.hand_id] = state
+                if entry.polls == 0:
+                    entry.first_poll = end
+                entry.polls += 1
+                entry.last_poll = end
+            entry.last_duration = end - start
+            entry.max_duration = max(entry.max_duration, entry.last_duration)
+            entry.next_due += entry.period
+            if entry.next_due < end:
+                # Fell behind: skip the missed slots instead of bursting to catch up
+                entry.overruns += 1
+                entry.next_due = end + entry.period
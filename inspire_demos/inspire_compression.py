@@ -0,0 +1,283 @@
+"""
+Lossless compression of tactile frame streams and recordings.
+
+Most taxels sit at zero or an idle baseline, so consecutive frames differ in
+few places. A block of frames is encoded as:
+
+1. frame-to-frame delta (the first frame against zeros), modulo 2**16
+2. zigzag mapping, so small negative deltas become small positive numbers
+3. byte shuffle: all low bytes, then all high bytes (the latter are almost all zero)
+4. block compression with zstd or lz4 when installed, zlib otherwise
+
+Steps 1-3 turn idle taxels into long runs of zero bytes, which the block
+compressor run-length codes. Every block carries a CRC32 of the raw frames
+that is checked on decode, and encode(verify=True) additionally decodes the
+block before returning it.
+"""
+
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import numpy.typing as npt
+from loguru import logger
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
+CODECS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+DEFAULT_LEVELS = {"none": 0, "zlib": 1, "zstd": 3, "lz4": 0}
+
+_BLOCK_HEADER = struct.Struct("<4sBBHIII")  # magic, version, codec, reserved, frames, words per frame, crc32
+_BLOCK_MAGIC = b"ITCB"
+_BLOCK_VERSION = 1
+_LENGTH = struct.Struct("<I")  # Length prefix of a block; 0 marks the raw tail of a partial record
+_RECORDING_FLAGS_OFFSET = 10  # Flags field of the recording header (after magic and version)
+
+
+def best_codec() -> str:
+    """Fastest good codec installed: zstd, then lz4, then zlib."""
+    if ZSTD_AVAILABLE:
+        return "zstd"
+    if LZ4_AVAILABLE:
+        return "lz4"
+    return "zlib"
+
+
+def _check_codec(codec: str) -> None:
+    if codec not in CODECS:
+        raise ValueError(f"Unknown codec '{codec}'. Available codecs: {list(CODECS)}")
+    if codec == "zstd" and not ZSTD_AVAILABLE:
+        raise ImportError("zstandard is required for the zstd codec. Please install it with: pip install zstandard")
+    if codec == "lz4" and not LZ4_AVAILABLE:
+        raise ImportError("lz4 is required for the lz4 codec. Please install it with: pip install lz4")
+
+
+def delta_encode(frames: npt.NDArray[np.uint16]) -> npt.NDArray[np.uint16]:
+    """Frame-to-frame delta with zigzag mapping of a (frames, words) uint16 array."""
+    delta = np.empty_like(frames)
+    delta[0] = frames[0]
+    np.subtract(frames[1:], frames[:-1], out=delta[1:])  # Wraps modulo 2**16
+    signed = delta.view(np.int16)
+    return ((signed << 1) ^ (signed >> 15)).view(np.uint16)
+
+
+def delta_decode(zigzag: npt.NDArray[np.uint16]) -> npt.NDArray[np.uint16]:
+    """Inverse of delta_encode()."""
+    delta = (zigzag >> 1) ^ (np.uint16(0) - (zigzag & np.uint16(1)))
+    return np.cumsum(delta, axis=0, dtype=np.uint16)
+
+
+@dataclass(frozen=True)
+class CompressionStats:
+    """Cumulative counters of a TactileCodec."""
+    blocks: int
+    frames: int
+    raw_bytes: int
+    compressed_bytes: int
+    encode_seconds: float
+
+    @property
+    def ratio(self) -> float:
+        """raw_bytes / compressed_bytes"""
+        return self.raw_bytes / self.compressed_bytes if self.compressed_bytes else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Encoded raw bytes per second"""
+        return self.raw_bytes / self.encode_seconds if self.encode_seconds else 0.0
+
+
+class TactileCodec:
+    """Encodes blocks of uint16 frames (e.g. compact tactile frames) into self-describing blobs.
+
+    Args:
+        codec: "zstd", "lz4", "zlib", "none" or "auto" (best installed)
+        level: Compression level, codec default if omitted
+    """
+
+    _logger = logger
+
+    def __init__(self, codec: str = "auto", level: Optional[int] = None):
+        self._codec = best_codec() if codec == "auto" else codec
+        _check_codec(self._codec)
+        self._level = DEFAULT_LEVELS[self._codec] if level is None else level
+        self._zstd_c = zstandard.ZstdCompressor(level=self._level) if self._codec == "zstd" else None
+        self._zstd_d = zstandard.ZstdDecompressor() if ZSTD_AVAILABLE else None
+        self.reset_stats()
+
+    @property
+    def codec(self) -> str:
+        return self._codec
+
+    def encode(self, frames: npt.NDArray, verify: bool = False) -> bytes:
+        """Compress a (frames, words) block.
+
+        Args:
+            frames: 2D array of 16-bit values (cast to uint16 if needed), frames along axis 0
+            verify: Decode the blob and compare before returning it
+
+        Returns:
+            bytes: Self-describing blob for decode()
+        """
+        start = time.perf_counter()
+        frames = np.ascontiguousarray(frames, dtype=np.uint16)
+        if frames.ndim != 2 or len(frames) == 0:
+            raise ValueError(f"Expected a non-empty (frames, words) array, got shape {frames.shape}")
+        shuffled = delta_encode(frames).view(np.uint8).reshape(-1, 2).T.tobytes()
+        header = _BLOCK_HEADER.pack(_BLOCK_MAGIC, _BLOCK_VERSION, CODECS[self._codec], 0,
+                                    frames.shape[0], frames.shape[1], zlib.crc32(frames))
+        blob = header + self._compress(shuffled)
+        self._encode_seconds += time.perf_counter() - start
+
+        if verify and not np.array_equal(self.decode(blob), frames):
+            raise RuntimeError("Compression round trip mismatch")
+
+        self._blocks += 1
+        self._frames += frames.shape[0]
+        self._raw_bytes += frames.nbytes
+        self._compressed_bytes += len(blob)
+        return blob
+
+    def decode(self, blob: bytes) -> npt.NDArray[np.uint16]:
+        """Decompress a blob from encode() into a (frames, words) uint16 array (CRC checked)."""
+        magic, version, codec_id, _, count, words, crc = _BLOCK_HEADER.unpack_from(blob)
+        if magic != _BLOCK_MAGIC or version != _BLOCK_VERSION:
+            raise ValueError("Not a tactile compression block")
+        codec = next((name for name, value in CODECS.items() if value == codec_id), None)
+        if codec is None:
+            raise ValueError(f"Unknown codec id {codec_id}")
+        _check_codec(codec)
+
+        payload = memoryview(blob)[_BLOCK_HEADER.size:]
+        shuffled = self._decompress(codec, payload, count * words * 2)
+        zigzag = np.frombuffer(shuffled, dtype=np.uint8).reshape(2, -1).T.copy().view(np.uint16)
+        frames = delta_decode(zigzag.reshape(count, words))
+        if zlib.crc32(frames) != crc:
+            raise ValueError("Compression block failed its CRC check")
+        return frames
+
+    def get_stats(self) -> CompressionStats:
+        """Cumulative ratio and encode throughput since the last reset."""
+        return CompressionStats(self._blocks, self._frames, self._raw_bytes,
+                                self._compressed_bytes, self._encode_seconds)
+
+    def reset_stats(self) -> None:
+        self._blocks = self._frames = self._raw_bytes = self._compressed_bytes = 0
+        self._encode_seconds = 0.0
+
+    def _compress(self, data: bytes) -> bytes:
+        if self._codec == "zstd":
+            return self._zstd_c.compress(data)
+        if self._codec == "lz4":
+            return lz4.frame.compress(data, compression_level=self._level)
+        if self._codec == "zlib":
+            return zlib.compress(data, self._level)
+        return data
+
+    def _decompress(self, codec: str, payload: memoryview, size: int) -> bytes:
+        # Output is bounded by the size given in the block header, so a corrupt block fails cleanly
+        if codec == "zstd":
+            # max_output_size only applies to frames without a content size, so check that first
+            if zstandard.frame_content_size(payload) not in (-1, size):
+                raise ValueError("Compression block is larger than its header states")
+            data = self._zstd_d.decompress(payload, max_output_size=size)
+        elif codec == "lz4":
+            decompressor = lz4.frame.LZ4FrameDecompressor()
+            data = decompressor.decompress(payload, max_length=size)
+            if not decompressor.eof:
+                raise ValueError("Compression block is truncated or larger than its header states")
+        elif codec == "zlib":
+            decompressor = zlib.decompressobj()
+            data = decompressor.decompress(payload, size)
+            if not decompressor.eof:
+                raise ValueError("Compression block is truncated or larger than its header states")
+        else:
+            data = bytes(payload)
+        if len(data) != size:
+            raise ValueError(f"Compression block decoded to {len(data)} bytes, expected {size}")
+        return data
+
+
+def compress_recording(src: Union[str, Path], dst: Union[str, Path], codec: str = "auto",
+                       block_frames: int = 1024, verify: bool = True) -> CompressionStats:
+    """Compress a SessionRecorder file block by block.
+
+    The header is kept with the compressed flag set; the records follow as
+    length-prefixed TactileCodec blobs, so decompress_recording() restores
+    the file byte for byte. Whole records (timestamps and joint state
+    included) are coded as rows of 16-bit words; a trailing partial record
+    (e.g. after a crash) is stored uncompressed after a zero length prefix.
+
+    Returns:
+        CompressionStats: Ratio and throughput of the record data
+    """
+    from inspire_demos.inspire_recording import HEADER_FLAG_COMPRESSED, open_recording, read_header
+
+    header_size, record_size, _ = read_header(src)
+    _, records = open_recording(src)
+    tail_offset = header_size + len(records) * record_size
+    words = np.frombuffer(records, dtype=np.uint16).reshape(len(records), record_size // 2)
+    tactile_codec = TactileCodec(codec)
+    with open(src, "rb") as f:
+        header = bytearray(f.read(header_size))
+        f.seek(tail_offset)
+        tail = f.read()
+    flags = struct.unpack_from("<H", header, _RECORDING_FLAGS_OFFSET)[0]
+    struct.pack_into("<H", header, _RECORDING_FLAGS_OFFSET, flags | HEADER_FLAG_COMPRESSED)
+    with open(dst, "wb") as out:
+        out.write(header)
+        for start in range(0, len(records), block_frames):
+            blob = tactile_codec.encode(words[start:start + block_frames], verify=verify)
+            out.write(_LENGTH.pack(len(blob)))
+            out.write(blob)
+        if tail:
+            logger.warning(f"{src} ends with a partial record of {len(tail)} bytes; stored uncompressed")
+            out.write(_LENGTH.pack(0))
+            out.write(tail)
+    return tactile_codec.get_stats()
+
+
+def decompress_recording(src: Union[str, Path], dst: Union[str, Path]) -> int:
+    """Restore a SessionRecorder file written by compress_recording().
+
+    Returns:
+        int: Number of whole records restored (a partial trailing record is restored too but not counted)
+    """
+    from inspire_demos.inspire_recording import HEADER_FLAG_COMPRESSED, is_compressed, read_header
+
+    if not is_compressed(src):
+        raise ValueError(f"{src} is not a compressed recording")
+    header_size, _, _ = read_header(src)
+    tactile_codec = TactileCodec("none")
+    count = 0
+    with open(src, "rb") as f, open(dst, "wb") as out:
+        header = bytearray(f.read(header_size))
+        flags = struct.unpack_from("<H", header, _RECORDING_FLAGS_OFFSET)[0]
+        struct.pack_into("<H", header, _RECORDING_FLAGS_OFFSET, flags & ~HEADER_FLAG_COMPRESSED)
+        out.write(header)
+        while True:
+            prefix = f.read(_LENGTH.size)
+            if not prefix:
+                break
+            (length,) = _LENGTH.unpack(prefix)
+            if length == 0:
+                out.write(f.read())  # Raw tail of a partial record
+                break
+            frames = tactile_codec.decode(f.read(length))
+            out.write(frames.tobytes())
+            count += len(frames)
+    return count
@@ -0,0 +1,300 @@
+"""
+Low-overhead diagnostic logging and frame capture for the transports.
+
+Diagnostics wraps loguru for one subsystem ("serial", "modbus",
+"modbus.tactile", "serial.validation", ...):
+
+- gated: a message below the subsystem level costs one cached integer
+  comparison; nothing is formatted or bound
+- lazy: messages are str.format templates with the values passed as
+  arguments, so formatting only happens for messages that are emitted
+- rate-limited: each message template has a token bucket; suppressed
+  repeats are counted and reported with the next emitted one
+- structured: keyword arguments are bound to the loguru record as extra fields
+  together with the subsystem name
+
+Levels are set per subsystem with set_log_level() and inherited along dotted
+names ("serial.validation" falls back to "serial", then to the root "").
+set_debug(True) on a hand lowers its own subsystems to DEBUG.
+
+FrameCapture keeps the last raw frames sent and received in a preallocated
+ring of fixed-size slots, so capturing costs one copy per frame and can stay
+on while a rig runs. Dump it to a file with dump() and read it back with
+FrameCapture.load().
+"""
+
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+import numpy as np
+from loguru import logger
+
+LEVELS = {"TRACE": 5, "DEBUG": 10, "INFO": 20, "SUCCESS": 25, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+DEFAULT_LEVEL = LEVELS["INFO"]
+DEFAULT_RATE = 10.0  # Sustained messages per second per template
+DEFAULT_BURST = 20  # Messages per template emitted before rate limiting starts
+
+_levels: Dict[str, int] = {"": DEFAULT_LEVEL}
+_levels_version = 0  # Bumped on every change so Diagnostics instances refresh their cached threshold
+_levels_lock = threading.Lock()
+
+
+def _level_number(level: Union[str, int]) -> int:
+    if isinstance(level, int):
+        return level
+    try:
+        return LEVELS[level.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown log level '{level}'. Available levels: {list(LEVELS)}") from None
+
+
+def set_log_level(subsystem: str, level: Union[str, int]) -> None:
+    """Set the minimum level of a subsystem and, unless overridden, its children.
+
+    Args:
+        subsystem: Dotted subsystem name, e.g. "modbus" or "serial.validation"; "" is the root
+        level: Level name ("DEBUG", "INFO", ...) or number
+    """
+    global _levels_version
+    with _levels_lock:
+        _levels[subsystem] = _level_number(level)
+        _levels_version += 1
+
+
+def get_log_level(subsystem: str) -> int:
+    """Effective minimum level of a subsystem (number)."""
+    name = subsystem
+    while True:
+        level = _levels.get(name)
+        if level is not None:
+            return level
+        if not name:
+            return DEFAULT_LEVEL
+        name = name.rpartition(".")[0]
+
+
+def reset_log_levels() -> None:
+    """Forget all per-subsystem levels."""
+    global _levels_version
+    with _levels_lock:
+        _levels.clear()
+        _levels[""] = DEFAULT_LEVEL
+        _levels_version += 1
+
+
+class Diagnostics:
+    """Gated, lazily formatted, rate-limited logger for one subsystem.
+
+    Args:
+        subsystem: Dotted subsystem name used for the level lookup and bound to every record
+        rate: Sustained messages per second per template, None disables rate limiting
+        burst: Messages per template allowed at once before rate limiting applies
+    """
+
+    _logger = logger
+
+    def __init__(self, subsystem: str, rate: Optional[float] = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        self.subsystem = subsystem
+        self._rate = rate
+        self._burst = burst
+        self._verbose = False
+        self._version = -1
+        self._threshold = DEFAULT_LEVEL
+        self._buckets: Dict[str, List[float]] = {}  # template -> [tokens, last refill, suppressed]
+        self._bucket_lock = threading.Lock()
+
+    @property
+    def verbose(self) -> bool:
+        return self._verbose
+
+    @verbose.setter
+    def verbose(self, verbose: bool) -> None:
+        """Emit DEBUG messages regardless of the subsystem level (set_debug() on the hands)."""
+        self._verbose = verbose
+        self._version = -1
+
+    def enabled(self, level: int) -> bool:
+        """Whether a message at level would be emitted (rate limiting aside)."""
+        if self._version != _levels_version:
+            self._refresh()
+        return level >= self._threshold
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Cheap gate for callers that would otherwise compute expensive arguments."""
+        if self._version != _levels_version:
+            self._refresh()
+        return self._threshold <= LEVELS["DEBUG"]
+
+    def trace(self, message: str, *args: Any, **fields: Any) -> None:
+        if self.enabled(5):
+            self._emit("TRACE", message, args, fields)
+
+    def debug(self, message: str, *args: Any, **fields: Any) -> None:
+        if self.enabled(10):
+            self._emit("DEBUG", message, args, fields)
+
+    def info(self, message: str, *args: Any, **fields: Any) -> None:
+        if self.enabled(20):
+            self._emit("INFO", message, args, fields)
+
+    def warning(self, message: str, *args: Any, **fields: Any) -> None:
+        if self.enabled(30):
+            self._emit("WARNING", message, args, fields)
+
+    def error(self, message: str, *args: Any, **fields: Any) -> None:
+        if self.enabled(40):
+            self._emit("ERROR", message, args, fields)
+
+    def get_suppressed(self) -> Dict[str, int]:
+        """Messages currently held back by rate limiting, per template."""
+        with self._bucket_lock:
+            return {template: int(bucket[2]) for template, bucket in self._buckets.items() if bucket[2]}
+
+    def _refresh(self) -> None:
+        self._version = _levels_version
+        level = get_log_level(self.subsystem)
+        self._threshold = min(level, LEVELS["DEBUG"]) if self._verbose else level
+
+    def _emit(self, level: str, message: str, args: tuple, fields: Dict[str, Any]) -> None:
+        suppressed = 0
+        if self._rate is not None:
+            now = time.monotonic()
+            with self._bucket_lock:
+                bucket = self._buckets.get(message)
+                if bucket is None:
+                    bucket = self._buckets[message] = [float(self._burst), now, 0]
+                else:
+                    bucket[0] = min(float(self._burst), bucket[0] + (now - bucket[1]) * self._rate)
+                    bucket[1] = now
+                if bucket[0] < 1.0:
+                    bucket[2] += 1
+                    return
+                bucket[0] -= 1.0
+                suppressed = int(bucket[2])
+                bucket[2] = 0
+
+        if suppressed:
+            message = f"{message} [{suppressed} similar messages suppressed]"
+        # depth=2 attributes the record to the caller of debug()/info()/...
+        self._logger.opt(depth=2).bind(subsystem=self.subsystem, **fields).log(level, message, *args)
+
+
+CAPTURE_TX = 0
+CAPTURE_RX = 1
+DEFAULT_SLOT_SIZE = 264  # Largest serial frame (5 + 255) or Modbus TCP ADU (260), rounded up
+
+_CAPTURE_HEADER = struct.Struct("<8sHHI")  # magic, version, slot size, frame count
+_CAPTURE_MAGIC = b"INSPCAP\0"
+_CAPTURE_VERSION = 1
+
+
+def _capture_dtype(slot_size: int) -> np.dtype:
+    return np.dtype([("timestamp", "<f8"), ("direction", "u1"), ("length", "<u2"), ("data", "u1", (slot_size,))])
+
+
+class CapturedFrame(NamedTuple):
+    """One captured frame; data is cut to the slot size when truncated is True."""
+    timestamp: float
+    direction: int  # CAPTURE_TX or CAPTURE_RX
+    data: bytes
+    truncated: bool
+
+    def hex(self) -> str:
+        arrow = ">>" if self.direction == CAPTURE_TX else "<<"
+        return f"{self.timestamp:.6f} {arrow} {self.data.hex(' ')}{' ...' if self.truncated else ''}"
+
+
+class FrameCapture:
+    """Ring buffer of the most recent raw frames in both directions.
+
+    Received data is captured as it arrives from the port or socket, so one
+    RX entry may hold part of a frame or several frames.
+
+    Args:
+        slots: Number of frames kept
+        slot_size: Bytes kept per frame; longer frames are truncated
+    """
+
+    def __init__(self, slots: int = 1024, slot_size: int = DEFAULT_SLOT_SIZE):
+        if slots < 1 or slot_size < 1:
+            raise ValueError(f"slots and slot_size must be >= 1, got {slots} and {slot_size}")
+        self._slot_size = slot_size
+        self._ring = np.zeros(slots, dtype=_capture_dtype(slot_size))
+        self._total = 0
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        """Frames captured since creation or clear(), including overwritten ones."""
+        return self._total
+
+    def __len__(self) -> int:
+        return min(self._total, len(self._ring))
+
+    def capture(self, direction: int, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Store a frame sent (CAPTURE_TX) or received (CAPTURE_RX)."""
+        size = len(data)
+        kept = min(size, self._slot_size)
+        with self._lock:
+            slot = self._ring[self._total % len(self._ring)]
+            slot["timestamp"] = time.time()
+            slot["direction"] = direction
+            slot["length"] = min(size, 0xFFFF)
+            slot["data"][:kept] = np.frombuffer(data, dtype=np.uint8, count=kept)
+            self._total += 1
+
+    def trace_packet(self, sending: bool, data: bytes) -> bytes:
+        """pymodbus trace_packet hook: capture and pass the packet through unchanged."""
+        self.capture(CAPTURE_TX if sending else CAPTURE_RX, data)
+        return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._total = 0
+
+    def records(self) -> np.ndarray:
+        """Captured slots in capture order (a copy)."""
+        with self._lock:
+            count = len(self)
+            start = self._total - count
+            order = np.arange(start, self._total) % len(self._ring)
+            return self._ring[order]
+
+    def frames(self, last: Optional[int] = None) -> List[CapturedFrame]:
+        """Captured frames oldest first, optionally only the last ones."""
+        return _to_frames(self.records()[-last:] if last else self.records(), self._slot_size)
+
+    def format(self, last: Optional[int] = None) -> str:
+        """Hex dump, one frame per line, ">>" for sent and "<<" for received."""
+        return "\n".join(frame.hex() for frame in self.frames(last))
+
+    def dump(self, path: Union[str, Path]) -> int:
+        """Write the captured frames to a binary file. Returns the number of frames written."""
+        records = self.records()
+        with open(path, "wb") as f:
+            f.write(_CAPTURE_HEADER.pack(_CAPTURE_MAGIC, _CAPTURE_VERSION, self._slot_size, len(records)))
+            f.write(records.tobytes())
+        return len(records)
+
+    @staticmethod
+    def load(path: Union[str, Path]) -> List[CapturedFrame]:
+        """Read the frames of a file written by dump()."""
+        with open(path, "rb") as f:
+            magic, version, slot_size, count = _CAPTURE_HEADER.unpack(f.read(_CAPTURE_HEADER.size))
+            if magic != _CAPTURE_MAGIC or version != _CAPTURE_VERSION:
+                raise ValueError(f"{path} is not a frame capture file")
+            records = np.frombuffer(f.read(), dtype=_capture_dtype(slot_size), count=count)
+        return _to_frames(records, slot_size)
+
+
+def _to_frames(records: np.ndarray, slot_size: int) -> List[CapturedFrame]:
+    return [
+        CapturedFrame(float(record["timestamp"]), int(record["direction"]),
+                      record["data"][:min(int(record["length"]), slot_size)].tobytes(),
+                      int(record["length"]) > slot_size)
+        for record in records
+    ]
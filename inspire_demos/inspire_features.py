@@ -0,0 +1,165 @@
+"""
+Vectorized tactile feature extraction.
+
+TactileFeatureEngine computes per-sensor features for all 17 tactile sensors
+in one pass over the flat tactile buffer. Per-taxel index maps (sensor start
+offsets, row and column coordinates) are precomputed once; every feature is a
+ufunc reduceat over those maps, so a frame costs a few dozen NumPy calls
+regardless of sensor count and batches of frames cost the same number.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from inspire_demos.inspire_tactile import (
+    COMPACT_RUNS,
+    TACTILE_SENSORS,
+    TACTILE_SPAN,
+    TACTILE_TAXELS,
+    TactileData,
+    TactileFrame,
+    compact_tactile,
+    sensor_layout,
+    sensor_view,
+)
+
+SENSOR_NAMES: Tuple[str, ...] = tuple(TACTILE_SENSORS)
+
+
+@dataclass(frozen=True)
+class TactileFeatures:
+    """Features of one frame (arrays of shape (17,)) or a batch ((frames, 17)).
+
+    The last axis follows SENSOR_NAMES; centroid and shear add a trailing
+    (row, col) axis.
+
+    Attributes:
+        total: Sum of all taxels
+        peak: Largest taxel
+        mean: total / number of taxels
+        centroid: Pressure-weighted (row, col) position in taxels; the sensor center when unloaded
+        area: Number of taxels at or above the contact threshold
+        shear: Centroid offset from the sensor center, normalized to -1..1 per axis.
+            A proxy for tangential load: shear shifts the contact patch
+        change: Sum of absolute taxel differences to the previous frame (0 for the first)
+    """
+    total: npt.NDArray[np.float64]
+    peak: npt.NDArray[np.float64]
+    mean: npt.NDArray[np.float64]
+    centroid: npt.NDArray[np.float64]
+    area: npt.NDArray[np.int64]
+    shear: npt.NDArray[np.float64]
+    change: npt.NDArray[np.float64]
+
+    def sensor(self, reg_name: str) -> Dict[str, npt.NDArray]:
+        """All features of one sensor, e.g. sensor("INDEX_TIP_TAC")["peak"]."""
+        i = SENSOR_NAMES.index(reg_name)
+        return {
+            "total": self.total[..., i],
+            "peak": self.peak[..., i],
+            "mean": self.mean[..., i],
+            "centroid": self.centroid[..., i, :],
+            "area": self.area[..., i],
+            "shear": self.shear[..., i, :],
+            "change": self.change[..., i],
+        }
+
+
+class TactileFeatureEngine:
+    """Computes TactileFeatures for single frames or batches.
+
+    compute() accepts a TactileFrame, a TactileData, or raw arrays whose last
+    axis is a sweep (TACTILE_SPAN registers) or a compact buffer
+    (TACTILE_TAXELS values). For single frames the previous frame is kept for
+    the change feature; within a batch, change is taken along axis 0.
+
+    Args:
+        contact_threshold: Raw taxel value counted as contact for the area feature
+    """
+
+    def __init__(self, contact_threshold: float = 50):
+        self._threshold = contact_threshold
+        # Sweep -> compact gather map
+        self._gather = np.concatenate([np.arange(start, end) for start, end, _ in COMPACT_RUNS])
+        self._starts = np.array([sensor_layout(name, compact=True)[0] for name in SENSOR_NAMES])
+
+        rows_coord = np.empty(TACTILE_TAXELS)
+        cols_coord = np.empty(TACTILE_TAXELS)
+        taxel_index = np.arange(TACTILE_TAXELS)
+        sizes, centers, half_extent = [], [], []
+        for name in SENSOR_NAMES:
+            index = sensor_view(taxel_index, name, compact=True)  # (rows, cols) of compact positions
+            rows, cols = index.shape
+            rows_coord[index] = np.arange(rows)[:, None]
+            cols_coord[index] = np.arange(cols)[None, :]
+            sizes.append(rows * cols)
+            centers.append(((rows - 1) / 2, (cols - 1) / 2))
+            half_extent.append((max((rows - 1) / 2, 1.0), max((cols - 1) / 2, 1.0)))
+        self._coords = np.stack([rows_coord, cols_coord])  # (2, taxels)
+        self._sizes = np.array(sizes, dtype=np.float64)
+        self._centers = np.array(centers)
+        self._half_extent = np.array(half_extent)
+        self._previous: Optional[npt.NDArray[np.float64]] = None
+
+    def reset(self) -> None:
+        """Forget the previous frame (the next change feature is 0)."""
+        self._previous = None
+
+    def compute(self, tactile: Union[TactileFrame, TactileData, npt.NDArray],
+                batch: bool = False) -> TactileFeatures:
+        """Compute the features of one frame, or of a batch if batch is True.
+
+        Args:
+            tactile: Frame source, see the class docstring. With batch=True an
+                array of shape (frames, TACTILE_SPAN or TACTILE_TAXELS)
+            batch: Treat axis 0 as frames; the engine's previous frame is not used or updated
+        """
+        taxels = self._taxels(tactile)
+        if batch and taxels.ndim != 2:
+            raise ValueError(f"Expected a (frames, taxels) batch, got shape {taxels.shape}")
+        if not batch and taxels.ndim != 1:
+            raise ValueError(f"Expected a single frame, got shape {taxels.shape}; use batch=True")
+
+        total = np.add.reduceat(taxels, self._starts, axis=-1)
+        peak = np.maximum.reduceat(taxels, self._starts, axis=-1)
+        area = np.add.reduceat(taxels >= self._threshold, self._starts, axis=-1, dtype=np.int64)
+
+        # First moments for both axes in one reduceat: (..., 2, 17)
+        moments = np.add.reduceat(taxels[..., None, :] * self._coords, self._starts, axis=-1)
+        loaded = total > 0
+        safe_total = np.where(loaded, total, 1.0)
+        centroid = np.where(loaded[..., None], np.swapaxes(moments, -1, -2) / safe_total[..., None], self._centers)
+        shear = (centroid - self._centers) / self._half_extent
+
+        if batch:
+            previous = np.concatenate([taxels[:1], taxels[:-1]])
+        else:
+            previous = taxels if self._previous is None else self._previous
+            self._previous = taxels
+        change = np.add.reduceat(np.abs(taxels - previous), self._starts, axis=-1)
+
+        return TactileFeatures(
+            total=total,
+            peak=peak,
+            mean=total / self._sizes,
+            centroid=centroid,
+            area=area,
+            shear=shear,
+            change=change,
+        )
+
+    def _taxels(self, tactile: Union[TactileFrame, TactileData, npt.NDArray]) -> npt.NDArray[np.float64]:
+        """Compact float64 taxels of any supported input."""
+        if isinstance(tactile, TactileFrame):
+            tactile = tactile.buffer
+        elif isinstance(tactile, TactileData):
+            return compact_tactile(tactile, np.empty(TACTILE_TAXELS))
+        tactile = np.asarray(tactile)
+        if tactile.shape[-1] == TACTILE_SPAN:
+            return tactile[..., self._gather].astype(np.float64)
+        if tactile.shape[-1] == TACTILE_TAXELS:
+            return tactile.astype(np.float64)
+        raise ValueError(f"Expected {TACTILE_SPAN} sweep registers or {TACTILE_TAXELS} compact taxels, got {tactile.shape[-1]}")
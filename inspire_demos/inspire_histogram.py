@@ -0,0 +1,192 @@
+"""
+HDR-style latency histogram.
+
+Values (integer nanoseconds) are counted in log-linear buckets: every power of
+two is split into the same number of linear sub-buckets, so each bucket is at
+most 10**-significant_figures of its value wide. Any value range is covered
+with bounded relative error and a fixed, small amount of work per record().
+Only occupied buckets are stored, so an idle histogram costs almost nothing.
+
+LatencyHistogram is not thread-safe; guard shared instances with a lock.
+"""
+
+import math
+from typing import Any, Dict, Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """Counts of non-negative integer values with bounded relative error.
+
+    Args:
+        significant_figures: Decimal digits kept per value (1-5)
+    """
+
+    def __init__(self, significant_figures: int = 3):
+        if not 1 <= significant_figures <= 5:
+            raise ValueError(f"significant_figures must be between 1 and 5, got {significant_figures}")
+        self._figures = significant_figures
+        # Enough linear sub-buckets per power of two for the requested precision
+        self._sub_bits = math.ceil(math.log2(2 * 10 ** significant_figures))
+        self._sub_count = 1 << self._sub_bits
+        self._half_count = self._sub_count >> 1
+        self.reset()
+
+    @property
+    def significant_figures(self) -> int:
+        return self._figures
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def min(self) -> int:
+        return self._min if self._count else 0
+
+    @property
+    def max(self) -> int:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._total / self._count if self._count else 0.0
+
+    @property
+    def stdev(self) -> float:
+        if self._count < 2:
+            return 0.0
+        mean = self.mean
+        return math.sqrt(max(self._total_sq / self._count - mean * mean, 0.0))
+
+    def reset(self) -> None:
+        self._counts: Dict[int, int] = {}
+        self._count = 0
+        self._min = 0
+        self._max = 0
+        self._total = 0
+        self._total_sq = 0
+
+    def record(self, value: int, count: int = 1) -> None:
+        """Count value (e.g. a perf_counter_ns() difference) count times."""
+        if value < 0:
+            raise ValueError(f"Histogram values must be >= 0, got {value}")
+        value = int(value)
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + count
+        if not self._count or value < self._min:
+            self._min = value
+        if value > self._max:
+            self._max = value
+        self._count += count
+        self._total += value * count
+        self._total_sq += value * value * count
+
+    def record_many(self, values: Iterable[int]) -> None:
+        """Count an array or iterable of values in one vectorized pass."""
+        values = np.asarray(values if isinstance(values, np.ndarray) else list(values), dtype=np.int64)
+        if values.size == 0:
+            return
+        if values.min() < 0:
+            raise ValueError("Histogram values must be >= 0")
+        shift = np.maximum(_bit_length(values) - self._sub_bits, 0)
+        indices = np.where(shift == 0, values, self._sub_count + (shift - 1) * self._half_count
+                           + (values >> shift) - self._half_count)
+        for index, count in zip(*np.unique(indices, return_counts=True)):
+            self._counts[int(index)] = self._counts.get(int(index), 0) + int(count)
+        low, high = int(values.min()), int(values.max())
+        if not self._count or low < self._min:
+            self._min = low
+        self._max = max(self._max, high)
+        self._count += int(values.size)
+        self._total += int(values.sum())
+        self._total_sq += int((values.astype(np.float64) ** 2).sum())
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the counts of another histogram with the same precision."""
+        if other._sub_bits != self._sub_bits:
+            raise ValueError("Cannot merge histograms with different significant_figures")
+        if not other._count:
+            return
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self._min = other._min if not self._count else min(self._min, other._min)
+        self._max = max(self._max, other._max)
+        self._count += other._count
+        self._total += other._total
+        self._total_sq += other._total_sq
+
+    def percentile(self, percentile: float) -> int:
+        """Value at or below which percentile % of the recorded values fall (0 when empty).
+
+        Like HdrHistogram, the highest value equivalent to the bucket is
+        reported, capped at the recorded maximum.
+        """
+        if not 0.0 <= percentile <= 100.0:
+            raise ValueError(f"percentile must be between 0 and 100, got {percentile}")
+        if not self._count:
+            return 0
+        rank = max(1, math.ceil(percentile / 100.0 * self._count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return max(min(self._highest_equivalent(index), self._max), self._min)
+        return self._max
+
+    def percentiles(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, int]:
+        """{"p50": ..., "p99.9": ...} for the given percentiles."""
+        return {f"p{p:g}": self.percentile(p) for p in percentiles}
+
+    def to_dict(self, buckets: bool = True) -> Dict[str, Any]:
+        """JSON-serializable summary, with the raw buckets for from_dict() if buckets is True."""
+        summary: Dict[str, Any] = {
+            "significant_figures": self._figures,
+            "count": self._count,
+            "min": self.min,
+            "max": self._max,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "percentiles": self.percentiles(),
+        }
+        if buckets:
+            summary["buckets"] = sorted([index, count] for index, count in self._counts.items())
+            summary["total"] = self._total
+            summary["total_sq"] = self._total_sq
+        return summary
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram from to_dict(buckets=True) output."""
+        if "buckets" not in data:
+            raise ValueError("Histogram summary has no buckets; export it with to_dict(buckets=True)")
+        histogram = cls(data["significant_figures"])
+        histogram._counts = {int(index): int(count) for index, count in data["buckets"]}
+        histogram._count = int(data["count"])
+        histogram._min = int(data["min"])
+        histogram._max = int(data["max"])
+        histogram._total = int(data["total"])
+        histogram._total_sq = int(data["total_sq"])
+        return histogram
+
+    def _index(self, value: int) -> int:
+        shift = value.bit_length() - self._sub_bits
+        if shift <= 0:
+            return value
+        return self._sub_count + (shift - 1) * self._half_count + (value >> shift) - self._half_count
+
+    def _highest_equivalent(self, index: int) -> int:
+        if index < self._sub_count:
+            return index
+        shift, offset = divmod(index - self._sub_count, self._half_count)
+        shift += 1
+        return ((offset + self._half_count + 1) << shift) - 1
+
+
+def _bit_length(values: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+    """int.bit_length() of each element of a non-negative int64 array (exact below 2**53)."""
+    return np.frexp(values.astype(np.float64))[1].astype(np.int64)
@@ -0,0 +1,236 @@
+"""
+Opt-in per-transaction latency instrumentation for both transports.
+
+Enable it with hand.enable_instrumentation(). Every register transaction then
+records how long it spent in each phase, grouped by register name and
+operation:
+
+- queue: waiting for the serial bus lock
+- encode: building the request frame
+- send: writing the request to the port or socket
+- wait: wire time plus device turnaround until the reply is complete
+- transfer: encode, send, wait and decode inside pymodbus (Modbus client calls)
+- decode: unpacking the reply payload into values
+- convert: NumPy conversion of decoded values (recorded per register)
+- total: whole transaction
+
+The transports only create Transaction objects while instrumentation is
+enabled; disabled, they use NULL_TRANSACTION, whose hooks do nothing. Export
+the counters and histograms with snapshot() or to_prometheus().
+"""
+
+import functools
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from inspire_demos.inspire_histogram import LatencyHistogram
+
+SNAPSHOT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+PROMETHEUS_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+
+@functools.lru_cache(maxsize=None)
+def _register_tables() -> Tuple[Dict[int, str], Dict[int, int]]:
+    """(address -> register name, tactile sensor address -> size in bytes)"""
+    # Imported here: the transports import this module for NULL_TRANSACTION
+    from inspire_demos.inspire_serial import regdict, regdict_gen4
+
+    names: Dict[int, str] = {}
+    sensor_bytes: Dict[int, int] = {}
+    for name, value in list(regdict.items()) + list(regdict_gen4.items()):
+        if isinstance(value, tuple):
+            address, (rows, cols) = value
+            sensor_bytes[address] = 2 * rows * cols
+        else:
+            address = value
+        names.setdefault(address, name)
+    return names, sensor_bytes
+
+
+@functools.lru_cache(maxsize=1024)
+def register_name(address: int, size: int = 0) -> str:
+    """Register name for a transaction at address covering size bytes.
+
+    Reads of the whole POS_ACT..TEMP window are reported as STATE_WINDOW and
+    multi-sensor reads of the tactile block as TACTILE.
+    """
+    from inspire_demos.inspire_serial import STATE_WINDOW_LEN, STATE_WINDOW_START
+    from inspire_demos.inspire_tactile import TACTILE_END, TACTILE_START
+
+    names, sensor_bytes = _register_tables()
+    if address == STATE_WINDOW_START and size >= STATE_WINDOW_LEN:
+        return "STATE_WINDOW"
+    if TACTILE_START <= address < TACTILE_END and size > sensor_bytes.get(address, 0):
+        return "TACTILE"
+    name = names.get(address)
+    return name if name is not None else str(address)
+
+
+class Transaction:
+    """Phase timer of one transaction, created by TransactionInstrumentation.begin().
+
+    mark(phase) adds the time since the previous mark (or begin) to phase, so
+    phases repeated in a loop (e.g. one wait per segment) accumulate.
+    """
+
+    __slots__ = ("_owner", "_key", "_start", "_last", "_phases")
+
+    def __init__(self, owner: "TransactionInstrumentation", key: Tuple[str, str]):
+        self._owner = owner
+        self._key = key
+        self._start = self._last = time.perf_counter_ns()
+        self._phases: Dict[str, int] = {}
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter_ns()
+        self._phases[phase] = self._phases.get(phase, 0) + now - self._last
+        self._last = now
+
+    def finish(self, ok: bool = True, size: int = 0) -> None:
+        """Record the transaction; size is the payload transferred in bytes."""
+        self._phases["total"] = time.perf_counter_ns() - self._start
+        self._owner._record(self._key, self._phases, ok, size)
+
+
+class _NullTransaction(Transaction):
+    """Stand-in for Transaction while instrumentation is disabled; every hook is a no-op."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        pass
+
+    def mark(self, phase: str) -> None:
+        pass
+
+    def finish(self, ok: bool = True, size: int = 0) -> None:
+        pass
+
+
+NULL_TRANSACTION = _NullTransaction()
+
+
+class _RegisterStats:
+    __slots__ = ("transactions", "errors", "bytes", "phases")
+
+    def __init__(self) -> None:
+        self.transactions = 0
+        self.errors = 0
+        self.bytes = 0
+        self.phases: Dict[str, LatencyHistogram] = {}
+
+
+class TransactionInstrumentation:
+    """Counters and per-phase latency histograms of register transactions.
+
+    One instance may be shared by several hands; it is thread-safe.
+
+    Args:
+        transport: Label for exports, e.g. "serial" or "modbus"
+        significant_figures: Histogram precision; 2 keeps per-phase memory small
+    """
+
+    def __init__(self, transport: str = "", significant_figures: int = 2):
+        self.transport = transport
+        self._figures = significant_figures
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], _RegisterStats] = {}
+        self._started = time.time()
+
+    def begin(self, operation: str, address: int, size: int = 0) -> Transaction:
+        """Start timing a transaction on the register at address (size in bytes)."""
+        return Transaction(self, (register_name(address, size), operation))
+
+    def record_phase(self, address: int, operation: str, phase: str, nanoseconds: int, size: int = 0) -> None:
+        """Add a phase measured outside a transaction, e.g. "convert" after the read returned."""
+        key = (register_name(address, size), operation)
+        with self._lock:
+            stats = self._stats.get(key) or self._stats.setdefault(key, _RegisterStats())
+            self._histogram(stats, phase).record(nanoseconds)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._started = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters and phase percentiles (nanoseconds) per register and operation."""
+        registers: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for (name, operation), stats in sorted(self._stats.items()):
+                registers.setdefault(name, {})[operation] = {
+                    "transactions": stats.transactions,
+                    "errors": stats.errors,
+                    "bytes": stats.bytes,
+                    "phases": {
+                        phase: {
+                            "count": histogram.count,
+                            "mean": histogram.mean,
+                            "max": histogram.max,
+                            **histogram.percentiles(SNAPSHOT_PERCENTILES),
+                        }
+                        for phase, histogram in stats.phases.items()
+                    },
+                }
+        return {"transport": self.transport, "since": self._started, "registers": registers}
+
+    def to_prometheus(self, prefix: str = "inspire_hand") -> str:
+        """Snapshot in the Prometheus text exposition format (phases as summaries in seconds)."""
+        transactions: List[str] = []
+        errors: List[str] = []
+        sizes: List[str] = []
+        phases: List[str] = []
+        with self._lock:
+            for (name, operation), stats in sorted(self._stats.items()):
+                labels = _labels(transport=self.transport, register=name, operation=operation)
+                transactions.append(f"{prefix}_transactions_total{{{labels}}} {stats.transactions}")
+                errors.append(f"{prefix}_transaction_errors_total{{{labels}}} {stats.errors}")
+                sizes.append(f"{prefix}_transaction_bytes_total{{{labels}}} {stats.bytes}")
+                for phase, histogram in stats.phases.items():
+                    phase_labels = f'{labels},phase="{_escape(phase)}"'
+                    for quantile in PROMETHEUS_QUANTILES:
+                        value = histogram.percentile(quantile * 100) / 1e9
+                        phases.append(f'{prefix}_phase_seconds{{{phase_labels},quantile="{quantile:g}"}} {value:.9f}')
+                    phases.append(f"{prefix}_phase_seconds_sum{{{phase_labels}}} {histogram.mean * histogram.count / 1e9:.9f}")
+                    phases.append(f"{prefix}_phase_seconds_count{{{phase_labels}}} {histogram.count}")
+
+        lines = [
+            f"# HELP {prefix}_transactions_total Register transactions.",
+            f"# TYPE {prefix}_transactions_total counter",
+            *transactions,
+            f"# HELP {prefix}_transaction_errors_total Failed register transactions.",
+            f"# TYPE {prefix}_transaction_errors_total counter",
+            *errors,
+            f"# HELP {prefix}_transaction_bytes_total Payload bytes transferred.",
+            f"# TYPE {prefix}_transaction_bytes_total counter",
+            *sizes,
+            f"# HELP {prefix}_phase_seconds Time spent per transaction phase.",
+            f"# TYPE {prefix}_phase_seconds summary",
+            *phases,
+        ]
+        return "\n".join(lines) + "\n"
+
+    def _record(self, key: Tuple[str, str], phases: Dict[str, int], ok: bool, size: int) -> None:
+        with self._lock:
+            stats = self._stats.get(key) or self._stats.setdefault(key, _RegisterStats())
+            stats.transactions += 1
+            stats.bytes += size
+            if not ok:
+                stats.errors += 1
+            for phase, nanoseconds in phases.items():
+                self._histogram(stats, phase).record(nanoseconds)
+
+    def _histogram(self, stats: _RegisterStats, phase: str) -> LatencyHistogram:
+        histogram = stats.phases.get(phase)
+        if histogram is None:
+            histogram = stats.phases[phase] = LatencyHistogram(self._figures)
+        return histogram
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Optional[str]) -> str:
+    return ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items() if value)
@@ -1,43 +1,48 @@
-from inspire_demos.inspire_serial import MODBUS_AVAILABLE, regdict, regdict_gen4
+from inspire_demos.inspire_diagnostics import CAPTURE_RX, CAPTURE_TX, Diagnostics, FrameCapture
+from inspire_demos.inspire_instrumentation import NULL_TRANSACTION
+from inspire_demos.inspire_serial import (
+    MODBUS_AVAILABLE,
+    REGISTER_STRIDE,
+    STATE_WINDOW_LEN,
+    STATE_WINDOW_START,
+    HandState,
+    decode_state_window,
+    encode_setpoints,
+    regdict,
+    regdict_gen4,
+)
+from inspire_demos.inspire_tactile import (
+    FingerSensorData,
+    ThumbSensorData,
+    TactileData,
+    TACTILE_SPAN,
+    TACTILE_START,
+    TactileFrame,
+    TactileSubscription,
+    empty_tactile_data,
+)
 from pymodbus.client import ModbusTcpClient
 
 import numpy as np
 import numpy.typing as npt
 from loguru import logger
+import socket
+import struct
 import time
-from dataclasses import dataclass
 
-from typing import List, Optional, Dict, Union, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Tuple, Union, Any
 
+if TYPE_CHECKING:
+    from inspire_demos.inspire_instrumentation import Transaction, TransactionInstrumentation
 
-@dataclass
-class FingerSensorData:
-    """Data class for individual finger sensor data."""
-    top: npt.NDArray[np.int32]
-    tip: npt.NDArray[np.int32]
-    base: npt.NDArray[np.int32]
+# Maximum registers that can be read in a single Modbus transaction
+MAX_REGISTERS_PER_READ = 125
+MODBUS_DEVICE_ID = 1  # Same default unit id pymodbus uses
+MBAP_HEADER = struct.Struct(">HHHB")  # transaction id, protocol id, length, unit id
+READ_REQUEST = struct.Struct(">HHHBBHH")  # MBAP header + function code, address, count
+FC_READ_HOLDING_REGISTERS = 0x03
 
 
-@dataclass
-class ThumbSensorData:
-    """Data class for thumb sensor data (includes mid sensor)."""
-    top: npt.NDArray[np.int32]
-    tip: npt.NDArray[np.int32]
-    mid: npt.NDArray[np.int32]
-    base: npt.NDArray[np.int32]
-
-
-@dataclass
-class TactileData:
-    """Data class for all tactile sensor data with timestamp."""
-    timestamp: float
-    pinky: FingerSensorData
-    ring: FingerSensorData
-    middle: FingerSensorData
-    index: FingerSensorData
-    thumb: ThumbSensorData
-    palm: npt.NDArray[np.int32]
-
 class InspireHandModbus:
     """Modbus TCP interface for Inspire Hand control"""
 
@@ -48,15 +53,30 @@ class InspireHandModbus:
     _generation: int  # 3 for Gen3, 4 for Gen4
     _debug: bool  # Enable debug output
     _connected: bool
+    _timeout: float  # Per-request timeout in seconds
+    _pipeline_depth: int  # Max. read transactions in flight, 1 disables pipelining
+    _tid: int
 
-    def __init__(self, ip: str = "192.168.11.210", port: int = 6000, generation: int = 3, debug: bool = False):
+    def __init__(self, ip: str = "192.168.11.210", port: int = 6000, generation: int = 3, debug: bool = False,
+                 timeout: float = 3.0, pipeline_depth: int = 1):
         if not MODBUS_AVAILABLE:
             raise ImportError("pymodbus is required for ModbusTCP communication. Please install it with: pip install pymodbus")
+        if pipeline_depth < 1:
+            raise ValueError(f"pipeline_depth must be >= 1, got {pipeline_depth}")
 
         self._ip = ip
         self._port = port
         self._generation = generation
         self._debug = debug
+        self._timeout = timeout
+        self._pipeline_depth = pipeline_depth
+        self._tid = 0
+        self._instrumentation = None  # TransactionInstrumentation while enabled
+        self._capture: Optional[FrameCapture] = None
+        self._diag = Diagnostics("modbus")
+        self._tactile_diag = Diagnostics("modbus.tactile")
+        self._validation_diag = Diagnostics("modbus.validation")
+        self._set_verbose(debug)
         # self._client = None
         self._connected = False
 
@@ -71,7 +91,12 @@ class InspireHandModbus:
     def connect(self) -> bool:
         """Connect to the Modbus TCP server"""
         try:
-            self._client = ModbusTcpClient(self._ip, port=self._port)
+            try:
+                self._client = ModbusTcpClient(self._ip, port=self._port, timeout=self._timeout,
+                                               trace_packet=self._trace_packet)
+            except TypeError:
+                # pymodbus without the trace_packet hook: frame capture only sees pipelined reads
+                self._client = ModbusTcpClient(self._ip, port=self._port, timeout=self._timeout)
             result = self._client.connect()
             self._connected = result
             if result:
@@ -119,26 +144,8 @@ class InspireHandModbus:
 
     def set_angle(self, angles: npt.NDArray[np.integer]) -> bool:
         """Set joint angles. Accepts numpy arrays only."""
-        if not isinstance(angles, np.ndarray):
-            raise TypeError("angles must be a numpy.ndarray")
-
-        # Ensure array is 1D and convert to list of integers for Modbus processing
-        angles_flat = angles.flatten().astype(np.int32)
-
-        if len(angles_flat) != 6:
-            raise ValueError(f"Expected 6 angle values, got {len(angles_flat)}")
-
-        angles_list = angles_flat.tolist()
-
-        # Convert to 16-bit values for Modbus (handle -1 as special case)
-        val_reg = []
-        for angle in angles_list:
-            if angle == -1:
-                val_reg.append(0xFFFF)  # Special placeholder value
-            else:
-                val_reg.append(angle & 0xFFFF)  # Take low 16 bits
-
-        return self._write_register(self._regdict["ANGLE_SET"], val_reg)
+        # -1 is sent as the 0xFFFF placeholder, other values keep their low 16 bits
+        return self._write_register(self._regdict["ANGLE_SET"], encode_setpoints(angles, "angles").tolist())
 
     def set_pos(self, positions: npt.NDArray[np.integer]) -> bool:
         """Set joint positions. Accepts numpy arrays only."""
@@ -150,64 +157,29 @@ class InspireHandModbus:
 
     def set_speed(self, speeds: npt.NDArray[np.integer]) -> bool:
         """Set joint speeds. Accepts numpy arrays only."""
-        if not isinstance(speeds, np.ndarray):
-            raise TypeError("speeds must be a numpy.ndarray")
-
-        # Ensure array is 1D and convert to list of integers for Modbus processing
-        speeds_flat = speeds.flatten().astype(np.int32)
-
-        if len(speeds_flat) != 6:
-            raise ValueError(f"Expected 6 speed values, got {len(speeds_flat)}")
-
-        speeds_list = speeds_flat.tolist()
-
-        # Convert to 16-bit values for Modbus
-        val_reg = []
-        for speed in speeds_list:
-            if speed == -1:
-                val_reg.append(0xFFFF)  # Special placeholder value
-            else:
-                val_reg.append(speed & 0xFFFF)  # Take low 16 bits
-
-        return self._write_register(self._regdict["SPEED_SET"], val_reg)
+        return self._write_register(self._regdict["SPEED_SET"], encode_setpoints(speeds, "speeds").tolist())
 
     def set_force(self, forces: npt.NDArray[np.integer]) -> bool:
         """Set joint forces. Accepts numpy arrays only."""
-        if not isinstance(forces, np.ndarray):
-            raise TypeError("forces must be a numpy.ndarray")
-
-        # Ensure array is 1D and convert to list of integers for Modbus processing
-        forces_flat = forces.flatten().astype(np.int32)
-
-        if len(forces_flat) != 6:
-            raise ValueError(f"Expected 6 force values, got {len(forces_flat)}")
-
-        forces_list = forces_flat.tolist()
-
-        # Convert to 16-bit values for Modbus
-        val_reg = []
-        for force in forces_list:
-            if force == -1:
-                val_reg.append(0xFFFF)  # Special placeholder value
-            else:
-                val_reg.append(force & 0xFFFF)  # Take low 16 bits
-
-        return self._write_register(self._regdict["FORCE_SET"], val_reg)
+        return self._write_register(self._regdict["FORCE_SET"], encode_setpoints(forces, "forces").tolist())
 
     def _write_register(self, address: int, values: List[int]) -> bool:
         """Write to Modbus registers"""
         if not self.is_connected():
-            self._logger.error("Modbus connection not established. Call connect() first.")
+            self._diag.error("Modbus connection not established. Call connect() first.")
             return False
 
+        tx = self._instrumentation.begin("write", address, 2 * len(values)) if self._instrumentation is not None else NULL_TRANSACTION
         try:
-            if self._debug:
-                self._logger.debug(f"Writing to register {address}: {values}")
+            self._diag.debug("Writing to register {}: {}", address, values)
 
             self._client.write_registers(address, values)
+            tx.mark("transfer")
+            tx.finish(True, 2 * len(values))
             return True
         except Exception as e:
-            self._logger.error(f"Failed to write to register {address}: {e}")
+            tx.finish(False)
+            self._diag.error("Failed to write to register {}: {}", address, e)
             return False
 
     def _read_register(self, address: int, count: int) -> List[int]:
@@ -228,37 +200,42 @@ class InspireHandModbus:
         Note:
             - Requires an active Modbus connection (call connect() first)
             - Automatically segments reads larger than 125 registers
+            - Segments are pipelined when pipeline_depth > 1
             - Provides debug logging when debug mode is enabled
             - Uses holding registers (function code 3)
         """
         if not self.is_connected():
-            self._logger.error("Modbus connection not established. Call connect() first.")
+            self._diag.error("Modbus connection not established. Call connect() first.")
             return []
 
-        # Maximum registers that can be read in a single Modbus transaction
-        MAX_REGISTERS_PER_READ = 125
-        
+        tx = NULL_TRANSACTION
         try:
             if count <= MAX_REGISTERS_PER_READ:
                 # Single read for small requests
-                if self._debug:
-                    self._logger.debug(f"Reading {count} registers from address {address}")
+                self._diag.debug("Reading {} registers from address {}", count, address)
 
+                tx = self._instrumentation.begin("read", address, 2 * count) if self._instrumentation is not None else NULL_TRANSACTION
                 response = self._client.read_holding_registers(address, count=count)
+                tx.mark("transfer")
                 if response.isError():
-                    self._logger.error(f"Modbus read error from address {address}")
+                    tx.finish(False)
+                    self._diag.error("Modbus read error from address {}", address)
                     return []
 
                 result = response.registers
-                if self._debug:
-                    self._logger.debug(f"Read {len(result)} values from register {address}: {result}")
+                tx.mark("decode")
+                tx.finish(True, 2 * count)
+                self._diag.debug("Read {} values from register {}: {}", len(result), address, result)
 
                 return result
+            elif self._pipeline_depth > 1:
+                result = self._read_pipelined(address, count)
+                return result.tolist() if result is not None else []
             else:
                 # Segmented read for large requests
-                if self._debug:
-                    self._logger.debug(f"Reading {count} registers from address {address} in segments (max {MAX_REGISTERS_PER_READ} per segment)")
+                self._diag.debug("Reading {} registers from address {} in segments (max {} per segment)", count, address, MAX_REGISTERS_PER_READ)
 
+                tx = self._instrumentation.begin("read", address, 2 * count) if self._instrumentation is not None else NULL_TRANSACTION
                 all_results = []
                 remaining_count = count
                 current_address = address
@@ -267,30 +244,249 @@ class InspireHandModbus:
                     # Determine how many registers to read in this segment
                     segment_count = min(remaining_count, MAX_REGISTERS_PER_READ)
                     
-                    if self._debug:
-                        self._logger.debug(f"Reading segment: {segment_count} registers from address {current_address}")
+                    self._diag.debug("Reading segment: {} registers from address {}", segment_count, current_address)
 
                     response = self._client.read_holding_registers(current_address, count=segment_count)
+                    tx.mark("transfer")
                     if response.isError():
-                        self._logger.error(f"Modbus read error from address {current_address} (segment)")
+                        tx.finish(False)
+                        self._diag.error("Modbus read error from address {} (segment)", current_address)
                         return []
 
                     segment_results = response.registers
                     all_results.extend(segment_results)
+                    tx.mark("decode")
                     
                     # Update for next segment
                     remaining_count -= segment_count
-                    current_address += segment_count
+                    current_address += segment_count * REGISTER_STRIDE
 
-                if self._debug:
-                    self._logger.debug(f"Completed segmented read: {len(all_results)} total values from address {address}")
+                tx.finish(True, 2 * count)
+                self._diag.debug("Completed segmented read: {} total values from address {}", len(all_results), address)
 
                 return all_results
 
         except Exception as e:
-            self._logger.error(f"Failed to read from register {address}: {e}")
+            tx.finish(False)
+            self._diag.error("Failed to read from register {}: {}", address, e)
             return []
 
+    def _next_tid(self) -> int:
+        self._tid = (self._tid + 1) & 0xFFFF
+        return self._tid
+
+    def _read_into(self, address: int, out: npt.NDArray) -> bool:
+        """Read len(out) registers starting at address straight into out.
+
+        Same segmentation and pipelining as _read_register(), but the values are
+        written into the caller's array instead of a new list.
+
+        Returns:
+            bool: True if every register was read, False otherwise (out is then partly stale)
+        """
+        if not self.is_connected():
+            self._diag.error("Modbus connection not established. Call connect() first.")
+            return False
+
+        count = len(out)
+        if count > MAX_REGISTERS_PER_READ and self._pipeline_depth > 1:
+            return self._read_pipelined(address, count, out) is not None
+
+        tx = self._instrumentation.begin("read", address, 2 * count) if self._instrumentation is not None else NULL_TRANSACTION
+        try:
+            for offset in range(0, count, MAX_REGISTERS_PER_READ):
+                segment_count = min(count - offset, MAX_REGISTERS_PER_READ)
+                segment_address = address + offset * REGISTER_STRIDE
+                response = self._client.read_holding_registers(segment_address, count=segment_count)
+                tx.mark("transfer")
+                if response.isError():
+                    tx.finish(False)
+                    self._diag.error("Modbus read error from address {}", segment_address)
+                    return False
+                out[offset:offset + segment_count] = response.registers
+                tx.mark("decode")
+            tx.finish(True, 2 * count)
+            return True
+        except Exception as e:
+            tx.finish(False)
+            self._diag.error("Failed to read from register {}: {}", address, e)
+            return False
+
+    def _read_pipelined(self, address: int, count: int,
+                        out: Optional[npt.NDArray] = None) -> Optional[npt.NDArray]:
+        """Read a large register range keeping up to pipeline_depth requests in flight.
+
+        Args:
+            out: Array of length count to fill in place; a new uint16 array is used if omitted
+
+        Returns:
+            The filled array, or None if the read failed
+        """
+        result = np.empty(count, dtype=np.uint16) if out is None else out
+        segments = []
+        for offset in range(0, count, MAX_REGISTERS_PER_READ):
+            segment_count = min(MAX_REGISTERS_PER_READ, count - offset)
+            segments.append((address + offset * REGISTER_STRIDE, result[offset:offset + segment_count]))
+
+        self._diag.debug("Reading {} registers from address {} in {} pipelined segments (depth {})",
+                         count, address, len(segments), self._pipeline_depth)
+
+        if not self._read_segments(segments):
+            return None
+
+        self._diag.debug("Completed pipelined read: {} total values from address {}", count, address)
+
+        return result
+
+    def _read_segments(self, segments: List[Tuple[int, npt.NDArray]]) -> bool:
+        """Read (address, destination) segments of up to 125 registers, pipelined.
+
+        Requests are written straight to the client socket as raw Modbus TCP
+        frames and replies are matched back to their segment by transaction id,
+        so reading many segments costs roughly one round trip instead of one per
+        segment. Each reply is written into its destination view.
+
+        Returns:
+            bool: True if every segment was read
+        """
+        if self._instrumentation is None:
+            return self._transfer_segments(segments)
+        size = 2 * sum(len(destination) for _, destination in segments)
+        tx = self._instrumentation.begin("read", segments[0][0], size)
+        ok = self._transfer_segments(segments, tx)
+        tx.finish(ok, size if ok else 0)
+        return ok
+
+    def _transfer_segments(self, segments: List[Tuple[int, npt.NDArray]], tx: "Transaction" = NULL_TRANSACTION) -> bool:
+        sock = getattr(self._client, "socket", None)
+        if sock is None:
+            self._diag.error("Modbus socket not available for pipelined read")
+            return False
+
+        pending: Dict[int, tuple] = {}
+        next_segment = 0
+        done = 0
+        rx = bytearray()
+        deadline = time.monotonic() + self._timeout
+        client_timeout = sock.gettimeout()  # The socket belongs to pymodbus; restored below
+
+        try:
+            while done < len(segments):
+                # Top up the pipeline with as many requests as allowed in one write
+                burst = bytearray()
+                while next_segment < len(segments) and len(pending) < self._pipeline_depth:
+                    segment_address, destination = segments[next_segment]
+                    tid = self._next_tid()
+                    burst += READ_REQUEST.pack(tid, 0, 6, MODBUS_DEVICE_ID, FC_READ_HOLDING_REGISTERS,
+                                               segment_address, len(destination))
+                    pending[tid] = segments[next_segment]
+                    next_segment += 1
+                tx.mark("encode")
+                if burst:
+                    sock.sendall(burst)
+                    if self._capture is not None:
+                        self._capture.capture(CAPTURE_TX, burst)
+                    tx.mark("send")
+
+                # Consume every complete reply already buffered
+                while len(rx) >= MBAP_HEADER.size:
+                    tid, _, length, _ = MBAP_HEADER.unpack_from(rx)
+                    end = MBAP_HEADER.size - 1 + length
+                    if len(rx) < end:
+                        break
+                    function_code = rx[MBAP_HEADER.size]
+                    segment = pending.pop(tid, None)
+                    if segment is None:
+                        self._diag.debug("Discarding reply with unknown transaction id {}", tid)
+                    elif function_code & 0x80:
+                        self._diag.error("Modbus read error from address {} (exception code {})", segment[0], rx[MBAP_HEADER.size + 1])
+                        self._abort_pipeline()
+                        return False
+                    else:
+                        segment_address, destination = segment
+                        data = rx[MBAP_HEADER.size + 2:end]
+                        if len(data) != len(destination) * 2:
+                            self._diag.error("Short reply for address {}: expected {} bytes, got {}", segment_address, len(destination) * 2, len(data))
+                            self._abort_pipeline()
+                            return False
+                        destination[:] = np.frombuffer(data, dtype=">u2")
+                        done += 1
+                    del rx[:end]
+                tx.mark("decode")
+
+                if done == len(segments):
+                    break
+                if not pending and next_segment < len(segments):
+                    continue
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._diag.error("Timed out waiting for pipelined read from address {} ({} replies outstanding)", segments[0][0], len(pending))
+                    self._abort_pipeline()
+                    return False
+                sock.settimeout(remaining)
+                chunk = sock.recv(65536)
+                tx.mark("wait")
+                if self._capture is not None and chunk:
+                    self._capture.capture(CAPTURE_RX, chunk)
+                if not chunk:
+                    self._diag.error("Modbus connection closed during pipelined read")
+                    self._abort_pipeline()
+                    return False
+                rx += chunk
+        except (OSError, socket.timeout) as e:
+            self._diag.error("Pipelined read from address {} failed: {}", segments[0][0], e)
+            self._abort_pipeline()
+            return False
+        finally:
+            try:
+                sock.settimeout(client_timeout)
+            except OSError:
+                pass  # Already closed by _abort_pipeline()
+
+        return True
+
+    def _abort_pipeline(self) -> None:
+        """Reconnect so replies still in flight cannot be mistaken for later ones."""
+        try:
+            self._client.close()
+            self._connected = self._client.connect()
+        except Exception as e:
+            self._logger.error(f"Failed to reconnect after aborted pipelined read: {e}")
+            self._connected = False
+
+    def enable_instrumentation(self, instrumentation: Optional["TransactionInstrumentation"] = None) -> "TransactionInstrumentation":
+        """Record per-transaction phase timings (transfer, decode, convert; encode/send/wait when pipelined).
+
+        Args:
+            instrumentation: Collector to record into, e.g. one shared by several hands; a new one if omitted
+
+        Returns:
+            TransactionInstrumentation: The active collector, see snapshot() and to_prometheus()
+        """
+        from inspire_demos.inspire_instrumentation import TransactionInstrumentation
+
+        self._instrumentation = instrumentation or TransactionInstrumentation("modbus")
+        return self._instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """Stop recording transaction timings"""
+        self._instrumentation = None
+
+    def get_instrumentation(self) -> Optional["TransactionInstrumentation"]:
+        """Get the active TransactionInstrumentation, or None while disabled"""
+        return self._instrumentation
+
+    def get_pipeline_depth(self) -> int:
+        """Get the number of read transactions kept in flight"""
+        return self._pipeline_depth
+
+    def set_pipeline_depth(self, depth: int) -> None:
+        """Set the number of read transactions kept in flight (1 disables pipelining)"""
+        if depth < 1:
+            raise ValueError(f"pipeline_depth must be >= 1, got {depth}")
+        self._pipeline_depth = depth
+
     def _read6_16bit(self, reg_name: str) -> List[int]:
         """Read 6 16-bit values from a named register"""
         if reg_name not in self._regdict:
@@ -299,12 +495,13 @@ class InspireHandModbus:
         val = self._read_register(self._regdict[reg_name], 6)
 
         if len(val) < 6:
-            if self._debug:
-                self._logger.warning(f"Failed to fetch 6 values from {reg_name}")
+            self._diag.debug("Failed to fetch 6 values from {}", reg_name)
             return []
+        if self._instrumentation is not None:
+            # pymodbus already decoded the words; recorded so every register has a convert phase on both transports
+            self._instrumentation.record_phase(self._regdict[reg_name], "read", "convert", 0, 12)
 
-        if self._debug:
-            self._logger.info(f"Read {reg_name}: {' '.join(map(str, val))}")
+        self._diag.debug("Read {}: {}", reg_name, val)
 
         return val
 
@@ -316,20 +513,21 @@ class InspireHandModbus:
         val_act = self._read_register(self._regdict[reg_name], 3)
 
         if len(val_act) < 3:
-            if self._debug:
-                self._logger.warning(f"Failed to fetch data from {reg_name}")
+            self._diag.debug("Failed to fetch data from {}", reg_name)
             return []
 
         # Split each 16-bit register into high and low bytes
+        start = time.perf_counter_ns() if self._instrumentation is not None else 0
         results = []
         for val in val_act:
             low_byte = val & 0xFF            # Low 8 bits
             high_byte = (val >> 8) & 0xFF    # High 8 bits
             results.append(low_byte)
             results.append(high_byte)
+        if self._instrumentation is not None:
+            self._instrumentation.record_phase(self._regdict[reg_name], "read", "convert", time.perf_counter_ns() - start, 6)
 
-        if self._debug:
-            self._logger.info(f"Read {reg_name}: {' '.join(map(str, results))}")
+        self._diag.debug("Read {}: {}", reg_name, results)
 
         return results
 
@@ -387,6 +585,29 @@ class InspireHandModbus:
         """Get current position as numpy array (alias for get_pos_actual)."""
         return self.get_pos_actual()
 
+    def read_state(self) -> Optional[HandState]:
+        """Read position, angle, force, current, error, status and temperature in one pass.
+
+        The whole POS_ACT..TEMP window (45 registers from 1534) is fetched in a
+        single transaction instead of one round trip per getter.
+
+        Returns:
+            HandState: Decoded snapshot, or None if the read failed
+        """
+        timestamp = time.time()
+        count = STATE_WINDOW_LEN // 2
+        raw = self._read_register(STATE_WINDOW_START, count)
+        if len(raw) < count:
+            self._diag.debug("Failed to read state window")
+            return None
+        # Registers carry two consecutive bytes each, low byte first
+        if self._instrumentation is None:
+            return decode_state_window(np.asarray(raw, dtype="<u2").tobytes(), timestamp)
+        start = time.perf_counter_ns()
+        state = decode_state_window(np.asarray(raw, dtype="<u2").tobytes(), timestamp)
+        self._instrumentation.record_phase(STATE_WINDOW_START, "read", "convert", time.perf_counter_ns() - start, STATE_WINDOW_LEN)
+        return state
+
     def set_action_sequence(self, sequence_id: int) -> bool:
         """Set the action sequence ID"""
         return self._write_register(self._regdict["ACTION_SEQ_INDEX"], [sequence_id])
@@ -401,102 +622,56 @@ class InspireHandModbus:
         Returns:
             TactileData: Structured object containing all tactile sensor data with timestamp
         """
+        frame = TactileFrame()
+        if not self.read_into(frame):
+            return empty_tactile_data(frame.timestamp)
+        return frame.data
+
+    def read_into(self, frame: TactileFrame, subscription: Optional[TactileSubscription] = None) -> bool:
+        """Refill a TactileFrame in place with a full tactile sweep.
+
+        The sensors sit in one contiguous register block; it is swept in
+        maximally packed segments straight into frame.buffer, so the sensor
+        views in frame.data update without any new NumPy arrays. With
+        pipeline_depth=1 the reads go through pymodbus, which still builds a
+        response object and a list of registers per segment.
+
+        Args:
+            frame: Frame to refill; reuse the same one on every poll
+            subscription: Refresh only these sensors, using the subscription's
+                precomputed reads; the other sensors keep their previous values
+
+        Returns:
+            bool: True on success. On failure frame.valid is False and the old values are partly overwritten.
+        """
         if self._generation != 4:
             self._logger.error("Tactile sensors are only available in Gen 4 hardware")
             raise NotImplementedError("Tactile sensors are only available in Gen 4 hardware")
-        
-        # Get current timestamp
-        timestamp = time.time()
-        
-        tactile_sensors = {
-            "PINKY_TOP_TAC": ("pinky", "top"),
-            "PINKY_TIP_TAC": ("pinky", "tip"), 
-            "PINKY_BASE_TAC": ("pinky", "base"),
-            "RING_TOP_TAC": ("ring", "top"),
-            "RING_TIP_TAC": ("ring", "tip"),
-            "RING_BASE_TAC": ("ring", "base"), 
-            "MIDDLE_TOP_TAC": ("middle", "top"),
-            "MIDDLE_TIP_TAC": ("middle", "tip"),
-            "MIDDLE_BASE_TAC": ("middle", "base"),
-            "INDEX_TOP_TAC": ("index", "top"),
-            "INDEX_TIP_TAC": ("index", "tip"),
-            "INDEX_BASE_TAC": ("index", "base"),
-            "THUMB_TOP_TAC": ("thumb", "top"),
-            "THUMB_TIP_TAC": ("thumb", "tip"),
-            "THUMB_MID_TAC": ("thumb", "mid"),
-            "THUMB_BASE_TAC": ("thumb", "base"),
-            "PALM_TAC": ("palm", None)
-        }
-        
-        # Initialize data storage for building the data class
-        sensor_data = {}
-        palm_data = None
-        
-        for reg_name, (finger, position) in tactile_sensors.items():
-            if reg_name not in self._regdict:
-                self._logger.warning(f"Tactile sensor register '{reg_name}' not found")
-                continue
-                
-            address, shape = self._regdict[reg_name]
-            rows, cols = shape
-            total_elements = rows * cols
-            
-            # Read raw 16-bit values from Modbus registers
-            raw_data = self._read_register(address, total_elements)
-            
-            if len(raw_data) != total_elements:
-                self._logger.error(f"Failed to read complete tactile data for {finger}_{position}: expected {total_elements}, got {len(raw_data)}")
-                continue
-            
-            # Convert to numpy array of int32 (16-bit values in little-endian are already handled by pymodbus)
-            data_array = np.array(raw_data, dtype=np.int32)
-            
-            if finger == "palm":
-                # Palm: Custom mapping - data points fill column by column from bottom to top
-                # Data point 1 -> row 8, col 1; Data point 2 -> row 7, col 1; etc.
-                matrix = data_array.reshape(cols, rows, order='C')  # Reshape as (cols, rows) first
-                palm_data = matrix.T  # Transpose to get correct orientation
-            else:
-                # Fingers: row-first ordering (data fills row by row, left to right)
-                # Data point 1 -> row 1, col 1; Data point 2 -> row 1, col 2; etc.
-                matrix = data_array.reshape(rows, cols, order='C')  # Row-major (C-style)
-                
-                if finger not in sensor_data:
-                    sensor_data[finger] = {}
-                sensor_data[finger][position] = matrix
-            
-            if self._debug:
-                sensor_name = f"{finger}_{position}" if position else finger
-                self._logger.debug(f"Read {sensor_name} tactile data: {shape} matrix from address {address}")
-        
-        # Create structured finger data objects
-        finger_objects = {}
-        for finger_name in ['pinky', 'ring', 'middle', 'index']:
-            if finger_name in sensor_data:
-                finger_objects[finger_name] = FingerSensorData(
-                    top=sensor_data[finger_name].get('top', np.array([], dtype=np.int32)),
-                    tip=sensor_data[finger_name].get('tip', np.array([], dtype=np.int32)),
-                    base=sensor_data[finger_name].get('base', np.array([], dtype=np.int32))
-                )
-        
-        # Create thumb data object (includes mid sensor)
-        thumb_data = ThumbSensorData(
-            top=sensor_data.get('thumb', {}).get('top', np.array([], dtype=np.int32)),
-            tip=sensor_data.get('thumb', {}).get('tip', np.array([], dtype=np.int32)),
-            mid=sensor_data.get('thumb', {}).get('mid', np.array([], dtype=np.int32)),
-            base=sensor_data.get('thumb', {}).get('base', np.array([], dtype=np.int32))
-        )
-        
-        # Create and return the structured TactileData object
-        return TactileData(
-            timestamp=timestamp,
-            pinky=finger_objects.get('pinky', FingerSensorData(np.array([], dtype=np.int32), np.array([], dtype=np.int32), np.array([], dtype=np.int32))),
-            ring=finger_objects.get('ring', FingerSensorData(np.array([], dtype=np.int32), np.array([], dtype=np.int32), np.array([], dtype=np.int32))),
-            middle=finger_objects.get('middle', FingerSensorData(np.array([], dtype=np.int32), np.array([], dtype=np.int32), np.array([], dtype=np.int32))),
-            index=finger_objects.get('index', FingerSensorData(np.array([], dtype=np.int32), np.array([], dtype=np.int32), np.array([], dtype=np.int32))),
-            thumb=thumb_data,
-            palm=palm_data if palm_data is not None else np.array([], dtype=np.int32)
-        )
+
+        frame.data.timestamp = time.time()
+        if subscription is None:
+            frame.valid = self._read_into(TACTILE_START, frame.buffer)
+        else:
+            frame.valid = self._read_subscription(subscription, frame.buffer)
+        if not frame.valid:
+            self._tactile_diag.error("Failed to read complete tactile data from address {}", TACTILE_START)
+            return False
+
+        frame.sequence += 1
+        if self._tactile_diag.debug_enabled:
+            registers = TACTILE_SPAN if subscription is None else subscription.registers
+            self._tactile_diag.debug("Read tactile sweep: {} registers from address {}", registers, TACTILE_START)
+        return True
+
+    def _read_subscription(self, subscription: TactileSubscription, buffer: npt.NDArray) -> bool:
+        segments = [(TACTILE_START + offset * REGISTER_STRIDE, buffer[offset:offset + count])
+                    for offset, count in subscription.segments]
+        if len(segments) > 1 and self._pipeline_depth > 1:
+            if not self.is_connected():
+                self._diag.error("Modbus connection not established. Call connect() first.")
+                return False
+            return self._read_segments(segments)
+        return all(self._read_into(address, destination) for address, destination in segments)
 
     def get_tactile_data(self, finger: str, position: str = '') -> npt.NDArray[np.int32]:
         """Get tactile data for a single sensor.
@@ -525,7 +700,7 @@ class InspireHandModbus:
             
             raw_data = self._read_register(address, total_elements)
             if len(raw_data) != total_elements:
-                self._logger.error(f"Failed to read complete palm tactile data: expected {total_elements}, got {len(raw_data)}")
+                self._tactile_diag.error("Failed to read complete palm tactile data: expected {}, got {}", total_elements, len(raw_data))
                 return np.array([], dtype=np.int32)
             
             data_array = np.array(raw_data, dtype=np.int32)
@@ -562,15 +737,14 @@ class InspireHandModbus:
         
         raw_data = self._read_register(address, total_elements)
         if len(raw_data) != total_elements:
-            self._logger.error(f"Failed to read complete tactile data for {finger}_{position}: expected {total_elements}, got {len(raw_data)}")
+            self._tactile_diag.error("Failed to read complete tactile data for {}_{}: expected {}, got {}", finger, position, total_elements, len(raw_data))
             return np.array([], dtype=np.int32)
         
         data_array = np.array(raw_data, dtype=np.int32)
         # Fingers: row-first ordering (data fills row by row, left to right)
         matrix = data_array.reshape(rows, cols, order='C')  # Row-major (C-style)
         
-        if self._debug:
-            self._logger.debug(f"Read {finger}_{position} tactile data: {shape} matrix from address {address}")
+        self._tactile_diag.debug("Read {}_{} tactile data: {} matrix from address {}", finger, position, shape, address)
         
         return matrix
 
@@ -587,8 +761,39 @@ class InspireHandModbus:
         return self._port
 
     def set_debug(self, debug: bool) -> None:
-        """Enable or disable debug output"""
+        """Enable or disable debug output (DEBUG level for this hand's diagnostics)"""
         self._debug = debug
+        self._set_verbose(debug)
+
+    def _set_verbose(self, verbose: bool) -> None:
+        self._diag.verbose = self._tactile_diag.verbose = self._validation_diag.verbose = verbose
+
+    def enable_frame_capture(self, capture: Optional[FrameCapture] = None, slots: int = 1024) -> FrameCapture:
+        """Keep the raw Modbus TCP frames sent and received in a ring buffer.
+
+        Args:
+            capture: Ring to record into, e.g. one shared by several hands; a new one with slots entries if omitted
+
+        Returns:
+            FrameCapture: The active ring, see frames(), format() and dump()
+        """
+        self._capture = capture or FrameCapture(slots)
+        return self._capture
+
+    def disable_frame_capture(self) -> None:
+        """Stop capturing frames"""
+        self._capture = None
+
+    def get_frame_capture(self) -> Optional[FrameCapture]:
+        """Get the active FrameCapture, or None while disabled"""
+        return self._capture
+
+    def _trace_packet(self, sending: bool, data: bytes) -> bytes:
+        """pymodbus trace_packet hook: forward packets to the frame capture while it is enabled."""
+        capture = self._capture
+        if capture is not None:
+            capture.capture(CAPTURE_TX if sending else CAPTURE_RX, data)
+        return data
 
     def validate_register_addresses(self) -> dict[str, bool]:
         """
@@ -608,12 +813,12 @@ class InspireHandModbus:
             "ERROR", "STATUS", "TEMP"
         ]
 
-        self._logger.info("Validating register addresses for hardware compatibility...")
+        self._validation_diag.info("Validating register addresses for hardware compatibility...")
 
         for reg_name in test_registers:
             if reg_name not in self._regdict:
                 validation_results[reg_name] = False
-                self._logger.warning(f"Register '{reg_name}' not found in generation {self._generation} dictionary")
+                self._validation_diag.warning("Register '{}' not found in generation {} dictionary", reg_name, self._generation)
                 continue
 
             try:
@@ -626,20 +831,20 @@ class InspireHandModbus:
                 validation_results[reg_name] = len(result) > 0
 
                 if validation_results[reg_name]:
-                    self._logger.debug(f"✓ Register '{reg_name}' (addr: {self._regdict[reg_name]}) is readable")
+                    self._validation_diag.debug("✓ Register '{}' (addr: {}) is readable", reg_name, self._regdict[reg_name])
                 else:
-                    self._logger.warning(f"✗ Register '{reg_name}' (addr: {self._regdict[reg_name]}) failed to read")
+                    self._validation_diag.warning("✗ Register '{}' (addr: {}) failed to read", reg_name, self._regdict[reg_name])
 
             except Exception as e:
                 validation_results[reg_name] = False
-                self._logger.error(f"✗ Register '{reg_name}' (addr: {self._regdict[reg_name]}) validation failed: {e}")
+                self._validation_diag.error("✗ Register '{}' (addr: {}) validation failed: {}", reg_name, self._regdict[reg_name], e)
 
         successful_validations = sum(validation_results.values())
         total_validations = len(validation_results)
 
-        self._logger.info(f"Register validation complete: {successful_validations}/{total_validations} registers accessible")
+        self._validation_diag.info("Register validation complete: {}/{} registers accessible", successful_validations, total_validations)
 
         if successful_validations < total_validations:
-            self._logger.warning("Some registers failed validation. Consider verifying addresses with manufacturer.")
+            self._validation_diag.warning("Some registers failed validation. Consider verifying addresses with manufacturer.")
 
         return validation_results
\ No newline at end of file
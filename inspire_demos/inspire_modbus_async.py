@@ -0,0 +1,473 @@
+"""
+Asyncio Modbus TCP interface for the Inspire Hand.
+
+AsyncInspireHandModbus mirrors InspireHandModbus, but every device access is a
+coroutine running on pymodbus' AsyncModbusTcpClient. One event loop can drive
+many hands without pushing each register read through a thread-pool executor.
+"""
+
+import time
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+from loguru import logger
+
+from inspire_demos.inspire_diagnostics import Diagnostics
+from inspire_demos.inspire_instrumentation import NULL_TRANSACTION
+from inspire_demos.inspire_serial import (
+    MODBUS_AVAILABLE,
+    REGISTER_STRIDE,
+    STATE_WINDOW_LEN,
+    STATE_WINDOW_START,
+    HandState,
+    decode_state_window,
+    encode_setpoints,
+    regdict,
+    regdict_gen4,
+)
+from inspire_demos.inspire_modbus import MAX_REGISTERS_PER_READ
+from inspire_demos.inspire_tactile import (
+    TactileData,
+    TACTILE_SPAN,
+    TACTILE_START,
+    TactileFrame,
+    TactileSubscription,
+    decode_tactile,
+    empty_tactile_data,
+    sensor_matrix,
+)
+
+try:
+    from pymodbus.client import AsyncModbusTcpClient
+except ImportError:
+    AsyncModbusTcpClient = None
+
+if TYPE_CHECKING:
+    from inspire_demos.inspire_instrumentation import TransactionInstrumentation
+
+
+class AsyncInspireHandModbus:
+    """Asyncio Modbus TCP interface for Inspire Hand control"""
+
+    _logger = logger
+    _client: "AsyncModbusTcpClient"
+    _ip: str
+    _port: int
+    _generation: int  # 3 for Gen3, 4 for Gen4
+    _debug: bool  # Enable debug output
+    _timeout: float  # Per-request timeout in seconds
+
+    def __init__(self, ip: str = "192.168.11.210", port: int = 6000, generation: int = 3, debug: bool = False,
+                 timeout: float = 3.0):
+        if not MODBUS_AVAILABLE or AsyncModbusTcpClient is None:
+            raise ImportError("pymodbus is required for ModbusTCP communication. Please install it with: pip install pymodbus")
+
+        self._ip = ip
+        self._port = port
+        self._generation = generation
+        self._debug = debug
+        self._timeout = timeout
+        self._client = None
+        self._instrumentation = None  # TransactionInstrumentation while enabled
+        self._diag = Diagnostics("modbus")
+        self._tactile_diag = Diagnostics("modbus.tactile")
+        self._set_verbose(debug)
+
+    @property
+    def _regdict(self) -> dict:
+        """Get the appropriate register dictionary based on generation"""
+        if self._generation == 4:
+            return regdict_gen4
+        else:
+            return regdict
+
+    async def connect(self) -> bool:
+        """Connect to the Modbus TCP server"""
+        try:
+            self._client = AsyncModbusTcpClient(self._ip, port=self._port, timeout=self._timeout)
+            result = await self._client.connect()
+            if result:
+                self._logger.info(f"Connected to Modbus TCP server at {self._ip}:{self._port}")
+            else:
+                self._logger.error(f"Failed to connect to Modbus TCP server at {self._ip}:{self._port}")
+            return bool(result)
+        except Exception as e:
+            self._logger.error(f"Failed to connect to Modbus TCP server: {e}")
+            return False
+
+    async def disconnect(self) -> bool:
+        """Disconnect from the Modbus TCP server"""
+        if self._client is not None and self._client.connected:
+            try:
+                self._client.close()
+                self._logger.info("Disconnected from Modbus TCP server")
+                return True
+            except Exception as e:
+                self._logger.error(f"Failed to disconnect from Modbus TCP server: {e}")
+                return False
+        return True
+
+    def is_connected(self) -> bool:
+        """Check if connected to the Modbus TCP server"""
+        return self._client is not None and self._client.connected
+
+    async def reset_error(self) -> bool:
+        """Reset error status"""
+        return await self._write_register(self._regdict["CLEAR_ERROR"], [1])
+
+    async def return_to_zero(self) -> bool:
+        """Return all joints to zero position."""
+        return await self.set_angle(np.array([0, 0, 0, 0, 0, 0], dtype=np.int32))
+
+    async def perform_open(self) -> bool:
+        """Open the hand (set all joints to maximum position)."""
+        return await self.set_angle(np.array([1000, 1000, 1000, 1000, 1000, 1000], dtype=np.int32))
+
+    async def perform_close(self) -> bool:
+        """Close the hand (set all joints to zero position)."""
+        return await self.set_angle(np.array([0, 0, 0, 0, 0, 0], dtype=np.int32))
+
+    async def set_angle(self, angles: npt.NDArray[np.integer]) -> bool:
+        """Set joint angles. Accepts numpy arrays only."""
+        return await self._write_register(self._regdict["ANGLE_SET"], encode_setpoints(angles, "angles").tolist())
+
+    async def set_pos(self, positions: npt.NDArray[np.integer]) -> bool:
+        """Set joint positions. Accepts numpy arrays only."""
+        if not isinstance(positions, np.ndarray):
+            raise TypeError("positions must be a numpy.ndarray")
+
+        # For Modbus, position and angle are the same register
+        return await self.set_angle(positions)
+
+    async def set_speed(self, speeds: npt.NDArray[np.integer]) -> bool:
+        """Set joint speeds. Accepts numpy arrays only."""
+        return await self._write_register(self._regdict["SPEED_SET"], encode_setpoints(speeds, "speeds").tolist())
+
+    async def set_force(self, forces: npt.NDArray[np.integer]) -> bool:
+        """Set joint forces. Accepts numpy arrays only."""
+        return await self._write_register(self._regdict["FORCE_SET"], encode_setpoints(forces, "forces").tolist())
+
+    async def _write_register(self, address: int, values: List[int]) -> bool:
+        """Write to Modbus registers"""
+        if not self.is_connected():
+            self._diag.error("Modbus connection not established. Call connect() first.")
+            return False
+
+        tx = self._instrumentation.begin("write", address, 2 * len(values)) if self._instrumentation is not None else NULL_TRANSACTION
+        try:
+            self._diag.debug("Writing to register {}: {}", address, values)
+
+            await self._client.write_registers(address, values)
+            tx.mark("transfer")
+            tx.finish(True, 2 * len(values))
+            return True
+        except Exception as e:
+            tx.finish(False)
+            self._diag.error("Failed to write to register {}: {}", address, e)
+            return False
+
+    async def _read_register(self, address: int, count: int) -> List[int]:
+        """Read holding registers, segmented into requests of at most 125 registers.
+
+        Returns an empty list if the connection is not established or any
+        segment fails.
+        """
+        if not self.is_connected():
+            self._diag.error("Modbus connection not established. Call connect() first.")
+            return []
+
+        tx = self._instrumentation.begin("read", address, 2 * count) if self._instrumentation is not None else NULL_TRANSACTION
+        try:
+            result: List[int] = []
+            for offset in range(0, count, MAX_REGISTERS_PER_READ):
+                segment_count = min(MAX_REGISTERS_PER_READ, count - offset)
+                segment_address = address + offset * REGISTER_STRIDE
+                self._diag.debug("Reading {} registers from address {}", segment_count, segment_address)
+
+                response = await self._client.read_holding_registers(segment_address, count=segment_count)
+                tx.mark("transfer")
+                if response.isError():
+                    tx.finish(False)
+                    self._diag.error("Modbus read error from address {}", segment_address)
+                    return []
+                result.extend(response.registers)
+                tx.mark("decode")
+
+            tx.finish(True, 2 * count)
+            self._diag.debug("Read {} values from register {}", len(result), address)
+
+            return result
+        except Exception as e:
+            tx.finish(False)
+            self._diag.error("Failed to read from register {}: {}", address, e)
+            return []
+
+    async def _read_into(self, address: int, out: npt.NDArray) -> bool:
+        """Read len(out) registers starting at address straight into out, see InspireHandModbus._read_into.
+
+        Returns:
+            bool: True if every register was read, False otherwise (out is then partly stale)
+        """
+        if not self.is_connected():
+            self._diag.error("Modbus connection not established. Call connect() first.")
+            return False
+
+        count = len(out)
+        tx = self._instrumentation.begin("read", address, 2 * count) if self._instrumentation is not None else NULL_TRANSACTION
+        try:
+            for offset in range(0, count, MAX_REGISTERS_PER_READ):
+                segment_count = min(count - offset, MAX_REGISTERS_PER_READ)
+                segment_address = address + offset * REGISTER_STRIDE
+                response = await self._client.read_holding_registers(segment_address, count=segment_count)
+                tx.mark("transfer")
+                if response.isError():
+                    tx.finish(False)
+                    self._diag.error("Modbus read error from address {}", segment_address)
+                    return False
+                out[offset:offset + segment_count] = response.registers
+                tx.mark("decode")
+            tx.finish(True, 2 * count)
+            return True
+        except Exception as e:
+            tx.finish(False)
+            self._diag.error("Failed to read from register {}: {}", address, e)
+            return False
+
+    def enable_instrumentation(self, instrumentation: Optional["TransactionInstrumentation"] = None) -> "TransactionInstrumentation":
+        """Record per-transaction phase timings (transfer, decode, convert), see InspireHandModbus.enable_instrumentation.
+
+        Args:
+            instrumentation: Collector to record into, e.g. one shared by several hands; a new one if omitted
+
+        Returns:
+            TransactionInstrumentation: The active collector, see snapshot() and to_prometheus()
+        """
+        from inspire_demos.inspire_instrumentation import TransactionInstrumentation
+
+        self._instrumentation = instrumentation or TransactionInstrumentation("modbus")
+        return self._instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """Stop recording transaction timings"""
+        self._instrumentation = None
+
+    def get_instrumentation(self) -> Optional["TransactionInstrumentation"]:
+        """Get the active TransactionInstrumentation, or None while disabled"""
+        return self._instrumentation
+
+    async def _read6_16bit(self, reg_name: str) -> List[int]:
+        """Read 6 16-bit values from a named register"""
+        if reg_name not in self._regdict:
+            raise ValueError(f"Register '{reg_name}' not valid for generation {self._generation}")
+
+        val = await self._read_register(self._regdict[reg_name], 6)
+
+        if len(val) < 6:
+            self._diag.debug("Failed to fetch 6 values from {}", reg_name)
+            return []
+        if self._instrumentation is not None:
+            # pymodbus already decoded the words; recorded so every register has a convert phase on both transports
+            self._instrumentation.record_phase(self._regdict[reg_name], "read", "convert", 0, 12)
+
+        return val
+
+    async def _read6_8bit(self, reg_name: str) -> List[int]:
+        """Read 6 8-bit values from a named register (3 Modbus registers split into high/low bytes)"""
+        if reg_name not in self._regdict:
+            raise ValueError(f"Register '{reg_name}' not valid for generation {self._generation}")
+
+        val_act = await self._read_register(self._regdict[reg_name], 3)
+
+        if len(val_act) < 3:
+            self._diag.debug("Failed to fetch data from {}", reg_name)
+            return []
+
+        start = time.perf_counter_ns() if self._instrumentation is not None else 0
+        results = []
+        for val in val_act:
+            results.append(val & 0xFF)
+            results.append((val >> 8) & 0xFF)
+        if self._instrumentation is not None:
+            self._instrumentation.record_phase(self._regdict[reg_name], "read", "convert", time.perf_counter_ns() - start, 6)
+        return results
+
+    async def get_angle_actual(self) -> npt.NDArray[np.int32]:
+        """Get actual joint angles as numpy array."""
+        return np.array(await self._read6_16bit("ANGLE_ACT"), dtype=np.int32)
+
+    async def get_angle_set(self) -> npt.NDArray[np.int32]:
+        """Get set joint angles as numpy array."""
+        return np.array(await self._read6_16bit("ANGLE_SET"), dtype=np.int32)
+
+    async def get_pos_actual(self) -> npt.NDArray[np.int32]:
+        """Get actual joint positions as numpy array."""
+        return np.array(await self._read6_16bit("ANGLE_ACT"), dtype=np.int32)  # Position uses same register as angle
+
+    async def get_pos_set(self) -> npt.NDArray[np.int32]:
+        """Get set joint positions as numpy array."""
+        return np.array(await self._read6_16bit("ANGLE_SET"), dtype=np.int32)  # Position uses same register as angle
+
+    async def get_speed_set(self) -> npt.NDArray[np.int32]:
+        """Get set joint speeds as numpy array."""
+        return np.array(await self._read6_16bit("SPEED_SET"), dtype=np.int32)
+
+    async def get_force_actual(self) -> npt.NDArray[np.int32]:
+        """Get actual joint forces as numpy array."""
+        return np.array(await self._read6_16bit("FORCE_ACT"), dtype=np.int32)
+
+    async def get_force_set(self) -> npt.NDArray[np.int32]:
+        """Get set joint forces as numpy array."""
+        return np.array(await self._read6_16bit("FORCE_SET"), dtype=np.int32)
+
+    async def get_error(self) -> npt.NDArray[np.int32]:
+        """Get error codes as numpy array."""
+        return np.array(await self._read6_8bit("ERROR"), dtype=np.int32)
+
+    async def get_temperature(self) -> npt.NDArray[np.int32]:
+        """Get temperature values as numpy array."""
+        return np.array(await self._read6_8bit("TEMP"), dtype=np.int32)
+
+    async def get_status(self) -> npt.NDArray[np.int32]:
+        """Get status codes as numpy array."""
+        return np.array(await self._read6_8bit("STATUS"), dtype=np.int32)
+
+    async def get_pos(self) -> npt.NDArray[np.int32]:
+        """Get current position as numpy array (alias for get_pos_actual)."""
+        return await self.get_pos_actual()
+
+    async def read_state(self) -> Optional[HandState]:
+        """Read the POS_ACT..TEMP status window in one transaction, see InspireHandModbus.read_state.
+
+        Returns:
+            HandState: Decoded snapshot, or None if the read failed
+        """
+        timestamp = time.time()
+        count = STATE_WINDOW_LEN // 2
+        raw = await self._read_register(STATE_WINDOW_START, count)
+        if len(raw) < count:
+            self._diag.debug("Failed to read state window")
+            return None
+        # Registers carry two consecutive bytes each, low byte first
+        if self._instrumentation is None:
+            return decode_state_window(np.asarray(raw, dtype="<u2").tobytes(), timestamp)
+        start = time.perf_counter_ns()
+        state = decode_state_window(np.asarray(raw, dtype="<u2").tobytes(), timestamp)
+        self._instrumentation.record_phase(STATE_WINDOW_START, "read", "convert", time.perf_counter_ns() - start, STATE_WINDOW_LEN)
+        return state
+
+    async def set_action_sequence(self, sequence_id: int) -> bool:
+        """Set the action sequence ID"""
+        return await self._write_register(self._regdict["ACTION_SEQ_INDEX"], [sequence_id])
+
+    async def run_action_sequence(self) -> bool:
+        """Run the current action sequence"""
+        return await self._write_register(self._regdict["ACTION_SEQ_RUN"], [1])
+
+    async def get_all_tactile_data(self) -> TactileData:
+        """Get all tactile sensor data as a structured TactileData object.
+
+        Returns:
+            TactileData: Structured object containing all tactile sensor data with timestamp
+        """
+        if self._generation != 4:
+            self._logger.error("Tactile sensors are only available in Gen 4 hardware")
+            raise NotImplementedError("Tactile sensors are only available in Gen 4 hardware")
+
+        timestamp = time.time()
+        raw_data = await self._read_register(TACTILE_START, TACTILE_SPAN)
+
+        if len(raw_data) != TACTILE_SPAN:
+            self._tactile_diag.error("Failed to read complete tactile data: expected {}, got {}", TACTILE_SPAN, len(raw_data))
+            return empty_tactile_data(timestamp)
+
+        return decode_tactile(np.array(raw_data, dtype=np.int32), timestamp)
+
+    async def read_into(self, frame: TactileFrame, subscription: Optional[TactileSubscription] = None) -> bool:
+        """Refill a TactileFrame in place, see InspireHandModbus.read_into.
+
+        Args:
+            frame: Frame to refill; reuse the same one on every poll
+            subscription: Refresh only these sensors; the other sensors keep their previous values
+
+        Returns:
+            bool: True on success. On failure frame.valid is False and the old values are partly overwritten.
+        """
+        if self._generation != 4:
+            self._logger.error("Tactile sensors are only available in Gen 4 hardware")
+            raise NotImplementedError("Tactile sensors are only available in Gen 4 hardware")
+
+        frame.data.timestamp = time.time()
+        if subscription is None:
+            frame.valid = await self._read_into(TACTILE_START, frame.buffer)
+        else:
+            frame.valid = True
+            for offset, count in subscription.segments:
+                if not await self._read_into(TACTILE_START + offset * REGISTER_STRIDE, frame.buffer[offset:offset + count]):
+                    frame.valid = False
+                    break
+        if not frame.valid:
+            self._tactile_diag.error("Failed to read complete tactile data from address {}", TACTILE_START)
+            return False
+
+        frame.sequence += 1
+        if self._tactile_diag.debug_enabled:
+            registers = TACTILE_SPAN if subscription is None else subscription.registers
+            self._tactile_diag.debug("Read tactile sweep: {} registers from address {}", registers, TACTILE_START)
+        return True
+
+    async def get_tactile_data(self, finger: str, position: str = '') -> npt.NDArray[np.int32]:
+        """Get tactile data for a single sensor.
+
+        Args:
+            finger: Name of the finger ('pinky', 'ring', 'middle', 'index', 'thumb', 'palm')
+            position: Position on finger ('top', 'tip', 'base', 'mid' for thumb only)
+                     Not used for palm sensor (can be empty string)
+
+        Returns:
+            2D numpy array with tactile sensor data for the specified sensor
+        """
+        if self._generation != 4:
+            self._logger.error("Tactile sensors are only available in Gen 4 hardware")
+            raise NotImplementedError("Tactile sensors are only available in Gen 4 hardware")
+
+        if finger == 'palm':
+            reg_name = "PALM_TAC"
+        elif finger in ['pinky', 'ring', 'middle', 'index', 'thumb']:
+            valid_positions = ['top', 'tip', 'mid', 'base'] if finger == 'thumb' else ['top', 'tip', 'base']
+            if position not in valid_positions:
+                raise ValueError(f"Position '{position}' not valid for {finger}. Available positions: {valid_positions}")
+            reg_name = f"{finger.upper()}_{position.upper()}_TAC"
+        else:
+            available_fingers = ['pinky', 'ring', 'middle', 'index', 'thumb', 'palm']
+            raise ValueError(f"Finger '{finger}' not found. Available fingers: {available_fingers}")
+
+        address, (rows, cols) = self._regdict[reg_name]
+        total_elements = rows * cols
+
+        raw_data = await self._read_register(address, total_elements)
+        if len(raw_data) != total_elements:
+            self._tactile_diag.error("Failed to read complete tactile data for {}: expected {}, got {}", reg_name, total_elements, len(raw_data))
+            return np.array([], dtype=np.int32)
+
+        return sensor_matrix(np.array(raw_data, dtype=np.int32), reg_name)
+
+    def get_generation(self) -> int:
+        """Get the hardware generation (3 or 4)"""
+        return self._generation
+
+    def get_ip(self) -> str:
+        """Get the IP address of the Modbus server"""
+        return self._ip
+
+    def get_port(self) -> int:
+        """Get the port of the Modbus server"""
+        return self._port
+
+    def set_debug(self, debug: bool) -> None:
+        """Enable or disable debug output (DEBUG level for this hand's diagnostics)"""
+        self._debug = debug
+        self._set_verbose(debug)
+
+    def _set_verbose(self, verbose: bool) -> None:
+        self._diag.verbose = self._tactile_diag.verbose = verbose
@@ -0,0 +1,387 @@
+"""
+Binary session recording of tactile frames and joint state.
+
+A recording is one append-only file: a small header (magic, version, record
+layout and JSON metadata) followed by fixed-size records of RECORD_DTYPE.
+Tactile data is stored in the compact layout (1046 raw 16-bit taxels) and the
+joint state as the raw register values, so a frame costs about 2.2 KB instead
+of the ~20 KB a JSON line needs. The record array can be memory-mapped
+directly with open_recording().
+"""
+
+import json
+import mmap
+import queue
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+from loguru import logger
+
+from inspire_demos.inspire_serial import HandState
+from inspire_demos.inspire_tactile import (
+    TACTILE_SENSORS,
+    TACTILE_SPAN,
+    TACTILE_TAXELS,
+    TactileData,
+    TactileFrame,
+    compact_sweep,
+    compact_tactile,
+    decode_tactile,
+    sensor_view,
+)
+
+RECORDING_MAGIC = b"INSPREC\x00"
+RECORDING_VERSION = 1
+HEADER_ALIGN = 64  # Records start on a 64-byte boundary
+_HEADER = struct.Struct("<8sHHIII")  # magic, version, flags, header size, record size, metadata length
+HEADER_FLAG_COMPRESSED = 0x0001  # Records stored as compression blocks, see inspire_compression
+
+# Record flags
+FLAG_TACTILE = 0x01
+FLAG_STATE = 0x02
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),  # Wall-clock time of the frame
+    ("flags", "<u4"),
+    ("pos", "<u2", (6,)),
+    ("angle", "<u2", (6,)),
+    ("force", "<u2", (6,)),
+    ("current", "<u2", (6,)),
+    ("error", "u1", (6,)),
+    ("status", "u1", (6,)),
+    ("temp", "u1", (6,)),
+    ("tactile", "<u2", (TACTILE_TAXELS,)),  # Compact layout, see inspire_tactile
+])
+
+_STATE_FIELDS = ("pos", "angle", "force", "current", "error", "status", "temp")
+
+TactileInput = Union[TactileFrame, TactileData, npt.NDArray]
+
+
+def _read_header(path: Union[str, Path]) -> Tuple[int, int, int, Dict[str, Any]]:
+    with open(path, "rb") as f:
+        fixed = f.read(_HEADER.size)
+        if len(fixed) < _HEADER.size:
+            raise ValueError(f"{path} is too short to be a recording")
+        magic, version, flags, header_size, record_size, meta_len = _HEADER.unpack(fixed)
+        if magic != RECORDING_MAGIC:
+            raise ValueError(f"{path} is not an Inspire Hand recording")
+        if version != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version {version} (expected {RECORDING_VERSION})")
+        metadata = json.loads(f.read(meta_len).decode("utf-8"))
+    return flags, header_size, record_size, metadata
+
+
+def read_header(path: Union[str, Path]) -> Tuple[int, int, Dict[str, Any]]:
+    """Read a recording header.
+
+    Returns:
+        Tuple of (header size in bytes, record size in bytes, metadata dict)
+    """
+    _, header_size, record_size, metadata = _read_header(path)
+    return header_size, record_size, metadata
+
+
+def is_compressed(path: Union[str, Path]) -> bool:
+    """True if the recording was written by inspire_compression.compress_recording()."""
+    return bool(_read_header(path)[0] & HEADER_FLAG_COMPRESSED)
+
+
+def _record_layout(path: Union[str, Path]) -> Tuple[int, int, Dict[str, Any]]:
+    """Check that a recording can be mapped; returns (header size, whole records, metadata)."""
+    flags, header_size, record_size, metadata = _read_header(path)
+    if flags & HEADER_FLAG_COMPRESSED:
+        raise ValueError(f"{path} is compressed; restore it with inspire_compression.decompress_recording() first")
+    if record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"Record size {record_size} does not match this version's layout ({RECORD_DTYPE.itemsize})")
+    count = (Path(path).stat().st_size - header_size) // record_size
+    return header_size, count, metadata
+
+
+def open_recording(path: Union[str, Path]) -> Tuple[Dict[str, Any], npt.NDArray]:
+    """Memory-map the records of a recording read-only.
+
+    A trailing partial record (e.g. after a crash) is ignored.
+
+    Returns:
+        Tuple of (metadata dict, structured record array of RECORD_DTYPE)
+    """
+    header_size, count, metadata = _record_layout(path)
+    if count == 0:
+        return metadata, np.empty(0, dtype=RECORD_DTYPE)
+    records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=header_size, shape=(count,))
+    return metadata, records
+
+
+class SessionRecorder:
+    """Appends tactile frames and joint state to a binary recording.
+
+    Records are staged in preallocated blocks and a writer thread flushes full
+    blocks through a single buffered file handle, so a slow disk never stalls
+    the acquisition loop as long as a free block is available. When all blocks
+    are in flight record() waits for one (counted in stalls) instead of
+    dropping frames.
+
+    Args:
+        path: Output file, created or truncated
+        metadata: JSON-serializable session information stored in the header
+        block_records: Records per block written in one call
+        blocks: Number of staging blocks
+    """
+
+    _logger = logger
+
+    def __init__(self, path: Union[str, Path], metadata: Optional[Dict[str, Any]] = None,
+                 block_records: int = 256, blocks: int = 4):
+        if block_records < 1 or blocks < 2:
+            raise ValueError("block_records must be >= 1 and blocks >= 2")
+        self._path = Path(path)
+        meta = {
+            "created": time.time(),
+            "record_dtype": RECORD_DTYPE.descr,
+            "tactile_sensors": list(TACTILE_SENSORS),
+            **(metadata or {}),
+        }
+        meta_bytes = json.dumps(meta).encode("utf-8")
+        header_size = -(-(_HEADER.size + len(meta_bytes)) // HEADER_ALIGN) * HEADER_ALIGN
+        header = _HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION, 0, header_size, RECORD_DTYPE.itemsize,
+                              len(meta_bytes)) + meta_bytes
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._path, "wb", buffering=block_records * RECORD_DTYPE.itemsize)
+        self._file.write(header.ljust(header_size, b"\x00"))
+
+        self._free: "queue.Queue[npt.NDArray]" = queue.Queue()
+        for _ in range(blocks):
+            self._free.put(np.zeros(block_records, dtype=RECORD_DTYPE))
+        self._full: "queue.Queue[Optional[Tuple[npt.NDArray, int]]]" = queue.Queue()
+        self._block = self._free.get()
+        self._fill = 0
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+        self._records = 0
+        self._stalls = 0
+        self._writer = threading.Thread(target=self._write_blocks, name="inspire-session-recorder", daemon=True)
+        self._writer.start()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record(self, tactile: Optional[TactileInput] = None, state: Optional[HandState] = None,
+               timestamp: Optional[float] = None) -> None:
+        """Append one frame.
+
+        Args:
+            tactile: TactileFrame, TactileData or raw sweep array (TACTILE_SPAN registers)
+            state: Joint state from read_state()
+            timestamp: Frame time, defaults to the tactile timestamp, then state timestamp, then now
+
+        Raises:
+            ValueError: If tactile comes from a failed read (invalid TactileFrame, empty TactileData) or is a sweep of the wrong size
+        """
+        if self._closed:
+            raise ValueError("Recorder is closed")
+        if self._error is not None:
+            raise IOError(f"Recording to {self._path} failed: {self._error}")
+
+        flags = 0
+        if tactile is not None:
+            tactile_out = self._block["tactile"][self._fill]
+            if isinstance(tactile, TactileFrame):
+                if not tactile.valid:
+                    raise ValueError("Cannot record a TactileFrame whose last read failed (valid is False)")
+                compact_sweep(tactile.buffer, tactile_out)
+                timestamp = tactile.timestamp if timestamp is None else timestamp
+            elif isinstance(tactile, TactileData):
+                if tactile.palm.size == 0:
+                    raise ValueError("Cannot record empty TactileData (returned when a tactile read fails)")
+                compact_tactile(tactile, tactile_out)
+                timestamp = tactile.timestamp if timestamp is None else timestamp
+            else:
+                if np.shape(tactile) != (TACTILE_SPAN,):
+                    raise ValueError(f"Expected a raw tactile sweep of {TACTILE_SPAN} registers, got shape {np.shape(tactile)}")
+                compact_sweep(tactile, tactile_out)
+            flags |= FLAG_TACTILE
+        if state is not None:
+            for name in _STATE_FIELDS:
+                self._block[name][self._fill] = getattr(state, name)
+            timestamp = state.timestamp if timestamp is None else timestamp
+            flags |= FLAG_STATE
+        self._block["timestamp"][self._fill] = time.time() if timestamp is None else timestamp
+        self._block["flags"][self._fill] = flags
+
+        self._records += 1
+        self._fill += 1
+        if self._fill == len(self._block):
+            self._submit_block()
+
+    def flush(self) -> None:
+        """Write the staged records and flush the file."""
+        if self._fill:
+            self._submit_block()
+        self._full.join()
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush everything and close the file."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._full.put(None)
+            self._writer.join()
+            self._file.close()
+        if self._error is not None:
+            raise IOError(f"Recording to {self._path} failed: {self._error}")
+
+    def __enter__(self) -> "SessionRecorder":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def get_stats(self) -> dict:
+        """Records written, bytes on disk (incl. staged) and times record() had to wait for the disk."""
+        return {
+            "records": self._records,
+            "bytes": self._records * RECORD_DTYPE.itemsize,
+            "stalls": self._stalls,
+        }
+
+    def _submit_block(self) -> None:
+        self._full.put((self._block, self._fill))
+        try:
+            self._block = self._free.get_nowait()
+        except queue.Empty:
+            self._stalls += 1
+            self._block = self._free.get()
+        self._fill = 0
+
+    def _write_blocks(self) -> None:
+        while True:
+            item = self._full.get()
+            if item is None:
+                self._full.task_done()
+                return
+            block, count = item
+            try:
+                if self._error is None:
+                    self._file.write(memoryview(block[:count]).cast("B"))
+            except OSError as e:
+                self._logger.error(f"Writing recording {self._path} failed: {e}")
+                self._error = e
+            finally:
+                self._free.put(block)
+                self._full.task_done()
+
+
+class SessionReader:
+    """Random access to a recording without loading it into memory.
+
+    Every accessor returns NumPy views into the memory-mapped file: sensor()
+    gives a (frames, rows, cols) array per tactile sensor, joint() a
+    (frames, 6) array per state field. Timestamps are assumed non-decreasing
+    (as written by SessionRecorder), so time lookups are binary searches.
+
+    Args:
+        path: Recording written by SessionRecorder
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self._path = Path(path)
+        header_size, count, self.metadata = _record_layout(self._path)
+        self._mmap: Optional[mmap.mmap] = None
+        if count == 0:
+            self.records = np.empty(0, dtype=RECORD_DTYPE)
+            return
+        with open(self._path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.records = np.frombuffer(self._mmap, dtype=RECORD_DTYPE, count=count, offset=header_size)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def timestamps(self) -> npt.NDArray[np.float64]:
+        """Frame timestamps (view)."""
+        return self.records["timestamp"]
+
+    @property
+    def duration(self) -> float:
+        """Seconds between the first and last frame."""
+        return float(self.timestamps[-1] - self.timestamps[0]) if len(self) else 0.0
+
+    def has_tactile(self) -> npt.NDArray[np.bool_]:
+        """Per-frame mask of frames carrying tactile data."""
+        return (self.records["flags"] & FLAG_TACTILE) != 0
+
+    def has_state(self) -> npt.NDArray[np.bool_]:
+        """Per-frame mask of frames carrying joint state."""
+        return (self.records["flags"] & FLAG_STATE) != 0
+
+    def sensor(self, reg_name: str) -> npt.NDArray[np.uint16]:
+        """All frames of one tactile sensor as a (frames, rows, cols) view, e.g. sensor("PALM_TAC")."""
+        if reg_name not in TACTILE_SENSORS:
+            raise ValueError(f"Unknown tactile sensor '{reg_name}'. Available sensors: {list(TACTILE_SENSORS)}")
+        return sensor_view(self.records["tactile"], reg_name, compact=True)
+
+    def joint(self, name: str) -> npt.NDArray:
+        """All frames of one joint state field ("pos", "angle", "force", ...) as a (frames, 6) view."""
+        if name not in _STATE_FIELDS:
+            raise ValueError(f"Unknown state field '{name}'. Available fields: {list(_STATE_FIELDS)}")
+        return self.records[name]
+
+    def tactile(self, index: int) -> TactileData:
+        """TactileData of one frame, with views into the file."""
+        return decode_tactile(self.records["tactile"][index], float(self.timestamps[index]), compact=True)
+
+    def state(self, index: int) -> HandState:
+        """HandState of one frame."""
+        record = self.records[index]
+        return HandState(timestamp=float(record["timestamp"]),
+                         **{name: record[name].astype(np.int32) for name in _STATE_FIELDS})
+
+    def index_at(self, t: float) -> int:
+        """Index of the last frame at or before time t (0 if t precedes the session).
+
+        Raises:
+            IndexError: If the session has no frames
+        """
+        if not len(self):
+            raise IndexError(f"Recording {self._path} has no frames")
+        return max(int(np.searchsorted(self.timestamps, t, side="right")) - 1, 0)
+
+    def window(self, start: float, end: float) -> slice:
+        """Slice of the frames with start <= timestamp < end, for use on any accessor."""
+        timestamps = self.timestamps
+        return slice(int(np.searchsorted(timestamps, start, side="left")),
+                     int(np.searchsorted(timestamps, end, side="left")))
+
+    def close(self) -> None:
+        """Release the memory map (deferred until views obtained earlier are gone)."""
+        self.records = np.empty(0, dtype=RECORD_DTYPE)
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # Still referenced by views; unmapped when they are collected
+            self._mmap = None
+
+    def __enter__(self) -> "SessionReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
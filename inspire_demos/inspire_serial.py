@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+import collections
 import os
-from typing import Any, Union
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, Optional, Union
 import serial
 import time
 import asyncio
@@ -21,6 +25,12 @@ except ImportError:
     MODBUS_AVAILABLE = False
     logger.warning("pymodbus not available. InspireHandModbus class will not be functional. Install with: pip install pymodbus")
 
+from inspire_demos.inspire_diagnostics import CAPTURE_RX, CAPTURE_TX, Diagnostics, FrameCapture
+from inspire_demos.inspire_instrumentation import NULL_TRANSACTION
+
+if TYPE_CHECKING:
+    from inspire_demos.inspire_instrumentation import Transaction, TransactionInstrumentation
+
 import serial.tools
 
 if os.name == "posix":
@@ -30,6 +40,10 @@ elif os.name == "nt":
 elif os.name == "linux":
     import serial.tools.list_ports_linux
 
+# Addresses count bytes, so every 16-bit register spans two of them. Reading N
+# registers from address A returns the values at A, A + 2, ..., A + 2 * (N - 1).
+REGISTER_STRIDE = 2
+
 # Register addresses verified through reverse engineering - use validation methods for manufacturer verification
 # Use validate_register_addresses() and export_register_verification_report() to identify potential issues
 regdict = {
@@ -119,6 +133,266 @@ regdict_gen4 = {
 
 DEFAULT_PORT = "COM3" if os.name == "nt" else "/dev/ttyUSB0"
 DEFAULT_BAUDRATE = 115200
+DEFAULT_TIMEOUT = 0.1  # Reply deadline in seconds
+READER_POLL_INTERVAL = 0.01  # Port timeout used by the fire-and-forget reader thread
+# Fixed port timeout for reply reads. read() still returns as soon as the
+# requested bytes arrive; the reply deadline is checked between reads, so
+# the port is never reconfigured on the hot path (may overshoot by this much).
+REPLY_POLL_INTERVAL = 0.01
+
+# Frame layout: header(2) | id | len | cmd | addr_lo | addr_hi | data... | checksum
+# "len" counts cmd + address + data, the checksum is the low byte of the sum from id onwards.
+FRAME_HEADER = b"\xEB\x90"  # Host -> hand
+REPLY_HEADER = b"\x90\xEB"  # Hand -> host
+CMD_READ = 0x11
+CMD_WRITE = 0x12
+FRAME_OVERHEAD = 5  # header + id + len + checksum
+MIN_FRAME_LEN = 3  # Smallest valid "len" field (cmd + address)
+MAX_READ_BYTES = 252  # "len" is one byte and also covers cmd + address
+
+# Actuator status window, all offsets in bytes from POS_ACT.
+# (field, register, dtype, count)
+STATE_WINDOW_FIELDS = (
+    ("pos", "POS_ACT", "<u2", 6),
+    ("angle", "ANGLE_ACT", "<u2", 6),
+    ("force", "FORCE_ACT", "<u2", 6),
+    ("current", "CURRENT", "<u2", 6),
+    ("error", "ERROR", "u1", 6),
+    ("status", "STATUS", "u1", 6),
+    ("temp", "TEMP", "u1", 6),
+)
+STATE_WINDOW_START = regdict["POS_ACT"]
+STATE_WINDOW_LEN = regdict["TEMP"] + 6 - STATE_WINDOW_START  # 1534..1623
+
+
+@dataclass(frozen=True)
+class HandState:
+    """Snapshot of the actuator status registers read in one pass."""
+    timestamp: float
+    pos: npt.NDArray[np.int32]
+    angle: npt.NDArray[np.int32]
+    force: npt.NDArray[np.int32]
+    current: npt.NDArray[np.int32]
+    error: npt.NDArray[np.int32]
+    status: npt.NDArray[np.int32]
+    temp: npt.NDArray[np.int32]
+
+
+def decode_state_window(window: bytes, timestamp: float) -> HandState:
+    """Decode the raw POS_ACT..TEMP byte window into a HandState.
+
+    The returned arrays are read-only so snapshots can be shared between threads.
+    """
+    if len(window) < STATE_WINDOW_LEN:
+        raise ValueError(f"State window too short: expected {STATE_WINDOW_LEN} bytes, got {len(window)}")
+    fields = {}
+    for name, reg_name, dtype, count in STATE_WINDOW_FIELDS:
+        offset = regdict[reg_name] - STATE_WINDOW_START
+        arr = np.frombuffer(window, dtype=dtype, count=count, offset=offset).astype(np.int32)
+        arr.flags.writeable = False
+        fields[name] = arr
+    return HandState(timestamp=timestamp, **fields)
+
+
+def read_chunks(addr: int, num: int) -> list[tuple[int, int]]:
+    """(address, byte count) of the fewest read frames covering num bytes from addr."""
+    return [(addr + offset, min(num - offset, MAX_READ_BYTES)) for offset in range(0, num, MAX_READ_BYTES)]
+
+
+def build_frame(hand_id: int, cmd: int, addr: int, payload: bytes) -> bytes:
+    """Build a host -> hand frame with length and checksum filled in."""
+    frame = bytearray(FRAME_HEADER)
+    frame += bytes((hand_id, len(payload) + 3, cmd, addr & 0xFF, (addr >> 8) & 0xFF))
+    frame += payload
+    frame.append(sum(frame[2:]) & 0xFF)
+    return bytes(frame)
+
+
+class FrameTemplate:
+    """Preassembled write frame for one (hand_id, register, length).
+
+    Header, id, length, command and address are filled in once together with
+    their partial checksum; each write only copies the payload into the
+    preallocated buffer and patches the checksum byte. The returned buffer is
+    reused by the next write, so send it before filling the template again.
+    """
+
+    __slots__ = ("frame", "_words", "_base_sum", "_end")
+
+    def __init__(self, hand_id: int, addr: int, length: int):
+        self.frame = bytearray(build_frame(hand_id, CMD_WRITE, addr, bytes(length)))
+        self._base_sum = sum(self.frame[2:7])
+        self._end = 7 + length
+        # Little-endian uint16 view over the payload for packing setpoints in place
+        self._words = np.frombuffer(self.frame, dtype="<u2", count=length // 2, offset=7)
+
+    def fill(self, payload: bytes) -> bytearray:
+        """Copy a byte payload into the frame and update the checksum."""
+        if len(payload) != self._end - 7:
+            raise ValueError(f"Expected {self._end - 7} payload bytes, got {len(payload)}")
+        frame = self.frame
+        frame[7:self._end] = payload
+        frame[self._end] = (self._base_sum + sum(payload)) & 0xFF
+        return frame
+
+    def fill_words(self, values: npt.NDArray[np.integer]) -> bytearray:
+        """Pack 16-bit values little-endian into the frame and update the checksum."""
+        frame = self.frame
+        self._words[:] = values
+        frame[self._end] = (self._base_sum + sum(frame[7:self._end])) & 0xFF
+        return frame
+
+
+def encode_setpoints(values: npt.NDArray[np.integer], name: str = "values", count: int = 6,
+                     batch: bool = False) -> npt.NDArray[np.uint16]:
+    """Validate setpoints and convert them to 16-bit register values without Python loops.
+
+    Every value keeps its low 16 bits, so -1 ("leave unchanged") becomes 0xFFFF.
+    A single set may have any shape holding `count` values; with batch=True the
+    input is split into rows of `count` values for streaming several setpoints
+    at once.
+
+    Returns:
+        uint16 array shaped (count,), or (N, count) for batches. Use
+        setpoint_payload() for the serial wire bytes and .tolist() for Modbus.
+    """
+    if not isinstance(values, np.ndarray):
+        raise TypeError(f"{name} must be a numpy.ndarray")
+
+    flat = values.reshape(-1)
+    if batch:
+        if flat.size == 0 or flat.size % count:
+            raise ValueError(f"Expected a multiple of {count} {name[:-1]} values, got {flat.size}")
+        flat = flat.reshape(-1, count)
+    elif flat.size != count:
+        raise ValueError(f"Expected {count} {name[:-1]} values, got {flat.size}")
+
+    return flat.astype(np.int32, copy=False).astype(np.uint16)
+
+
+def setpoint_payload(words: npt.NDArray[np.uint16]) -> bytes:
+    """Serial wire payload for encoded setpoints (little-endian uint16, rows concatenated)."""
+    return words.astype("<u2", copy=False).tobytes()
+
+
+def build_write_frames(hand_id: int, addr: int, words: npt.NDArray[np.uint16]) -> npt.NDArray[np.uint8]:
+    """Build one complete write frame per row of an encoded setpoint batch.
+
+    Headers, payloads and checksums are computed for all rows at once, e.g. to
+    pre-encode a trajectory before streaming it.
+
+    Returns:
+        uint8 array shaped (N, frame length); row i is ready to send as bytes.
+    """
+    words = np.atleast_2d(words)
+    payload_len = words.shape[1] * 2
+    template = np.frombuffer(build_frame(hand_id, CMD_WRITE, addr, bytes(payload_len)), dtype=np.uint8)
+    frames = np.tile(template, (words.shape[0], 1))
+    frames[:, 7:7 + payload_len] = words.astype("<u2", copy=False).view(np.uint8).reshape(words.shape[0], payload_len)
+    frames[:, -1] = (frames[:, 2:-1].sum(axis=1, dtype=np.uint32) & 0xFF).astype(np.uint8)
+    return frames
+
+
+@lru_cache(maxsize=None)
+def valid_write_addresses(generation: int) -> frozenset:
+    """Register addresses accepted by _write_register for a hardware generation."""
+    return frozenset((regdict_gen4 if generation == 4 else regdict).values())
+
+
+class SerialFrame(NamedTuple):
+    """A decoded protocol frame."""
+    hand_id: int
+    cmd: int
+    addr: int
+    data: bytes
+
+
+class _ReplyWaiter:
+    """A caller blocked on a reply frame delivered by the reader thread."""
+
+    __slots__ = ("key", "event", "frame")
+
+    def __init__(self, key: tuple):
+        self.key = key
+        self.event = threading.Event()
+        self.frame: Optional[SerialFrame] = None
+
+
+class FrameDecoder:
+    """Incremental decoder for the 0xEB 0x90 serial protocol.
+
+    Bytes are fed in as they arrive from the port and complete frames are
+    handed out by next_frame() as soon as the last byte is in. Garbage before
+    a header and frames with a bad checksum are skipped by resyncing on the
+    next header.
+    """
+
+    def __init__(self, headers: tuple = (REPLY_HEADER, FRAME_HEADER)):
+        self._buf = bytearray()
+        self._headers = headers
+        self.dropped_bytes = 0
+        self.checksum_errors = 0
+
+    def reset(self) -> None:
+        """Discard any buffered bytes."""
+        self._buf.clear()
+
+    def feed(self, data: bytes) -> None:
+        """Append received bytes to the decode buffer."""
+        if data:
+            self._buf += data
+
+    def bytes_needed(self) -> int:
+        """Number of bytes still missing for the frame currently being assembled."""
+        buf = self._buf
+        if len(buf) < 4:
+            return 4 - len(buf)
+        return max(1, buf[3] + FRAME_OVERHEAD - len(buf))
+
+    def _sync(self) -> bool:
+        """Drop bytes up to the next header. Returns True if the buffer starts with one."""
+        buf = self._buf
+        idx = -1
+        for header in self._headers:
+            pos = buf.find(header)
+            if pos >= 0 and (idx < 0 or pos < idx):
+                idx = pos
+        if idx < 0:
+            # Keep a trailing byte that may be the first half of a header
+            keep = 1 if buf and any(buf[-1] == h[0] for h in self._headers) else 0
+            drop = len(buf) - keep
+            if drop:
+                del buf[:drop]
+                self.dropped_bytes += drop
+            return False
+        if idx:
+            del buf[:idx]
+            self.dropped_bytes += idx
+        return True
+
+    def next_frame(self) -> Optional[SerialFrame]:
+        """Return the next complete frame, or None if more bytes are needed."""
+        buf = self._buf
+        while self._sync():
+            if len(buf) < 4:
+                return None
+            length = buf[3]
+            if length < MIN_FRAME_LEN:
+                del buf[:1]
+                self.dropped_bytes += 1
+                continue
+            total = length + FRAME_OVERHEAD
+            if len(buf) < total:
+                return None
+            if sum(buf[2:total - 1]) & 0xFF != buf[total - 1]:
+                self.checksum_errors += 1
+                del buf[:1]
+                self.dropped_bytes += 1
+                continue
+            frame = SerialFrame(buf[2], buf[4], buf[5] | (buf[6] << 8), bytes(buf[7:total - 1]))
+            del buf[:total]
+            return frame
+        return None
 
 
 class InspireHandSerial:
@@ -128,13 +402,40 @@ class InspireHandSerial:
     _baudrate: int
     _generation: int  # 3 for Gen3, 4 for Gen4
     _debug: bool  # Enable debug output for Gen4 compatibility
+    _timeout: float  # Deadline for a reply frame in seconds
+    _decoder: FrameDecoder
+    _templates: dict  # (hand_id, addr, length) -> FrameTemplate
+    _fire_and_forget: bool  # Return from writes without draining the ACK frame
 
-    def __init__(self, port: str = DEFAULT_PORT, baudrate: int = DEFAULT_BAUDRATE, generation: int = 3, debug: bool = False):
+    def __init__(self, port: str = DEFAULT_PORT, baudrate: int = DEFAULT_BAUDRATE, generation: int = 3, debug: bool = False,
+                 timeout: float = DEFAULT_TIMEOUT, fire_and_forget: bool = False,
+                 on_ack_failure: Optional[Callable[[int, int, str], None]] = None):
         self._port = port
         self._baudrate = baudrate
         self._generation = generation
         self._debug = debug
+        self._timeout = timeout
+        self._decoder = FrameDecoder()
+        self._templates = {}
         self._ser = None  # Initialize as None, will be created in connect()
+        # Serializes transactions so frames from different threads never interleave on the bus
+        self._bus_lock = threading.RLock()
+
+        # Fire-and-forget mode: a reader thread owns the receive side, matches
+        # ACKs to pending writes and hands read replies to blocked callers.
+        self._fire_and_forget = fire_and_forget
+        self._on_ack_failure = on_ack_failure
+        self._reader_thread: Optional[threading.Thread] = None
+        self._reader_running = False
+        self._ack_lock = threading.Lock()
+        self._pending_writes = collections.deque()  # (hand_id, addr, sent_at)
+        self._reply_waiters: list = []
+        self._ack_stats = {"sent": 0, "acked": 0, "nacked": 0, "timed_out": 0}
+        self._instrumentation = None  # TransactionInstrumentation while enabled
+        self._capture: Optional[FrameCapture] = None
+        self._diag = Diagnostics("serial")
+        self._validation_diag = Diagnostics("serial.validation")
+        self._diag.verbose = self._validation_diag.verbose = debug
 
     @property
     def _regdict(self) -> dict:
@@ -167,18 +468,22 @@ class InspireHandSerial:
 
     def connect(self) -> bool:
         try:
-            self._ser = serial.Serial(self._port, self._baudrate)
+            self._ser = serial.Serial(self._port, self._baudrate, timeout=REPLY_POLL_INTERVAL)
+            self._decoder.reset()
 
         except Exception as e:
             self._logger.error(
                 f"Failed to connect to {self._port} with baudrate {self._baudrate}: {e}"
             )
             return False
+        if self._fire_and_forget:
+            self._start_reader()
         return True
 
     def disconnect(self) -> bool:
         if self._ser:
             try:
+                self._stop_reader()
                 self._ser.close()
                 return True
             except Exception as e:
@@ -203,174 +508,306 @@ class InspireHandSerial:
 
     def set_angle(self, angles: npt.NDArray[np.integer], hand_id: int = 1) -> bool:
         """Set joint angles. Accepts numpy arrays only."""
-        if not isinstance(angles, np.ndarray):
-            raise TypeError("angles must be a numpy.ndarray")
-            
-        # Ensure array is 1D and convert to list of integers for serial processing
-        angles_flat = angles.flatten().astype(np.int32)
-        
-        if len(angles_flat) != 6:
-            raise ValueError(f"Expected 6 angle values, got {len(angles_flat)}")
-            
-        angles_list = angles_flat.tolist()
-        val_reg = []
-        for angle in angles_list:
-            val_reg.append(angle & 0xFF)
-            val_reg.append((angle >> 8) & 0xFF)
-
-        self._write_register(hand_id, self._regdict["ANGLE_SET"], 12, val_reg)
+        self._write_words(hand_id, self._regdict["ANGLE_SET"], encode_setpoints(angles, "angles"))
         return True
 
     def set_pos(self, positions: npt.NDArray[np.integer], hand_id: int = 1) -> bool:
         """Set joint positions. Accepts numpy arrays only."""
-        if not isinstance(positions, np.ndarray):
-            raise TypeError("positions must be a numpy.ndarray")
-            
-        # Ensure array is 1D and convert to list of integers for serial processing
-        positions_flat = positions.flatten().astype(np.int32)
-        
-        if len(positions_flat) != 6:
-            raise ValueError(f"Expected 6 position values, got {len(positions_flat)}")
-            
-        positions_list = positions_flat.tolist()
-        val_reg = []
-        for pos in positions_list:
-            val_reg.append(pos & 0xFF)
-            val_reg.append((pos >> 8) & 0xFF)
-
-        self._write_register(hand_id, self._regdict["ANGLE_SET"], 12, val_reg)
+        self._write_words(hand_id, self._regdict["ANGLE_SET"], encode_setpoints(positions, "positions"))
         return True
 
     def set_speed(self, speeds: npt.NDArray[np.integer], hand_id: int = 1) -> bool:
         """Set joint speeds. Accepts numpy arrays only."""
-        if not isinstance(speeds, np.ndarray):
-            raise TypeError("speeds must be a numpy.ndarray")
-            
-        # Ensure array is 1D and convert to list of integers for serial processing
-        speeds_flat = speeds.flatten().astype(np.int32)
-        
-        if len(speeds_flat) != 6:
-            raise ValueError(f"Expected 6 speed values, got {len(speeds_flat)}")
-            
-        speeds_list = speeds_flat.tolist()
-        val_reg = []
-        for speed in speeds_list:
-            val_reg.append(speed & 0xFF)
-            val_reg.append((speed >> 8) & 0xFF)
-
-        self._write_register(hand_id, self._regdict["SPEED_SET"], 12, val_reg)
+        self._write_words(hand_id, self._regdict["SPEED_SET"], encode_setpoints(speeds, "speeds"))
         return True
 
     def set_force(self, forces: npt.NDArray[np.integer], hand_id: int = 1) -> bool:
         """Set joint forces. Accepts numpy arrays only."""
-        if not isinstance(forces, np.ndarray):
-            raise TypeError("forces must be a numpy.ndarray")
-            
-        # Ensure array is 1D and convert to list of integers for serial processing
-        forces_flat = forces.flatten().astype(np.int32)
-        
-        if len(forces_flat) != 6:
-            raise ValueError(f"Expected 6 force values, got {len(forces_flat)}")
-            
-        forces_list = forces_flat.tolist()
-        val_reg = []
-        for force in forces_list:
-            val_reg.append(force & 0xFF)
-            val_reg.append((force >> 8) & 0xFF)
-
-        self._write_register(hand_id, self._regdict["FORCE_SET"], 12, val_reg)
+        self._write_words(hand_id, self._regdict["FORCE_SET"], encode_setpoints(forces, "forces"))
         return True
 
     
+    def _frame_template(self, id: int, addr: int, num: int) -> FrameTemplate:
+        """Get the cached write frame template for (id, addr, num)."""
+        key = (id, addr, num)
+        template = self._templates.get(key)
+        if template is None:
+            if addr not in valid_write_addresses(self._generation):
+                raise ValueError(f"Register address {addr} not valid for generation {self._generation}")
+            template = self._templates[key] = FrameTemplate(id, addr, num)
+        return template
+
     def _write_register(self, id: int, addr: int, num: int, val: list[int]) -> bool:
         """Write to a register with address validation"""
         if self._ser is None:
-            self._logger.error("Serial connection not established. Call connect() first.")
+            self._diag.error("Serial connection not established. Call connect() first.")
             return False
-            
-        # Validate register address exists in current generation
-        valid_addrs = set(self._regdict.values())
-        if addr not in valid_addrs:
-            raise ValueError(f"Register address {addr} not valid for generation {self._generation}")
-            
-        bytes = [0xEB, 0x90]
-        bytes.append(id)  # id
-        bytes.append(num + 3)  # len
-        bytes.append(0x12)  # cmd
-        bytes.append(addr & 0xFF)
-        bytes.append((addr >> 8) & 0xFF)  # add
-        for i in range(num):
-            bytes.append(val[i])
-        checksum = 0x00
-        for i in range(2, len(bytes)):
-            checksum += bytes[i]
-        checksum &= 0xFF
-        bytes.append(checksum)
-        
-        if self._debug:
-            self._logger.debug(f"Writing to register {addr} for hand {id}: {val}")
-            
-        self._ser.write(bytearray(bytes))
 
-        while self._ser.in_waiting > 0:
-            self._ser.read_all()  # 把返回帧读掉，不处理
-            time.sleep(0.01) # Give some time for the serial buffer to clear
+        self._diag.debug("Writing to register {} for hand {}: {}", addr, id, val)
+
+        tx = self._instrumentation.begin("write", addr, num) if self._instrumentation is not None else NULL_TRANSACTION
+        # Templates are shared buffers, fill and send under the bus lock
+        with self._bus_lock:
+            tx.mark("queue")
+            return self._send_write(self._frame_template(id, addr, num).fill(bytes(val[:num])), tx)
+
+    def _write_words(self, id: int, addr: int, values: npt.NDArray[np.integer]) -> bool:
+        """Write 16-bit values little-endian to consecutive register bytes"""
+        if self._ser is None:
+            self._diag.error("Serial connection not established. Call connect() first.")
+            return False
+
+        self._diag.debug("Writing to register {} for hand {}: {}", addr, id, values)
+
+        tx = self._instrumentation.begin("write", addr, 2 * len(values)) if self._instrumentation is not None else NULL_TRANSACTION
+        with self._bus_lock:
+            tx.mark("queue")
+            return self._send_write(self._frame_template(id, addr, 2 * len(values)).fill_words(values), tx)
+
+    def _send_write(self, frame: bytearray, tx: "Transaction" = NULL_TRANSACTION) -> bool:
+        with self._bus_lock:
+            tx.mark("encode")
+            if self._reader_thread is not None:
+                # Fire-and-forget: the reader thread consumes and checks the ACK
+                with self._ack_lock:
+                    self._pending_writes.append((frame[2], frame[5] | (frame[6] << 8), time.monotonic()))
+                    self._ack_stats["sent"] += 1
+                self._ser.write(frame)
+                if self._capture is not None:
+                    self._capture.capture(CAPTURE_TX, frame)
+                tx.mark("send")
+                tx.finish(True, frame[3] - MIN_FRAME_LEN)
+                return True
+
+            self._ser.write(frame)
+            tx.mark("send")
+            if self._capture is not None:
+                self._capture.capture(CAPTURE_TX, frame)
+
+            while self._ser.in_waiting > 0:
+                ack = self._ser.read_all()  # 把返回帧读掉，不处理
+                if self._capture is not None and ack:
+                    self._capture.capture(CAPTURE_RX, ack)
+                time.sleep(0.01) # Give some time for the serial buffer to clear
+            tx.mark("wait")
+            tx.finish(True, frame[3] - MIN_FRAME_LEN)
 
         return True
 
     def _read_register(self, id: int, addr: int, num: int) -> list[int]:
         """Read from a register with improved error handling"""
         if self._ser is None:
-            self._logger.error("Serial connection not established. Call connect() first.")
+            self._diag.error("Serial connection not established. Call connect() first.")
             return []
             
-        bytes = [0xEB, 0x90]
-        bytes.append(id)  # id
-        bytes.append(0x04)  # len
-        bytes.append(0x11)  # cmd
-        bytes.append(addr & 0xFF)
-        bytes.append((addr >> 8) & 0xFF)  # add
-        bytes.append(num)
-        checksum = 0x00
-        for i in range(2, len(bytes)):
-            checksum += bytes[i]
-        checksum &= 0xFF
-        bytes.append(checksum)
-        
-        if self._debug:
-            self._logger.debug(f"Reading {num} bytes from register {addr} for hand {id}")
-            
-        self._ser.write(bytearray(bytes))
+        tx = self._instrumentation.begin("read", addr, num) if self._instrumentation is not None else NULL_TRANSACTION
+        request = build_frame(id, CMD_READ, addr, bytes((num,)))
+        tx.mark("encode")
 
-        time.sleep(0.01)
-        recv = self._ser.read_all()
+        self._diag.debug("Reading {} bytes from register {} for hand {}", num, addr, id)
 
-        if recv is None or len(recv) == 0:
-            if self._debug:
-                self._logger.warning(f"Failed to fetch data from register {addr} for hand {id}")
-            return []
-            
-        # Improved data validation
-        if len(recv) < 7:  # Minimum frame size
-            if self._debug:
-                self._logger.warning(f"Fetched data is too short: {len(recv)} bytes")
+        with self._bus_lock:
+            tx.mark("queue")
+            # Register before writing so the reader thread cannot miss a fast reply
+            waiter = self._add_reply_waiter(id, CMD_READ, addr) if self._reader_thread is not None else None
+            self._ser.write(request)
+            tx.mark("send")
+            if self._capture is not None:
+                self._capture.capture(CAPTURE_TX, request)
+
+            frame = self._read_reply(id, CMD_READ, addr, waiter=waiter)
+            tx.mark("wait")
+        if frame is None:
+            tx.finish(False)
+            self._diag.debug("Failed to fetch data from register {} for hand {}", addr, id)
             return []
-            
-        num_received = (recv[3] & 0xFF) - 3
-        if num_received != num:
-            if self._debug:
-                self._logger.warning(f"Expected to have {num} bytes, but received {num_received} bytes")
-                
-        val = []
-        actual_data_len = min(num_received, len(recv) - 7)
-        for i in range(actual_data_len):
-            val.append(recv[7 + i])
 
-        if self._debug:
-            self._logger.debug(f"Read {actual_data_len} values from register {addr}: {val}")
+        if len(frame.data) != num:
+            self._diag.debug("Expected to have {} bytes, but received {} bytes", num, len(frame.data))
+
+        val = list(frame.data)
+        tx.mark("decode")
+        tx.finish(True, len(val))
+
+        self._diag.debug("Read {} values from register {}: {}", len(val), addr, val)
 
         return val
 
+    def _read_reply(self, id: int, cmd: int, addr: int, timeout: Optional[float] = None,
+                    waiter: Optional[_ReplyWaiter] = None) -> Optional[SerialFrame]:
+        """Wait for the reply frame matching (id, cmd, addr).
+
+        Returns as soon as the frame is complete, or None once the deadline
+        passes. Unrelated frames (e.g. late write acknowledgements) are skipped.
+        With the reader thread running, the frame is delivered through waiter.
+        """
+        if waiter is not None:
+            if waiter.event.wait(self._timeout if timeout is None else timeout):
+                return waiter.frame
+            with self._ack_lock:
+                if waiter in self._reply_waiters:
+                    self._reply_waiters.remove(waiter)
+            return waiter.frame
+
+        deadline = time.monotonic() + (self._timeout if timeout is None else timeout)
+        decoder = self._decoder
+        while True:
+            frame = decoder.next_frame()
+            if frame is not None:
+                if frame.hand_id == id and frame.cmd == cmd and frame.addr == addr:
+                    return frame
+                self._diag.debug("Skipping unexpected frame: hand {}, cmd 0x{:02X}, addr {}", frame.hand_id, frame.cmd, frame.addr)
+                continue
+
+            if time.monotonic() >= deadline:
+                return None
+            data = self._ser.read(decoder.bytes_needed())
+            if self._capture is not None and data:
+                self._capture.capture(CAPTURE_RX, data)
+            decoder.feed(data)
+
+    def _add_reply_waiter(self, id: int, cmd: int, addr: int) -> _ReplyWaiter:
+        waiter = _ReplyWaiter((id, cmd, addr))
+        with self._ack_lock:
+            self._reply_waiters.append(waiter)
+        return waiter
+
+    def _start_reader(self) -> None:
+        if self._reader_thread is not None or self._ser is None:
+            return
+        # Short port timeout so the thread notices expired ACKs and stop requests
+        self._ser.timeout = READER_POLL_INTERVAL
+        self._reader_running = True
+        self._reader_thread = threading.Thread(target=self._reader_loop, name="inspire-serial-reader", daemon=True)
+        self._reader_thread.start()
+
+    def _stop_reader(self) -> None:
+        if self._reader_thread is None:
+            return
+        self._reader_running = False
+        self._reader_thread.join()
+        self._reader_thread = None
+        if self._ser is not None:
+            self._ser.timeout = REPLY_POLL_INTERVAL
+
+    def _reader_loop(self) -> None:
+        """Consume every received frame: check write ACKs and deliver read replies."""
+        ser = self._ser
+        decoder = self._decoder
+        while self._reader_running:
+            try:
+                data = ser.read(ser.in_waiting or 1)
+            except (serial.SerialException, OSError) as e:
+                self._logger.error(f"Serial reader stopped on {self._port}: {e}")
+                break
+            if data:
+                if self._capture is not None:
+                    self._capture.capture(CAPTURE_RX, data)
+                decoder.feed(data)
+                while True:
+                    frame = decoder.next_frame()
+                    if frame is None:
+                        break
+                    self._dispatch_frame(frame)
+            self._expire_pending_writes()
+
+    def _dispatch_frame(self, frame: SerialFrame) -> None:
+        key = (frame.hand_id, frame.cmd, frame.addr)
+        failure = None
+        with self._ack_lock:
+            for waiter in self._reply_waiters:
+                if waiter.key == key:
+                    self._reply_waiters.remove(waiter)
+                    waiter.frame = frame
+                    waiter.event.set()
+                    return
+            if frame.cmd == CMD_WRITE:
+                for entry in self._pending_writes:
+                    if entry[0] == frame.hand_id and entry[1] == frame.addr:
+                        self._pending_writes.remove(entry)
+                        if frame.data[:1] == b"\x01":
+                            self._ack_stats["acked"] += 1
+                        else:
+                            self._ack_stats["nacked"] += 1
+                            failure = (frame.hand_id, frame.addr, "nack")
+                        break
+        if failure is not None:
+            self._report_ack_failure(*failure)
+        elif frame.cmd != CMD_WRITE:
+            self._diag.debug("Skipping unexpected frame: hand {}, cmd 0x{:02X}, addr {}", frame.hand_id, frame.cmd, frame.addr)
+
+    def _expire_pending_writes(self) -> None:
+        expired = []
+        deadline = time.monotonic() - self._timeout
+        with self._ack_lock:
+            while self._pending_writes and self._pending_writes[0][2] < deadline:
+                hand_id, addr, _ = self._pending_writes.popleft()
+                self._ack_stats["timed_out"] += 1
+                expired.append((hand_id, addr))
+        for hand_id, addr in expired:
+            self._report_ack_failure(hand_id, addr, "timeout")
+
+    def _report_ack_failure(self, hand_id: int, addr: int, reason: str) -> None:
+        self._diag.debug("Write to register {} for hand {} not acknowledged: {}", addr, hand_id, reason)
+        if self._on_ack_failure is not None:
+            try:
+                self._on_ack_failure(hand_id, addr, reason)
+            except Exception as e:
+                self._logger.error(f"ACK failure callback raised: {e}")
+
+    def set_fire_and_forget(self, enabled: bool, on_ack_failure: Optional[Callable[[int, int, str], None]] = None) -> None:
+        """Enable or disable fire-and-forget writes.
+
+        When enabled, writes return right after the frame is sent. A reader
+        thread consumes the ACK frames, matches them to pending writes and
+        reports failures ("nack" or "timeout") through on_ack_failure(hand_id,
+        addr, reason), called from the reader thread, and get_ack_stats().
+        """
+        if on_ack_failure is not None:
+            self._on_ack_failure = on_ack_failure
+        self._fire_and_forget = enabled
+        if enabled:
+            self._start_reader()
+        else:
+            self._stop_reader()
+
+    def get_ack_stats(self) -> dict[str, int]:
+        """Get fire-and-forget write counters (sent, acked, nacked, timed_out, pending)"""
+        with self._ack_lock:
+            stats = dict(self._ack_stats)
+            stats["pending"] = len(self._pending_writes)
+        return stats
+
+    def enable_instrumentation(self, instrumentation: Optional["TransactionInstrumentation"] = None) -> "TransactionInstrumentation":
+        """Record per-transaction phase timings (queue, encode, send, wait, decode, convert).
+
+        Args:
+            instrumentation: Collector to record into, e.g. one shared by several hands; a new one if omitted
+
+        Returns:
+            TransactionInstrumentation: The active collector, see snapshot() and to_prometheus()
+        """
+        from inspire_demos.inspire_instrumentation import TransactionInstrumentation
+
+        self._instrumentation = instrumentation or TransactionInstrumentation("serial")
+        return self._instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """Stop recording transaction timings"""
+        self._instrumentation = None
+
+    def get_instrumentation(self) -> Optional["TransactionInstrumentation"]:
+        """Get the active TransactionInstrumentation, or None while disabled"""
+        return self._instrumentation
+
+    def get_timeout(self) -> float:
+        """Get the reply deadline in seconds"""
+        return self._timeout
+
+    def set_timeout(self, timeout: float) -> None:
+        """Set the reply deadline in seconds"""
+        self._timeout = timeout
+
     def _read6(self, id: int, reg_name: str) -> list[int]:
         """Read 6 bytes from a named register"""
         if reg_name not in self._regdict:
@@ -380,12 +817,13 @@ class InspireHandSerial:
         val_act = self._read_register(id, self._regdict[reg_name], length)
         
         if val_act is None or len(val_act) < length:
-            if self._debug:
-                self._logger.warning(f"Failed to fetch data from {reg_name} for hand {id}")
+            self._diag.debug("Failed to fetch data from {} for hand {}", reg_name, id)
             return []
+        if self._instrumentation is not None:
+            # Bytes are returned as they are; recorded so every register has a convert phase on both transports
+            self._instrumentation.record_phase(self._regdict[reg_name], "read", "convert", 0, length)
             
-        if self._debug:
-            self._logger.info(f"Read {reg_name}: {' '.join(map(str, val_act))}")
+        self._diag.debug("Read {}: {}", reg_name, val_act)
 
         return val_act
 
@@ -398,17 +836,18 @@ class InspireHandSerial:
         val = self._read_register(id, self._regdict[reg_name], length)
         
         if len(val) < length:
-            if self._debug:
-                self._logger.warning(f"Failed to fetch data from {reg_name} for hand {id}")
+            self._diag.debug("Failed to fetch data from {} for hand {}", reg_name, id)
             return []
             
         # Convert pairs of bytes to 16-bit values
+        start = time.perf_counter_ns() if self._instrumentation is not None else 0
         val_act = []
         for i in range(length // 2):
             val_act.append((val[2 * i] & 0xFF) + (val[1 + 2 * i] << 8))
+        if self._instrumentation is not None:
+            self._instrumentation.record_phase(self._regdict[reg_name], "read", "convert", time.perf_counter_ns() - start, length)
             
-        if self._debug:
-            self._logger.info(f"Read {reg_name}: {' '.join(map(str, val_act))}")
+        self._diag.debug("Read {}: {}", reg_name, val_act)
 
         return val_act
 
@@ -466,6 +905,37 @@ class InspireHandSerial:
         """Get current position as numpy array (alias for get_pos_actual)."""
         return self.get_pos_actual(hand_id)
 
+    def _read_block(self, id: int, addr: int, num: int) -> bytes:
+        """Read num bytes starting at addr, split into as few frames as the protocol allows."""
+        out = bytearray()
+        for chunk_addr, chunk in read_chunks(addr, num):
+            val = self._read_register(id, chunk_addr, chunk)
+            if len(val) != chunk:
+                return b""
+            out += bytes(val)
+        return bytes(out)
+
+    def read_state(self, hand_id: int = 1) -> Optional[HandState]:
+        """Read position, angle, force, current, error, status and temperature in one pass.
+
+        The whole POS_ACT..TEMP window (bytes 1534-1623) is fetched in a single
+        frame instead of one round trip per getter.
+
+        Returns:
+            HandState: Decoded snapshot, or None if the read failed
+        """
+        timestamp = time.time()
+        window = self._read_block(hand_id, STATE_WINDOW_START, STATE_WINDOW_LEN)
+        if not window:
+            self._diag.debug("Failed to read state window for hand {}", hand_id)
+            return None
+        if self._instrumentation is None:
+            return decode_state_window(window, timestamp)
+        start = time.perf_counter_ns()
+        state = decode_state_window(window, timestamp)
+        self._instrumentation.record_phase(STATE_WINDOW_START, "read", "convert", time.perf_counter_ns() - start, STATE_WINDOW_LEN)
+        return state
+
     def set_action_sequence(self, hand_id: int, sequence_id: int) -> bool:
         """Set the action sequence for Gen4 compatibility"""
         return self._write_register(hand_id, self._regdict["ACTION_SEQ_INDEX"], 1, [sequence_id])
@@ -479,8 +949,29 @@ class InspireHandSerial:
         return self._generation
 
     def set_debug(self, debug: bool) -> None:
-        """Enable or disable debug output"""
+        """Enable or disable debug output (DEBUG level for this hand's diagnostics)"""
         self._debug = debug
+        self._diag.verbose = self._validation_diag.verbose = debug
+
+    def enable_frame_capture(self, capture: Optional[FrameCapture] = None, slots: int = 1024) -> FrameCapture:
+        """Keep the raw frames sent and received in a ring buffer.
+
+        Args:
+            capture: Ring to record into, e.g. one shared by several hands; a new one with slots entries if omitted
+
+        Returns:
+            FrameCapture: The active ring, see frames(), format() and dump()
+        """
+        self._capture = capture or FrameCapture(slots)
+        return self._capture
+
+    def disable_frame_capture(self) -> None:
+        """Stop capturing frames"""
+        self._capture = None
+
+    def get_frame_capture(self) -> Optional[FrameCapture]:
+        """Get the active FrameCapture, or None while disabled"""
+        return self._capture
 
     def validate_register_addresses(self, hand_id: int = 1) -> dict[str, bool]:
         """
@@ -500,12 +991,12 @@ class InspireHandSerial:
             "CURRENT", "ERROR", "STATUS", "TEMP"
         ]
         
-        self._logger.info("Validating register addresses for hardware compatibility...")
+        self._validation_diag.info("Validating register addresses for hardware compatibility...")
         
         for reg_name in test_registers:
             if reg_name not in self._regdict:
                 validation_results[reg_name] = False
-                self._logger.warning(f"Register '{reg_name}' not found in generation {self._generation} dictionary")
+                self._validation_diag.warning("Register '{}' not found in generation {} dictionary", reg_name, self._generation)
                 continue
                 
             try:
@@ -518,21 +1009,21 @@ class InspireHandSerial:
                 validation_results[reg_name] = len(result) > 0
                 
                 if validation_results[reg_name]:
-                    self._logger.debug(f"✓ Register '{reg_name}' (addr: {self._regdict[reg_name]}) is readable")
+                    self._validation_diag.debug("✓ Register '{}' (addr: {}) is readable", reg_name, self._regdict[reg_name])
                 else:
-                    self._logger.warning(f"✗ Register '{reg_name}' (addr: {self._regdict[reg_name]}) failed to read")
+                    self._validation_diag.warning("✗ Register '{}' (addr: {}) failed to read", reg_name, self._regdict[reg_name])
                     
             except Exception as e:
                 validation_results[reg_name] = False
-                self._logger.error(f"✗ Register '{reg_name}' (addr: {self._regdict[reg_name]}) validation failed: {e}")
+                self._validation_diag.error("✗ Register '{}' (addr: {}) validation failed: {}", reg_name, self._regdict[reg_name], e)
                 
         successful_validations = sum(validation_results.values())
         total_validations = len(validation_results)
         
-        self._logger.info(f"Register validation complete: {successful_validations}/{total_validations} registers accessible")
+        self._validation_diag.info("Register validation complete: {}/{} registers accessible", successful_validations, total_validations)
         
         if successful_validations < total_validations:
-            self._logger.warning("Some registers failed validation. Consider verifying addresses with manufacturer.")
+            self._validation_diag.warning("Some registers failed validation. Consider verifying addresses with manufacturer.")
             
         return validation_results
 
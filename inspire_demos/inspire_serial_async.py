@@ -0,0 +1,403 @@
+"""
+Asyncio serial interface for the Inspire Hand.
+
+AsyncInspireHandSerial speaks the same 0xEB 0x90 protocol as InspireHandSerial
+but never blocks the event loop: the port is opened non-blocking, received
+bytes are fed to a FrameDecoder from an event-loop reader callback and each
+request awaits its own reply frame. Serial and Modbus hands can then be
+multiplexed on one loop.
+"""
+
+import asyncio
+import collections
+import time
+from typing import TYPE_CHECKING, Deque, List, Optional, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+import serial
+from loguru import logger
+
+from inspire_demos.inspire_diagnostics import Diagnostics
+from inspire_demos.inspire_instrumentation import NULL_TRANSACTION
+from inspire_demos.inspire_serial import (
+    CMD_READ,
+    CMD_WRITE,
+    DEFAULT_BAUDRATE,
+    DEFAULT_PORT,
+    DEFAULT_TIMEOUT,
+    STATE_WINDOW_LEN,
+    STATE_WINDOW_START,
+    FrameDecoder,
+    FrameTemplate,
+    HandState,
+    SerialFrame,
+    build_frame,
+    decode_state_window,
+    encode_setpoints,
+    read_chunks,
+    regdict,
+    regdict_gen4,
+    setpoint_payload,
+    valid_write_addresses,
+)
+
+if TYPE_CHECKING:
+    from inspire_demos.inspire_instrumentation import Transaction, TransactionInstrumentation
+
+POLL_INTERVAL = 0.001  # Fallback polling period where the loop cannot watch the fd
+WRITE_ACK_TIMEOUT = 0.02  # Turnaround allowed for a write ACK before the bus is released anyway
+
+
+class AsyncInspireHandSerial:
+    """Asyncio serial interface for Inspire Hand control"""
+
+    _logger = logger
+    _ser: serial.Serial
+    _port: str
+    _baudrate: int
+    _generation: int  # 3 for Gen3, 4 for Gen4
+    _debug: bool
+    _timeout: float  # Deadline for a reply frame in seconds
+
+    def __init__(self, port: str = DEFAULT_PORT, baudrate: int = DEFAULT_BAUDRATE, generation: int = 3, debug: bool = False,
+                 timeout: float = DEFAULT_TIMEOUT):
+        self._port = port
+        self._baudrate = baudrate
+        self._generation = generation
+        self._debug = debug
+        self._timeout = timeout
+        self._ser = None
+        self._decoder = FrameDecoder()
+        self._templates = {}
+        self._waiters: Deque[Tuple[Tuple[int, int, int], asyncio.Future]] = collections.deque()
+        self._bus_lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._instrumentation = None  # TransactionInstrumentation while enabled
+        self._diag = Diagnostics("serial")
+        self._diag.verbose = debug
+
+    @property
+    def _regdict(self) -> dict:
+        """Get the appropriate register dictionary based on generation"""
+        if self._generation == 4:
+            return regdict_gen4
+        else:
+            return regdict
+
+    async def connect(self) -> bool:
+        """Open the port non-blocking and start watching it on the running loop."""
+        try:
+            self._ser = serial.Serial(self._port, self._baudrate, timeout=0)
+        except Exception as e:
+            self._logger.error(f"Failed to connect to {self._port} with baudrate {self._baudrate}: {e}")
+            return False
+
+        self._loop = asyncio.get_running_loop()
+        self._bus_lock = asyncio.Lock()
+        self._decoder.reset()
+        try:
+            self._loop.add_reader(self._ser.fileno(), self._on_readable)
+        except (NotImplementedError, AttributeError):
+            # e.g. the Windows proactor loop cannot watch serial handles
+            self._poll_task = self._loop.create_task(self._poll_port())
+        return True
+
+    async def disconnect(self) -> bool:
+        """Stop watching the port and close it."""
+        if self._ser is None:
+            return True
+        try:
+            if self._poll_task is not None:
+                self._poll_task.cancel()
+                self._poll_task = None
+            else:
+                self._loop.remove_reader(self._ser.fileno())
+            self._ser.close()
+        except Exception as e:
+            self._logger.error(f"Failed to disconnect from {self._port}: {e}")
+            return False
+        finally:
+            for _, future in self._waiters:
+                if not future.done():
+                    future.cancel()
+            self._waiters.clear()
+            self._ser = None
+        return True
+
+    def _on_readable(self) -> None:
+        try:
+            data = self._ser.read(self._ser.in_waiting or 1)
+        except serial.SerialException as e:
+            self._logger.error(f"Serial read failed on {self._port}: {e}")
+            return
+        self._dispatch(data)
+
+    async def _poll_port(self) -> None:
+        while True:
+            waiting = self._ser.in_waiting
+            if waiting:
+                self._dispatch(self._ser.read(waiting))
+            await asyncio.sleep(POLL_INTERVAL)
+
+    def _dispatch(self, data: bytes) -> None:
+        """Decode received bytes and resolve the waiter for each complete frame."""
+        self._decoder.feed(data)
+        while True:
+            frame = self._decoder.next_frame()
+            if frame is None:
+                return
+            key = (frame.hand_id, frame.cmd, frame.addr)
+            for entry in self._waiters:
+                if entry[0] == key and not entry[1].done():
+                    entry[1].set_result(frame)
+                    self._waiters.remove(entry)
+                    break
+            else:
+                self._diag.debug("Skipping unexpected frame: hand {}, cmd 0x{:02X}, addr {}", frame.hand_id, frame.cmd, frame.addr)
+
+    async def _transact(self, hand_id: int, cmd: int, addr: int, request: bytes, timeout: float,
+                        tx: "Transaction" = NULL_TRANSACTION) -> Optional[SerialFrame]:
+        """Send one frame and await the reply with the same (hand, cmd, addr), holding the bus meanwhile.
+
+        Writes wait for their ACK too, so the next request never goes out while
+        the hand is still answering the previous one.
+
+        Returns:
+            SerialFrame: The reply, or None if none arrived within timeout seconds
+        """
+        if self._ser is None:
+            self._diag.error("Serial connection not established. Call connect() first.")
+            return None
+
+        async with self._bus_lock:
+            tx.mark("queue")
+            future = self._loop.create_future()
+            entry = ((hand_id, cmd, addr), future)
+            self._waiters.append(entry)
+            self._ser.write(request)
+            tx.mark("send")
+            try:
+                frame = await asyncio.wait_for(future, timeout)
+                tx.mark("wait")
+                return frame
+            except asyncio.TimeoutError:
+                self._diag.debug("Timed out waiting for reply from register {} for hand {}", addr, hand_id)
+                return None
+            finally:
+                # Also on cancellation; a resolved entry was already removed by the dispatcher
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+
+    async def _write_register(self, id: int, addr: int, num: int, val: Union[bytes, List[int]]) -> bool:
+        """Write to a register with address validation"""
+        if self._ser is None:
+            self._diag.error("Serial connection not established. Call connect() first.")
+            return False
+
+        key = (id, addr, num)
+        template = self._templates.get(key)
+        if template is None:
+            if addr not in valid_write_addresses(self._generation):
+                raise ValueError(f"Register address {addr} not valid for generation {self._generation}")
+            template = self._templates[key] = FrameTemplate(id, addr, num)
+
+        self._diag.debug("Writing to register {} for hand {}: {}", addr, id, val)
+
+        tx = self._instrumentation.begin("write", addr, num) if self._instrumentation is not None else NULL_TRANSACTION
+        # Copy the frame out of the shared template: another coroutine may refill
+        # it while this one waits for the bus. A missing ACK only releases the
+        # bus after WRITE_ACK_TIMEOUT; like the blocking client, the write still
+        # counts as sent.
+        request = bytes(template.fill(bytes(val[:num])))
+        tx.mark("encode")
+        ack = await self._transact(id, CMD_WRITE, addr, request, WRITE_ACK_TIMEOUT, tx)
+        if ack is not None and ack.data[:1] != b"\x01":
+            self._diag.debug("Write to register {} for hand {} not acknowledged: nack", addr, id)
+        tx.finish(True, num)
+        return True
+
+    async def _read_register(self, id: int, addr: int, num: int) -> List[int]:
+        """Read num bytes from a register, returning an empty list on timeout."""
+        self._diag.debug("Reading {} bytes from register {} for hand {}", num, addr, id)
+
+        tx = self._instrumentation.begin("read", addr, num) if self._instrumentation is not None else NULL_TRANSACTION
+        request = build_frame(id, CMD_READ, addr, bytes((num,)))
+        tx.mark("encode")
+        frame = await self._transact(id, CMD_READ, addr, request, self._timeout, tx)
+        if frame is None:
+            tx.finish(False)
+            return []
+        if len(frame.data) != num:
+            self._diag.debug("Expected to have {} bytes, but received {} bytes", num, len(frame.data))
+        val = list(frame.data)
+        tx.mark("decode")
+        tx.finish(True, len(val))
+        return val
+
+    async def _read6(self, id: int, reg_name: str) -> List[int]:
+        """Read 6 bytes from a named register"""
+        if reg_name not in self._regdict:
+            raise ValueError(f"Register '{reg_name}' not valid for generation {self._generation}")
+
+        val = await self._read_register(id, self._regdict[reg_name], 6)
+        if len(val) < 6:
+            return []
+        if self._instrumentation is not None:
+            # Bytes are returned as they are; recorded so every register has a convert phase on both transports
+            self._instrumentation.record_phase(self._regdict[reg_name], "read", "convert", 0, 6)
+        return val
+
+    async def _read12(self, id: int, reg_name: str) -> List[int]:
+        """Read 12 bytes from a named register and convert to 6 16-bit values"""
+        if reg_name not in self._regdict:
+            raise ValueError(f"Register '{reg_name}' not valid for generation {self._generation}")
+
+        val = await self._read_register(id, self._regdict[reg_name], 12)
+        if len(val) < 12:
+            return []
+        if self._instrumentation is None:
+            return np.frombuffer(bytes(val), dtype="<u2").tolist()
+        start = time.perf_counter_ns()
+        values = np.frombuffer(bytes(val), dtype="<u2").tolist()
+        self._instrumentation.record_phase(self._regdict[reg_name], "read", "convert", time.perf_counter_ns() - start, 12)
+        return values
+
+    async def _read_block(self, id: int, addr: int, num: int) -> bytes:
+        """Read num bytes starting at addr, split into as few frames as the protocol allows."""
+        out = bytearray()
+        for chunk_addr, chunk in read_chunks(addr, num):
+            val = await self._read_register(id, chunk_addr, chunk)
+            if len(val) != chunk:
+                return b""
+            out += bytes(val)
+        return bytes(out)
+
+    async def reset_error(self) -> bool:
+        return await self._write_register(1, self._regdict["CLEAR_ERROR"], 1, [0x01])
+
+    async def return_to_zero(self) -> bool:
+        """Return all joints to zero position."""
+        return await self.set_angle(np.array([0, 0, 0, 0, 0, 0], dtype=np.int32))
+
+    async def perform_open(self) -> bool:
+        """Open the hand (set all joints to maximum position)."""
+        return await self.set_angle(np.array([1000, 1000, 1000, 1000, 1000, 1000], dtype=np.int32))
+
+    async def perform_close(self) -> bool:
+        """Close the hand (set all joints to zero position)."""
+        return await self.set_angle(np.array([0, 0, 0, 0, 0, 0], dtype=np.int32))
+
+    async def set_angle(self, angles: npt.NDArray[np.integer], hand_id: int = 1) -> bool:
+        """Set joint angles. Accepts numpy arrays only."""
+        return await self._write_register(hand_id, self._regdict["ANGLE_SET"], 12, setpoint_payload(encode_setpoints(angles, "angles")))
+
+    async def set_pos(self, positions: npt.NDArray[np.integer], hand_id: int = 1) -> bool:
+        """Set joint positions. Accepts numpy arrays only."""
+        return await self._write_register(hand_id, self._regdict["ANGLE_SET"], 12, setpoint_payload(encode_setpoints(positions, "positions")))
+
+    async def set_speed(self, speeds: npt.NDArray[np.integer], hand_id: int = 1) -> bool:
+        """Set joint speeds. Accepts numpy arrays only."""
+        return await self._write_register(hand_id, self._regdict["SPEED_SET"], 12, setpoint_payload(encode_setpoints(speeds, "speeds")))
+
+    async def set_force(self, forces: npt.NDArray[np.integer], hand_id: int = 1) -> bool:
+        """Set joint forces. Accepts numpy arrays only."""
+        return await self._write_register(hand_id, self._regdict["FORCE_SET"], 12, setpoint_payload(encode_setpoints(forces, "forces")))
+
+    async def get_angle_actual(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get actual joint angles as numpy array."""
+        return np.array(await self._read12(hand_id, "ANGLE_ACT"), dtype=np.int32)
+
+    async def get_angle_set(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get set joint angles as numpy array."""
+        return np.array(await self._read12(hand_id, "ANGLE_SET"), dtype=np.int32)
+
+    async def get_pos_actual(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get actual joint positions as numpy array."""
+        return np.array(await self._read12(hand_id, "ANGLE_ACT"), dtype=np.int32)
+
+    async def get_pos_set(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get set joint positions as numpy array."""
+        return np.array(await self._read12(hand_id, "ANGLE_SET"), dtype=np.int32)
+
+    async def get_speed_set(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get set joint speeds as numpy array."""
+        return np.array(await self._read12(hand_id, "SPEED_SET"), dtype=np.int32)
+
+    async def get_force_actual(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get actual joint forces as numpy array."""
+        return np.array(await self._read12(hand_id, "FORCE_ACT"), dtype=np.int32)
+
+    async def get_force_set(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get set joint forces as numpy array."""
+        return np.array(await self._read12(hand_id, "FORCE_SET"), dtype=np.int32)
+
+    async def get_current_actual(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get actual current values as numpy array."""
+        return np.array(await self._read6(hand_id, "CURRENT"), dtype=np.int32)
+
+    async def get_error(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get error codes as numpy array."""
+        return np.array(await self._read6(hand_id, "ERROR"), dtype=np.int32)
+
+    async def get_temp(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get temperature values as numpy array."""
+        return np.array(await self._read6(hand_id, "TEMP"), dtype=np.int32)
+
+    async def get_pos(self, hand_id: int = 1) -> npt.NDArray[np.int32]:
+        """Get current position as numpy array (alias for get_pos_actual)."""
+        return await self.get_pos_actual(hand_id)
+
+    async def read_state(self, hand_id: int = 1) -> Optional[HandState]:
+        """Read the POS_ACT..TEMP status window in one frame, see InspireHandSerial.read_state."""
+        timestamp = time.time()
+        window = await self._read_block(hand_id, STATE_WINDOW_START, STATE_WINDOW_LEN)
+        if not window:
+            self._diag.debug("Failed to read state window for hand {}", hand_id)
+            return None
+        if self._instrumentation is None:
+            return decode_state_window(window, timestamp)
+        start = time.perf_counter_ns()
+        state = decode_state_window(window, timestamp)
+        self._instrumentation.record_phase(STATE_WINDOW_START, "read", "convert", time.perf_counter_ns() - start, STATE_WINDOW_LEN)
+        return state
+
+    async def set_action_sequence(self, hand_id: int, sequence_id: int) -> bool:
+        """Set the action sequence for Gen4 compatibility"""
+        return await self._write_register(hand_id, self._regdict["ACTION_SEQ_INDEX"], 1, [sequence_id])
+
+    async def run_action_sequence(self, hand_id: int) -> bool:
+        """Run the current action sequence for Gen4 compatibility"""
+        return await self._write_register(hand_id, self._regdict["ACTION_SEQ_RUN"], 1, [1])
+
+    def get_generation(self) -> int:
+        """Get the hardware generation (3 or 4)"""
+        return self._generation
+
+    def set_debug(self, debug: bool) -> None:
+        """Enable or disable debug output (DEBUG level for this hand's diagnostics)"""
+        self._debug = debug
+        self._diag.verbose = debug
+
+    def enable_instrumentation(self, instrumentation: Optional["TransactionInstrumentation"] = None) -> "TransactionInstrumentation":
+        """Record per-transaction phase timings (queue, encode, send, wait, decode, convert).
+
+        Args:
+            instrumentation: Collector to record into, e.g. one shared by several hands; a new one if omitted
+
+        Returns:
+            TransactionInstrumentation: The active collector, see snapshot() and to_prometheus()
+        """
+        from inspire_demos.inspire_instrumentation import TransactionInstrumentation
+
+        self._instrumentation = instrumentation or TransactionInstrumentation("serial")
+        return self._instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """Stop recording transaction timings"""
+        self._instrumentation = None
+
+    def get_instrumentation(self) -> Optional["TransactionInstrumentation"]:
+        """Get the active TransactionInstrumentation, or None while disabled"""
+        return self._instrumentation
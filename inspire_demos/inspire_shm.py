@@ -0,0 +1,241 @@
+"""
+Shared-memory ring buffer for tactile frames.
+
+One acquisition process reads the hand and writes every sweep into a
+multiprocessing.shared_memory block; visualizers, recorders and inference
+processes attach by name and read the newest frame or the last N frames as
+NumPy views, without a Modbus connection of their own and without copies.
+
+Each slot carries a sequence number and a timestamp. The writer clears the
+slot sequence before touching the data and publishes the new sequence last
+(a per-slot seqlock), so a reader can tell whether a view was overwritten
+while it used it by calling TactileRingReader.is_current().
+"""
+
+import os
+import threading
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, List, NamedTuple, Optional
+
+import numpy as np
+import numpy.typing as npt
+from loguru import logger
+
+from inspire_demos.inspire_tactile import TACTILE_SPAN, TactileData, TactileFrame, decode_tactile
+
+RING_MAGIC = 0x52544E49  # "INTR"
+RING_VERSION = 1
+DEFAULT_RING_SLOTS = 64
+
+_created_names = set()  # Rings created by TactileRingWriter in this process
+
+_HEADER_DTYPE = np.dtype([
+    ("magic", "<u4"),
+    ("version", "<u4"),
+    ("slots", "<u4"),
+    ("span", "<u4"),
+    ("head", "<u8"),  # Sequence of the newest complete frame, 0 while empty
+])
+_SLOT_DTYPE = np.dtype([
+    ("seq", "<u8"),  # 0 while the slot is being written
+    ("timestamp", "<f8"),
+    ("data", "<u2", (TACTILE_SPAN,)),  # Raw sweep from address 3000
+])
+
+
+class RingFrame(NamedTuple):
+    """One tactile frame in the ring; buffer and data are views into shared memory."""
+    sequence: int
+    timestamp: float
+    buffer: npt.NDArray[np.uint16]
+    data: TactileData
+
+
+def _ring_size(slots: int) -> int:
+    return _HEADER_DTYPE.itemsize + slots * _SLOT_DTYPE.itemsize
+
+
+class _TactileRing:
+    """Structured views over a ring buffer shared memory block."""
+
+    _logger = logger
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self._shm = shm
+        self._header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=shm.buf)
+        slots = int(self._header["slots"])
+        self._slots = np.ndarray((slots,), dtype=_SLOT_DTYPE, buffer=shm.buf, offset=_HEADER_DTYPE.itemsize)
+        # TactileData views per slot are built once; reads only pick one
+        self._decoded = [decode_tactile(self._slots["data"][i], 0.0) for i in range(slots)]
+
+    @property
+    def name(self) -> str:
+        """Shared memory name readers attach to"""
+        return self._shm.name
+
+    @property
+    def slots(self) -> int:
+        return len(self._slots)
+
+    def head(self) -> int:
+        """Sequence number of the newest complete frame (0 while empty)."""
+        return int(self._header["head"])
+
+    def close(self) -> None:
+        """Drop the views and detach from the shared memory."""
+        self._header = self._slots = None
+        self._decoded = []
+        self._shm.close()
+
+    def __enter__(self) -> "_TactileRing":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class TactileRingWriter(_TactileRing):
+    """Creates the shared ring and writes frames into it (single writer).
+
+    Args:
+        name: Shared memory name, chosen by the OS if omitted (see .name)
+        slots: Number of frames kept
+    """
+
+    def __init__(self, name: Optional[str] = None, slots: int = DEFAULT_RING_SLOTS):
+        if slots < 2:
+            raise ValueError(f"slots must be >= 2, got {slots}")
+        shm = shared_memory.SharedMemory(name=name, create=True, size=_ring_size(slots))
+        header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=shm.buf)
+        header["magic"] = RING_MAGIC
+        header["version"] = RING_VERSION
+        header["slots"] = slots
+        header["span"] = TACTILE_SPAN
+        header["head"] = 0
+        del header
+        super().__init__(shm)
+        _created_names.add(shm.name)
+
+    def write(self, buffer: npt.NDArray, timestamp: float) -> int:
+        """Publish one raw tactile sweep (TACTILE_SPAN registers).
+
+        Returns:
+            int: Sequence number assigned to the frame
+        """
+        seq = self.head() + 1
+        index = seq % len(self._slots)
+        self._slots["seq"][index] = 0  # Readers holding this slot now see it as overwritten
+        self._slots["data"][index] = buffer
+        self._slots["timestamp"][index] = timestamp
+        self._slots["seq"][index] = seq
+        self._header["head"] = seq
+        return seq
+
+    def write_frame(self, frame: TactileFrame) -> int:
+        """Publish a TactileFrame filled by InspireHandModbus.read_into()."""
+        return self.write(frame.buffer, frame.timestamp)
+
+    def run(self, hand: Any, rate_hz: float = 50.0, stop: Optional[threading.Event] = None) -> None:
+        """Acquisition loop: read the hand once per tick and publish the sweep.
+
+        Blocks until stop is set (or forever). Failed reads are skipped, so a
+        missing sequence never appears in the ring.
+
+        Args:
+            hand: Connected Gen4 InspireHandModbus
+            rate_hz: Sweep rate
+            stop: Event ending the loop
+        """
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        stop = stop or threading.Event()
+        period = 1.0 / rate_hz
+        frame = TactileFrame(np.uint16)
+        next_due = time.monotonic()
+        while not stop.is_set():
+            if hand.read_into(frame):
+                self.write_frame(frame)
+            next_due += period
+            now = time.monotonic()
+            if next_due < now:
+                next_due = now  # Fell behind: skip the missed ticks
+            stop.wait(next_due - now)
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block (call once, after close)."""
+        _created_names.discard(self._shm.name)
+        self._shm.unlink()
+
+
+class TactileRingReader(_TactileRing):
+    """Attaches to an existing ring by name and reads frames as views.
+
+    Views stay valid until the writer wraps around to their slot, i.e. for
+    about slots / rate_hz seconds; use is_current() to check, or copy.
+    """
+
+    def __init__(self, name: str):
+        try:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 registers attached blocks with the resource tracker,
+            # which would unlink the writer's memory when this process exits.
+            # A writer in this process keeps its own registration (the tracker
+            # holds one entry per name) until TactileRingWriter.unlink().
+            shm = shared_memory.SharedMemory(name=name)
+            if os.name == "posix" and shm.name not in _created_names:
+                # The tracker knows posix blocks by their "/"-prefixed name
+                resource_tracker.unregister("/" + shm.name, "shared_memory")
+        header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=shm.buf)
+        valid = (int(header["magic"]) == RING_MAGIC and int(header["version"]) == RING_VERSION
+                 and int(header["span"]) == TACTILE_SPAN)
+        del header
+        if not valid:
+            shm.close()
+            raise ValueError(f"Shared memory '{name}' is not a tactile ring buffer")
+        super().__init__(shm)
+
+    def _frame(self, seq: int) -> Optional[RingFrame]:
+        index = seq % len(self._slots)
+        timestamp = float(self._slots["timestamp"][index])
+        if int(self._slots["seq"][index]) != seq:
+            return None  # Overwritten or being written
+        data = self._decoded[index]
+        data.timestamp = timestamp
+        return RingFrame(seq, timestamp, self._slots["data"][index], data)
+
+    def latest(self) -> Optional[RingFrame]:
+        """Newest frame as views into shared memory, or None while the ring is empty."""
+        seq = self.head()
+        while seq > 0:
+            frame = self._frame(seq)
+            if frame is not None:
+                return frame
+            seq = self.head()  # The writer moved on while we looked; retry with the new head
+        return None
+
+    def last(self, n: int) -> List[RingFrame]:
+        """Up to n newest frames, oldest first, as views into shared memory."""
+        n = min(n, len(self._slots) - 1)  # The slot after head may be mid-write
+        head = self.head()
+        frames = []
+        for seq in range(max(1, head - n + 1), head + 1):
+            frame = self._frame(seq)
+            if frame is not None:
+                frames.append(frame)
+        return frames
+
+    def is_current(self, frame: RingFrame) -> bool:
+        """True if the frame's slot has not been reused since it was read."""
+        return int(self._slots["seq"][frame.sequence % len(self._slots)]) == frame.sequence
+
+    def copy_latest(self) -> Optional[RingFrame]:
+        """Newest frame copied out of shared memory, guaranteed consistent."""
+        while True:
+            frame = self.latest()
+            if frame is None:
+                return None
+            buffer = frame.buffer.copy()
+            if self.is_current(frame):
+                return RingFrame(frame.sequence, frame.timestamp, buffer, decode_tactile(buffer, frame.timestamp))
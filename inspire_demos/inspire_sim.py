@@ -0,0 +1,625 @@
+"""
+Hardware-free Inspire Hand simulation for tests and benchmarks.
+
+SimulatedHand keeps the byte-addressed register file of one hand (the
+regdict / regdict_gen4 map) and advances simple joint dynamics whenever it is
+accessed: ANGLE_ACT moves towards ANGLE_SET at a rate set by SPEED_SET, each
+finger meets a virtual object and builds up FORCE_ACT until FORCE_SET is
+reached, and on Gen4 the tactile block 3000-5123 shows synthetic contact
+patterns. ModbusHandSimulator serves it over Modbus TCP (function codes 3, 6
+and 16) with configurable latency, jitter, packet loss and service time.
+SerialHandEmulator serves one or more hand IDs over a pty pair with the
+0xEB 0x90 serial protocol, paced like a real line at the given baud rate.
+
+Run standalone with: python -m inspire_demos.inspire_sim --port 6000
+or, for the serial emulator: python -m inspire_demos.inspire_sim --serial --hand-ids 1 2
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import select
+import struct
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+try:
+    import tty
+    PTY_AVAILABLE = True
+except ImportError:
+    PTY_AVAILABLE = False
+
+from inspire_demos.inspire_serial import (
+    CMD_READ,
+    CMD_WRITE,
+    DEFAULT_BAUDRATE,
+    FRAME_HEADER,
+    REGISTER_STRIDE,
+    REPLY_HEADER,
+    FrameDecoder,
+    build_frame,
+    regdict,
+    regdict_gen4,
+)
+from inspire_demos.inspire_tactile import (
+    TACTILE_END,
+    TACTILE_START,
+    sensor_view,
+)
+
+REGISTER_FILE_SIZE = 0x1800  # Covers every address of both register maps
+ANGLE_RANGE = 1000  # 1000 = open, 0 = closed
+FULL_SPEED = 2000.0  # Angle units per second at SPEED_SET 1000
+OBJECT_STIFFNESS = 8.0  # FORCE_ACT units per angle unit of penetration
+FINGERS = 6
+TACTILE_PERIOD = 0.01  # Tactile sample period: one noise field per period, so a multi-segment sweep sees one field
+STARTUP_TIMEOUT = 5.0  # Seconds start_in_thread() waits for the server to come up
+
+STATUS_RELEASING = 0
+STATUS_GRASPING = 1
+STATUS_POSITION_REACHED = 2
+STATUS_FORCE_REACHED = 3
+
+# Modbus TCP
+_MBAP = struct.Struct(">HHHB")
+FC_READ_HOLDING_REGISTERS = 0x03
+FC_WRITE_SINGLE_REGISTER = 0x06
+FC_WRITE_MULTIPLE_REGISTERS = 0x10
+EXC_ILLEGAL_FUNCTION = 0x01
+EXC_ILLEGAL_ADDRESS = 0x02
+EXC_ILLEGAL_VALUE = 0x03
+
+# Serial line
+BITS_PER_BYTE = 10  # 8N1: start bit, 8 data bits, stop bit
+WRITE_ACK = b"\x01"
+
+
+class SimulatedHand:
+    """Register file and joint/tactile model of one hand.
+
+    All access goes through read_bytes()/write_bytes(), which first advance the
+    simulation to the current time, so no background thread is needed.
+
+    Args:
+        generation: 3 or 4; tactile registers are only simulated on Gen4
+        hand_id: Value of the HAND_ID register
+        contact_angles: Angle per finger at which the virtual object is touched
+            (None disables contact for that finger); defaults to 400 for the
+            four fingers and the thumb bend, none for the thumb rotation
+        tactile_noise: Standard deviation of the idle tactile baseline
+        seed: Seed of the tactile noise generator
+    """
+
+    def __init__(self, generation: int = 4, hand_id: int = 1, contact_angles: Optional[List[Optional[int]]] = None,
+                 tactile_noise: float = 2.0, seed: Optional[int] = 0):
+        self._generation = generation
+        self._regs = regdict_gen4 if generation == 4 else regdict
+        self._memory = bytearray(REGISTER_FILE_SIZE)
+        self._lock = threading.Lock()
+        self._rng = np.random.default_rng(seed)
+        self._tactile_noise = tactile_noise
+        self._contact = contact_angles if contact_angles is not None else [400, 400, 400, 400, 400, None]
+        if len(self._contact) != FINGERS:
+            raise ValueError(f"Expected {FINGERS} contact angles, got {len(self._contact)}")
+
+        self._angle = np.full(FINGERS, float(ANGLE_RANGE))
+        self._force = np.zeros(FINGERS)
+        self._last_step = time.monotonic()
+        self._tactile_at = float("-inf")  # Time of the last tactile sample
+        self._memory[self._regs["HAND_ID"]] = hand_id
+        self._write_words("ANGLE_SET", np.full(FINGERS, ANGLE_RANGE))
+        self._write_words("SPEED_SET", np.full(FINGERS, 1000))
+        self._write_words("FORCE_SET", np.full(FINGERS, 1000))
+        self._publish(np.full(FINGERS, STATUS_POSITION_REACHED))
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def hand_id(self) -> int:
+        return self._memory[self._regs["HAND_ID"]]
+
+    def read_bytes(self, address: int, length: int) -> bytes:
+        """Bytes address..address+length-1 of the register file after advancing the model."""
+        self._check_range(address, length)
+        with self._lock:
+            self._step()
+            return bytes(self._memory[address:address + length])
+
+    def write_bytes(self, address: int, data: bytes) -> None:
+        """Write raw bytes; writes to CLEAR_ERROR and the set registers take effect immediately."""
+        self._check_range(address, len(data))
+        with self._lock:
+            self._step()
+            self._memory[address:address + len(data)] = data
+            clear = self._regs["CLEAR_ERROR"]
+            if address <= clear < address + len(data) and self._memory[clear]:
+                self._memory[self._regs["ERROR"]:self._regs["ERROR"] + FINGERS] = bytes(FINGERS)
+                self._memory[clear] = 0
+
+    def read_registers(self, address: int, count: int) -> List[int]:
+        """Modbus view: count 16-bit little-endian registers starting at address."""
+        data = self.read_bytes(address, count * REGISTER_STRIDE)
+        return list(struct.unpack(f"<{count}H", data))
+
+    def write_registers(self, address: int, values: List[int]) -> None:
+        """Modbus view: write 16-bit registers starting at address."""
+        self.write_bytes(address, struct.pack(f"<{len(values)}H", *values))
+
+    def _check_range(self, address: int, length: int) -> None:
+        if address < 0 or length < 0 or address + length > REGISTER_FILE_SIZE:
+            raise IndexError(f"Address range {address}..{address + length - 1} outside the register file")
+
+    def _words(self, name: str) -> np.ndarray:
+        address = self._regs[name]
+        return np.frombuffer(self._memory, dtype="<u2", count=FINGERS, offset=address).astype(np.float64)
+
+    def _write_words(self, name: str, values: np.ndarray) -> None:
+        address = self._regs[name]
+        self._memory[address:address + 2 * FINGERS] = np.asarray(values, dtype="<u2").tobytes()
+
+    def _write_bytes6(self, name: str, values: np.ndarray) -> None:
+        address = self._regs[name]
+        self._memory[address:address + FINGERS] = np.asarray(values, dtype=np.uint8).tobytes()
+
+    def _step(self) -> None:
+        now = time.monotonic()
+        dt = now - self._last_step  # Motion is clipped at the target, so long steps are exact
+        self._last_step = now
+        if dt <= 0:
+            return
+
+        target = self._words("ANGLE_SET")
+        target = np.where(target > ANGLE_RANGE, self._angle, target)  # 0xFFFF (-1) keeps the current angle
+        speed = np.clip(self._words("SPEED_SET"), 0, 1000) / 1000 * FULL_SPEED
+        force_limit = np.clip(self._words("FORCE_SET"), 0, 3000)
+
+        step = np.clip(target - self._angle, -speed * dt, speed * dt)
+        proposed = self._angle + step
+        contact = np.array([np.nan if c is None else c for c in self._contact], dtype=np.float64)
+        penetration = np.where(np.isnan(contact), 0.0, np.maximum(contact - proposed, 0.0))
+        force = penetration * OBJECT_STIFFNESS
+        blocked = force >= force_limit
+        # Closing stops where the contact force reaches the limit
+        stop_angle = np.where(np.isnan(contact), proposed, contact - force_limit / OBJECT_STIFFNESS)
+        self._angle = np.where(blocked & (step < 0), np.maximum(proposed, stop_angle), proposed)
+        self._force = np.where(np.isnan(contact), 0.0, np.maximum(contact - self._angle, 0.0) * OBJECT_STIFFNESS)
+
+        status = np.where(blocked & (step <= 0), STATUS_FORCE_REACHED,
+                          np.where(np.abs(target - self._angle) < 1, STATUS_POSITION_REACHED,
+                                   np.where(step < 0, STATUS_GRASPING, STATUS_RELEASING)))
+        self._publish(status)
+
+    def _publish(self, status: np.ndarray) -> None:
+        angle = np.rint(self._angle)
+        self._write_words("ANGLE_ACT", angle)
+        self._write_words("POS_ACT", angle * 2)
+        self._write_words("FORCE_ACT", np.rint(self._force))
+        self._write_words("CURRENT", np.rint(50 + self._force / 4 + (status == STATUS_GRASPING) * 100))
+        self._write_bytes6("STATUS", status)
+        self._write_bytes6("TEMP", 30 + np.minimum(self._force / 200, 20))
+        if self._generation == 4 and self._last_step - self._tactile_at >= TACTILE_PERIOD:
+            self._tactile_at = self._last_step
+            self._publish_tactile()
+
+    def _publish_tactile(self) -> None:
+        span = (TACTILE_END - TACTILE_START) // REGISTER_STRIDE
+        sweep = np.abs(self._rng.normal(0, self._tactile_noise, span))
+        # Fingers 0-3 are pinky..index, 4 is the thumb bend (finger order of the angle registers)
+        finger_sensors = (("PINKY_TIP_TAC", "PINKY_TOP_TAC"), ("RING_TIP_TAC", "RING_TOP_TAC"),
+                          ("MIDDLE_TIP_TAC", "MIDDLE_TOP_TAC"), ("INDEX_TIP_TAC", "INDEX_TOP_TAC"),
+                          ("THUMB_TIP_TAC", "THUMB_TOP_TAC"))
+        for finger, names in enumerate(finger_sensors):
+            pressure = self._force[finger]
+            if pressure <= 0:
+                continue
+            for name in names:
+                view = sensor_view(sweep, name)
+                rows, cols = view.shape
+                r, c = np.ogrid[:rows, :cols]
+                blob = np.exp(-(((r - rows / 2) / (rows / 3)) ** 2 + ((c - cols / 2) / (cols / 3)) ** 2))
+                view += blob * pressure / 4
+        if self._force[:5].sum() > 0:
+            palm = sensor_view(sweep, "PALM_TAC")
+            palm += self._force[:5].mean() / 20
+        words = np.clip(np.rint(sweep), 0, 0xFFFF).astype("<u2")
+        self._memory[TACTILE_START:TACTILE_END] = words.tobytes()
+
+
+class ModbusHandSimulator:
+    """Asyncio Modbus TCP server backed by a SimulatedHand.
+
+    Replies leave in request order, each no earlier than latency (+- jitter)
+    after its request arrived and at least service_time after the previous
+    one, which models a pipe with transit delay and a serial device behind it.
+    A lost request gets no reply at all.
+
+    Args:
+        host: Bind address
+        port: TCP port, 0 picks a free one (see .port after start)
+        hand: Simulated hand, a Gen4 SimulatedHand by default
+        latency: One-way-plus-processing delay per request in seconds
+        jitter: Uniform +- jitter added to latency in seconds
+        loss: Probability of dropping a request
+        service_time: Minimum spacing of consecutive replies in seconds
+        seed: Seed for jitter and loss
+    """
+
+    _logger = logger
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, hand: Optional[SimulatedHand] = None,
+                 latency: float = 0.0, jitter: float = 0.0, loss: float = 0.0, service_time: float = 0.0,
+                 seed: Optional[int] = None):
+        if not 0.0 <= loss < 1.0:
+            raise ValueError(f"loss must be in [0, 1), got {loss}")
+        self.host = host
+        self.port = port
+        self.hand = hand or SimulatedHand()
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.service_time = service_time
+        self._random = random.Random(seed)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._connections: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._stats = {"requests": 0, "dropped": 0, "exceptions": 0, "connections": 0}
+
+    async def start(self) -> int:
+        """Start serving on the running event loop. Returns the bound port."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._logger.info(f"Simulated Inspire Hand serving Modbus TCP on {self.host}:{self.port}")
+        return self.port
+
+    async def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._connections):
+                writer.transport.abort()
+            await asyncio.gather(*self._connections.values(), return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    def start_in_thread(self, timeout: float = STARTUP_TIMEOUT) -> int:
+        """Run the server on its own event loop thread. Returns the bound port.
+
+        Raises:
+            OSError: If the server could not be started, e.g. the port is taken (re-raised from the server thread)
+            TimeoutError: If the server did not come up within timeout seconds
+        """
+        ready = threading.Event()
+        error: List[BaseException] = []
+
+        def run() -> None:
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self.start())
+            except BaseException as e:
+                error.append(e)
+                self._loop.close()
+                return
+            finally:
+                ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.stop())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="inspire-modbus-simulator", daemon=True)
+        self._thread.start()
+        if not ready.wait(timeout):
+            raise TimeoutError(f"Simulator did not start within {timeout} s")
+        if error:
+            self._thread.join()
+            self._thread = None
+            raise error[0]
+        return self.port
+
+    def stop_thread(self) -> None:
+        """Stop a server started with start_in_thread()."""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "ModbusHandSimulator":
+        self.start_in_thread()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop_thread()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Requests served, requests dropped, exception replies and connections accepted."""
+        return dict(self._stats)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._stats["connections"] += 1
+        self._connections[writer] = asyncio.current_task()
+        replies: "asyncio.Queue[Optional[Tuple[float, bytes]]]" = asyncio.Queue()
+        sender = asyncio.ensure_future(self._send_replies(replies, writer))
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                tid, protocol, unit, pdu = request
+                arrival = time.monotonic()
+                self._stats["requests"] += 1
+                if self._random.random() < self.loss:
+                    self._stats["dropped"] += 1
+                    continue
+                response = self._process(pdu)
+                delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+                replies.put_nowait((arrival + delay, _MBAP.pack(tid, protocol, len(response) + 1, unit) + response))
+            replies.put_nowait(None)
+            await sender
+        finally:
+            sender.cancel()
+            writer.close()
+            self._connections.pop(writer, None)
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[int, int, int, bytes]]:
+        """(transaction id, protocol id, unit id, PDU) of the next request, None once the connection should close."""
+        try:
+            header = await reader.readexactly(_MBAP.size)
+            tid, protocol, length, unit = _MBAP.unpack(header)
+            if length < 2:
+                # The length covers the unit id and a PDU of at least the function code
+                self._logger.warning(f"Closing connection after a request with invalid MBAP length {length}")
+                return None
+            return tid, protocol, unit, await reader.readexactly(length - 1)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return None
+
+    async def _send_replies(self, replies: "asyncio.Queue", writer: asyncio.StreamWriter) -> None:
+        last_sent = 0.0
+        while True:
+            item = await replies.get()
+            if item is None:
+                return
+            send_at, frame = item
+            send_at = max(send_at, last_sent + self.service_time)
+            wait = send_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            last_sent = time.monotonic()
+            try:
+                writer.write(frame)
+                await writer.drain()
+            except ConnectionError:
+                return
+
+    def _process(self, pdu: bytes) -> bytes:
+        function = pdu[0]
+        try:
+            if function == FC_READ_HOLDING_REGISTERS:
+                address, count = struct.unpack_from(">HH", pdu, 1)
+                if not 1 <= count <= 125:
+                    return self._exception(function, EXC_ILLEGAL_VALUE)
+                values = self.hand.read_registers(address, count)
+                return struct.pack(f">BB{count}H", function, count * 2, *values)
+            if function == FC_WRITE_SINGLE_REGISTER:
+                address, value = struct.unpack_from(">HH", pdu, 1)
+                self.hand.write_registers(address, [value])
+                return pdu[:5]
+            if function == FC_WRITE_MULTIPLE_REGISTERS:
+                address, count, byte_count = struct.unpack_from(">HHB", pdu, 1)
+                if not 1 <= count <= 123 or byte_count != count * 2:
+                    return self._exception(function, EXC_ILLEGAL_VALUE)
+                values = list(struct.unpack_from(f">{count}H", pdu, 6))
+                self.hand.write_registers(address, values)
+                return pdu[:5]
+            return self._exception(function, EXC_ILLEGAL_FUNCTION)
+        except IndexError:
+            return self._exception(function, EXC_ILLEGAL_ADDRESS)
+        except struct.error:
+            return self._exception(function, EXC_ILLEGAL_VALUE)
+
+    def _exception(self, function: int, code: int) -> bytes:
+        self._stats["exceptions"] += 1
+        return bytes((function | 0x80, code))
+
+
+class SerialHandEmulator:
+    """Emulates Inspire Hands on an RS-485 bus behind a pty pair.
+
+    Open .port (the pty slave) with InspireHandSerial as if it were
+    /dev/ttyUSB0. Read (0x11) and write (0x12) frames addressed to one of the
+    emulated hand IDs are answered with a 0x90 0xEB reply frame, writes with a
+    single 0x01 byte; frames for other IDs are ignored like on a shared bus.
+
+    Timing follows the line: a reply starts once the request would have been
+    received at the baud rate plus the turnaround time, and its bytes leave
+    paced at the baud rate plus byte_delay per byte.
+
+    Args:
+        hands: Hand IDs to emulate (a Gen4 SimulatedHand each), or a dict of
+            hand ID -> SimulatedHand
+        baudrate: Line rate used for timing; 0 disables pacing
+        turnaround: Processing delay between request and reply in seconds
+        byte_delay: Extra inter-byte gap of the reply in seconds
+        loss: Probability of not answering a request
+        seed: Seed for loss
+    """
+
+    _logger = logger
+
+    def __init__(self, hands: Any = (1,), baudrate: int = DEFAULT_BAUDRATE, turnaround: float = 0.0,
+                 byte_delay: float = 0.0, loss: float = 0.0, seed: Optional[int] = None):
+        if not 0.0 <= loss < 1.0:
+            raise ValueError(f"loss must be in [0, 1), got {loss}")
+        if isinstance(hands, dict):
+            self.hands: Dict[int, SimulatedHand] = dict(hands)
+        else:
+            self.hands = {hand_id: SimulatedHand(hand_id=hand_id) for hand_id in hands}
+        self.baudrate = baudrate
+        self.turnaround = turnaround
+        self.byte_delay = byte_delay
+        self.loss = loss
+        self.port: Optional[str] = None
+        self._random = random.Random(seed)
+        self._master: Optional[int] = None
+        self._slave: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._decoder = FrameDecoder(headers=(FRAME_HEADER,))
+        self._stats = {"requests": 0, "replies": 0, "dropped": 0, "ignored": 0, "errors": 0}
+
+    def start(self) -> str:
+        """Open the pty pair and start answering. Returns the port name to open."""
+        if not PTY_AVAILABLE:
+            raise RuntimeError("SerialHandEmulator needs POSIX pseudo terminals")
+        if self._thread is not None:
+            return self.port
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="inspire-serial-emulator", daemon=True)
+        self._thread.start()
+        self._logger.info(f"Emulating Inspire Hand IDs {sorted(self.hands)} on {self.port}")
+        return self.port
+
+    def stop(self) -> None:
+        """Stop answering and close the pty pair."""
+        if self._thread is None:
+            return
+        self._running = False
+        self._thread.join()
+        self._thread = None
+        os.close(self._master)
+        os.close(self._slave)
+        self._master = self._slave = None
+
+    def __enter__(self) -> "SerialHandEmulator":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def byte_time(self) -> float:
+        """Seconds one byte occupies on the line (without byte_delay)."""
+        return BITS_PER_BYTE / self.baudrate if self.baudrate else 0.0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Requests seen, replies sent, requests dropped, frames for other IDs, bad requests and checksum errors."""
+        stats = dict(self._stats)
+        stats["checksum_errors"] = self._decoder.checksum_errors
+        return stats
+
+    def _run(self) -> None:
+        while self._running:
+            ready, _, _ = select.select([self._master], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                data = os.read(self._master, 4096)
+            except OSError:
+                return
+            received = time.monotonic()
+            self._decoder.feed(data)
+            while (frame := self._decoder.next_frame()) is not None:
+                self._handle(frame, received)
+
+    def _handle(self, frame: Any, received: float) -> None:
+        hand = self.hands.get(frame.hand_id)
+        if hand is None:
+            self._stats["ignored"] += 1
+            return
+        self._stats["requests"] += 1
+        if self._random.random() < self.loss:
+            self._stats["dropped"] += 1
+            return
+        try:
+            if frame.cmd == CMD_READ and len(frame.data) == 1:
+                payload = hand.read_bytes(frame.addr, frame.data[0])
+            elif frame.cmd == CMD_WRITE and frame.data:
+                hand.write_bytes(frame.addr, frame.data)
+                payload = WRITE_ACK
+            else:
+                self._stats["errors"] += 1
+                return
+        except IndexError:
+            self._stats["errors"] += 1
+            return
+
+        reply = bytearray(build_frame(frame.hand_id, frame.cmd, frame.addr, payload))
+        reply[:2] = REPLY_HEADER  # Header bytes are not part of the checksum
+        request_time = (len(frame.data) + 8) * self.byte_time()
+        self._send(reply, received + request_time + self.turnaround)
+        self._stats["replies"] += 1
+
+    def _send(self, reply: bytes, start: float) -> None:
+        per_byte = self.byte_time() + self.byte_delay
+        if per_byte <= 0:
+            self._sleep_until(start)
+            os.write(self._master, reply)
+            return
+        # Release bytes once they would have been fully received: in chunks of
+        # about a millisecond of line time, or one by one with an inter-byte gap
+        chunk = 1 if self.byte_delay > 0 else max(1, int(0.001 / per_byte))
+        for offset in range(0, len(reply), chunk):
+            end = min(offset + chunk, len(reply))
+            self._sleep_until(start + end * per_byte)
+            os.write(self._master, reply[offset:end])
+
+    @staticmethod
+    def _sleep_until(deadline: float) -> None:
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Simulated Inspire Hand (Modbus TCP or serial pty)")
+    parser.add_argument("--serial", action="store_true", help="Emulate the serial protocol on a pty instead")
+    parser.add_argument("--hand-ids", type=int, nargs="+", default=[1], help="Hand IDs on the emulated serial bus")
+    parser.add_argument("--baudrate", type=int, default=DEFAULT_BAUDRATE)
+    parser.add_argument("--byte-delay", type=float, default=0.0, help="Extra inter-byte gap in seconds (serial)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6000)
+    parser.add_argument("--generation", type=int, default=4, choices=(3, 4))
+    parser.add_argument("--latency", type=float, default=0.0, help="Reply delay (serial: turnaround) in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Uniform +- jitter in seconds")
+    parser.add_argument("--loss", type=float, default=0.0, help="Probability of dropping a request")
+    parser.add_argument("--service-time", type=float, default=0.0, help="Minimum spacing of replies in seconds")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    if args.serial:
+        hands = {hand_id: SimulatedHand(args.generation, hand_id, seed=args.seed) for hand_id in args.hand_ids}
+        with SerialHandEmulator(hands, args.baudrate, args.latency, args.byte_delay, args.loss, args.seed) as emulator:
+            print(emulator.port, flush=True)
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                pass
+        return
+
+    simulator = ModbusHandSimulator(args.host, args.port, SimulatedHand(args.generation), args.latency,
+                                    args.jitter, args.loss, args.service_time, args.seed)
+
+    async def serve() -> None:
+        await simulator.start()
+        await asyncio.Event().wait()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Latest-value-wins setpoint streaming for teleoperation.
+
+A producer such as a data glove can call SetpointStreamer.set_angle() at any
+rate. Only the newest pending setpoint per register is kept; a background
+thread sends whatever is pending at a fixed maximum rate. Commands never pile
+up behind a slow link and the end-to-end latency stays bounded.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from loguru import logger
+
+from inspire_demos.inspire_serial import encode_setpoints
+
+# Register name -> setter on InspireHandSerial / InspireHandModbus
+STREAMABLE_REGISTERS = {
+    "ANGLE_SET": "set_angle",
+    "SPEED_SET": "set_speed",
+    "FORCE_SET": "set_force",
+}
+
+
+@dataclass(frozen=True)
+class StreamMetrics:
+    """Counters and queue-age statistics of a SetpointStreamer (ages in seconds)."""
+    submitted: int
+    sent: int
+    superseded: int  # Setpoints replaced by a newer one before they were sent
+    failed: int
+    pending: int
+    oldest_pending_age: float
+    last_queue_age: float
+    mean_queue_age: float
+    max_queue_age: float
+
+
+class SetpointStreamer:
+    """Background sender keeping only the newest pending setpoint per register.
+
+    Works with InspireHandSerial and InspireHandModbus. Extra keyword arguments
+    (e.g. hand_id=2 for serial) are passed to every setter call and may also be
+    given per submit() call; each (register, kwargs) pair is its own slot.
+
+    The streamer thread is the only writer while it runs. Reads issued from other
+    threads on the same serial port must go through a bus scheduler.
+    """
+
+    _logger = logger
+
+    def __init__(self, hand: Any, rate_hz: float = 100.0, **setter_kwargs: Any):
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        self._hand = hand
+        self._period = 1.0 / rate_hz
+        self._setter_kwargs = setter_kwargs
+        self._pending: Dict[Tuple[str, tuple], Tuple[npt.NDArray[np.uint16], float, Dict[str, Any]]] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._last_send = 0.0
+
+        self._submitted = 0
+        self._sent = 0
+        self._superseded = 0
+        self._failed = 0
+        self._last_age = 0.0
+        self._sum_age = 0.0
+        self._max_age = 0.0
+
+    def start(self) -> "SetpointStreamer":
+        """Start the sender thread."""
+        with self._cond:
+            if self._running:
+                return self
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name="inspire-setpoint-streamer", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, flush: bool = True) -> None:
+        """Stop the sender thread, sending the pending setpoints first if flush is True."""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            if not flush:
+                self._pending.clear()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SetpointStreamer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def get_rate(self) -> float:
+        """Get the maximum send rate in Hz"""
+        return 1.0 / self._period
+
+    def set_rate(self, rate_hz: float) -> None:
+        """Set the maximum send rate in Hz"""
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        self._period = 1.0 / rate_hz
+
+    def submit(self, register: str, values: npt.NDArray[np.integer], **kwargs: Any) -> None:
+        """Queue a setpoint, replacing any unsent setpoint for the same register."""
+        if register not in STREAMABLE_REGISTERS:
+            raise ValueError(f"Register '{register}' cannot be streamed. Available registers: {list(STREAMABLE_REGISTERS)}")
+        words = encode_setpoints(values, "values")  # Validate in the caller's thread
+        call_kwargs = {**self._setter_kwargs, **kwargs}
+        key = (register, tuple(sorted(call_kwargs.items())))
+        with self._cond:
+            if key in self._pending:
+                self._superseded += 1
+            self._pending[key] = (words, time.monotonic(), call_kwargs)
+            self._submitted += 1
+            self._cond.notify()
+
+    def set_angle(self, angles: npt.NDArray[np.integer], **kwargs: Any) -> None:
+        """Queue joint angles (latest value wins)."""
+        self.submit("ANGLE_SET", angles, **kwargs)
+
+    def set_speed(self, speeds: npt.NDArray[np.integer], **kwargs: Any) -> None:
+        """Queue joint speeds (latest value wins)."""
+        self.submit("SPEED_SET", speeds, **kwargs)
+
+    def set_force(self, forces: npt.NDArray[np.integer], **kwargs: Any) -> None:
+        """Queue joint forces (latest value wins)."""
+        self.submit("FORCE_SET", forces, **kwargs)
+
+    def get_metrics(self) -> StreamMetrics:
+        """Snapshot of the streamer counters and queue ages."""
+        with self._cond:
+            now = time.monotonic()
+            oldest = max((now - submitted for _, submitted, _ in self._pending.values()), default=0.0)
+            return StreamMetrics(
+                submitted=self._submitted,
+                sent=self._sent,
+                superseded=self._superseded,
+                failed=self._failed,
+                pending=len(self._pending),
+                oldest_pending_age=oldest,
+                last_queue_age=self._last_age,
+                mean_queue_age=self._sum_age / self._sent if self._sent else 0.0,
+                max_queue_age=self._max_age,
+            )
+
+    def reset_metrics(self) -> None:
+        """Reset the counters and queue-age statistics."""
+        with self._cond:
+            self._submitted = self._sent = self._superseded = self._failed = 0
+            self._last_age = self._sum_age = self._max_age = 0.0
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._pending:
+                    return  # Stopped and flushed
+                # Respect the send rate; a stop request skips the wait so the flush is prompt
+                delay = self._last_send + self._period - time.monotonic()
+                if delay > 0 and self._running:
+                    self._cond.wait(delay)
+                    continue
+                batch = self._pending
+                self._pending = {}
+
+            self._last_send = time.monotonic()
+            for (register, _), (words, submitted, call_kwargs) in batch.items():
+                setter = getattr(self._hand, STREAMABLE_REGISTERS[register])
+                age = time.monotonic() - submitted
+                try:
+                    ok = setter(words, **call_kwargs)
+                except Exception as e:
+                    self._logger.error(f"Streaming {register} failed: {e}")
+                    ok = False
+                with self._cond:
+                    if ok is False:
+                        self._failed += 1
+                        continue
+                    self._sent += 1
+                    self._last_age = age
+                    self._sum_age += age
+                    self._max_age = max(self._max_age, age)
@@ -0,0 +1,278 @@
+"""
+Tactile sensor layout and decoding for Gen4 Inspire Hands.
+
+The 17 tactile sensors occupy addresses 3000-5123. Like the actuator
+registers, addresses count bytes: every 16-bit taxel register spans two
+addresses and a Modbus read of N registers returns N consecutive taxels. The
+whole block (1062 registers) is read in one sweep and each sensor is exposed
+as a NumPy view into the same buffer.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from inspire_demos.inspire_serial import REGISTER_STRIDE, regdict_gen4
+
+
+@dataclass
+class FingerSensorData:
+    """Data class for individual finger sensor data."""
+    top: npt.NDArray[np.int32]
+    tip: npt.NDArray[np.int32]
+    base: npt.NDArray[np.int32]
+
+
+@dataclass
+class ThumbSensorData:
+    """Data class for thumb sensor data (includes mid sensor)."""
+    top: npt.NDArray[np.int32]
+    tip: npt.NDArray[np.int32]
+    mid: npt.NDArray[np.int32]
+    base: npt.NDArray[np.int32]
+
+
+@dataclass
+class TactileData:
+    """Data class for all tactile sensor data with timestamp."""
+    timestamp: float
+    pinky: FingerSensorData
+    ring: FingerSensorData
+    middle: FingerSensorData
+    index: FingerSensorData
+    thumb: ThumbSensorData
+    palm: npt.NDArray[np.int32]
+
+
+# Register name -> (finger, position), in address order
+TACTILE_SENSORS: Dict[str, Tuple[str, Optional[str]]] = {
+    "PINKY_TOP_TAC": ("pinky", "top"),
+    "PINKY_TIP_TAC": ("pinky", "tip"),
+    "PINKY_BASE_TAC": ("pinky", "base"),
+    "RING_TOP_TAC": ("ring", "top"),
+    "RING_TIP_TAC": ("ring", "tip"),
+    "RING_BASE_TAC": ("ring", "base"),
+    "MIDDLE_TOP_TAC": ("middle", "top"),
+    "MIDDLE_TIP_TAC": ("middle", "tip"),
+    "MIDDLE_BASE_TAC": ("middle", "base"),
+    "INDEX_TOP_TAC": ("index", "top"),
+    "INDEX_TIP_TAC": ("index", "tip"),
+    "INDEX_BASE_TAC": ("index", "base"),
+    "THUMB_TOP_TAC": ("thumb", "top"),
+    "THUMB_TIP_TAC": ("thumb", "tip"),
+    "THUMB_MID_TAC": ("thumb", "mid"),
+    "THUMB_BASE_TAC": ("thumb", "base"),
+    "PALM_TAC": ("palm", None),
+}
+
+TACTILE_START = min(regdict_gen4[name][0] for name in TACTILE_SENSORS)
+TACTILE_END = max(
+    regdict_gen4[name][0] + REGISTER_STRIDE * regdict_gen4[name][1][0] * regdict_gen4[name][1][1]
+    for name in TACTILE_SENSORS
+)
+TACTILE_SPAN = (TACTILE_END - TACTILE_START) // REGISTER_STRIDE  # 1062 registers
+
+
+# Compact layout: the taxels of every sensor back to back, without the unused
+# registers of the sweep (e.g. before the palm), for storage
+_COMPACT_OFFSETS: Dict[str, int] = {}
+_offset = 0
+for _name in TACTILE_SENSORS:
+    _COMPACT_OFFSETS[_name] = _offset
+    _offset += regdict_gen4[_name][1][0] * regdict_gen4[_name][1][1]
+TACTILE_TAXELS = _offset  # 1046 taxels
+del _name, _offset
+
+
+def _contiguous_runs() -> List[Tuple[int, int, int]]:
+    runs: List[Tuple[int, int, int]] = []
+    for name in TACTILE_SENSORS:
+        address, (rows, cols) = regdict_gen4[name]
+        start = (address - TACTILE_START) // REGISTER_STRIDE
+        compact = _COMPACT_OFFSETS[name]
+        if runs and runs[-1][1] == start:
+            runs[-1] = (runs[-1][0], start + rows * cols, runs[-1][2])
+        else:
+            runs.append((start, start + rows * cols, compact))
+    return runs
+
+
+# (sweep start, sweep end, compact start) of every gap-free stretch of taxels
+COMPACT_RUNS = _contiguous_runs()
+
+
+def sensor_layout(reg_name: str, compact: bool = False) -> Tuple[int, int, int]:
+    """Get (offset into the sweep or compact buffer, rows, cols) for a tactile register."""
+    address, (rows, cols) = regdict_gen4[reg_name]
+    if compact:
+        return _COMPACT_OFFSETS[reg_name], rows, cols
+    return (address - TACTILE_START) // REGISTER_STRIDE, rows, cols
+
+
+def sensor_view(buffer: npt.NDArray, reg_name: str, compact: bool = False) -> npt.NDArray:
+    """Return the 2D matrix for one sensor as a view into a sweep buffer.
+
+    Fingers fill row by row, left to right. The palm fills column by column
+    from bottom to top, so it is reshaped as (cols, rows) and transposed.
+    With compact=True, buffer uses the compact layout (TACTILE_TAXELS values).
+    """
+    offset, rows, cols = sensor_layout(reg_name, compact)
+    flat = buffer[..., offset:offset + rows * cols]
+    if reg_name == "PALM_TAC":
+        return flat.reshape(flat.shape[:-1] + (cols, rows)).swapaxes(-1, -2)
+    return flat.reshape(flat.shape[:-1] + (rows, cols))
+
+
+def sensor_matrix(values: npt.NDArray, reg_name: str) -> npt.NDArray:
+    """Reshape the raw registers of a single sensor into its 2D matrix."""
+    _, rows, cols = sensor_layout(reg_name)
+    if reg_name == "PALM_TAC":
+        return values.reshape(cols, rows).T
+    return values.reshape(rows, cols)
+
+
+FINGERTIP_SENSORS = ("PINKY_TIP_TAC", "RING_TIP_TAC", "MIDDLE_TIP_TAC", "INDEX_TIP_TAC", "THUMB_TIP_TAC")
+
+
+def sensor_name(finger: str, position: str = "") -> str:
+    """Register name of a sensor, e.g. sensor_name("index", "tip") -> "INDEX_TIP_TAC"."""
+    reg_name = "PALM_TAC" if finger == "palm" else f"{finger.upper()}_{position.upper()}_TAC"
+    if reg_name not in TACTILE_SENSORS:
+        raise ValueError(f"Unknown tactile sensor '{finger}' '{position}'. Available sensors: {list(TACTILE_SENSORS.values())}")
+    return reg_name
+
+
+class TactileSubscription:
+    """A fixed set of tactile sensors and the minimal reads that cover them.
+
+    The sensors' register ranges are merged into the fewest transactions of
+    at most max_registers registers (short gaps between sensors are read
+    along when that saves a transaction), computed once. Pass the
+    subscription to InspireHandModbus.read_into() to refresh only these
+    sensors in a TactileFrame; the other sensors keep their old values.
+
+    Args:
+        sensors: Register names (e.g. FINGERTIP_SENSORS + ("PALM_TAC",))
+        max_registers: Registers per Modbus transaction
+    """
+
+    __slots__ = ("sensors", "segments")
+
+    def __init__(self, sensors: Iterable[str], max_registers: int = 125):
+        sensors = tuple(dict.fromkeys(sensors))
+        if not sensors:
+            raise ValueError("A tactile subscription needs at least one sensor")
+        unknown = [name for name in sensors if name not in TACTILE_SENSORS]
+        if unknown:
+            raise ValueError(f"Unknown tactile sensors {unknown}. Available sensors: {list(TACTILE_SENSORS)}")
+        self.sensors = sensors
+
+        # Sensors are disjoint, so a plan is a partition of the sorted sensors
+        # into runs, each read as one contiguous span split into windows of at
+        # most max_registers. Pick the fewest transactions, then the fewest
+        # registers, so a gap is only read along when that saves a transaction.
+        needed = sorted((offset, offset + rows * cols) for offset, rows, cols in map(sensor_layout, sensors))
+        best: List[Tuple[int, int, int]] = [(0, 0, 0)]  # (transactions, registers, run start) covering needed[:i]
+        for last in range(len(needed)):
+            best.append(min(
+                (best[first][0] + -(-(needed[last][1] - needed[first][0]) // max_registers),
+                 best[first][1] + needed[last][1] - needed[first][0], first)
+                for first in range(last + 1)
+            ))
+        segments: List[Tuple[int, int]] = []
+        last = len(needed)
+        while last:
+            first = best[last][2]
+            start, end = needed[first][0], needed[last - 1][1]
+            segments[:0] = [(offset, min(offset + max_registers, end)) for offset in range(start, end, max_registers)]
+            last = first
+        # (sweep offset, register count) of every transaction
+        self.segments: List[Tuple[int, int]] = [(start, end - start) for start, end in segments]
+
+    @property
+    def registers(self) -> int:
+        """Registers read per poll."""
+        return sum(count for _, count in self.segments)
+
+    def __repr__(self) -> str:
+        return f"TactileSubscription({len(self.sensors)} sensors, {len(self.segments)} reads, {self.registers} registers)"
+
+
+def compact_sweep(buffer: npt.NDArray, out: npt.NDArray) -> npt.NDArray:
+    """Copy the taxels of a sweep buffer into a compact buffer (leading dims allowed)."""
+    for start, end, compact in COMPACT_RUNS:
+        out[..., compact:compact + end - start] = buffer[..., start:end]
+    return out
+
+
+def compact_tactile(data: TactileData, out: npt.NDArray) -> npt.NDArray:
+    """Copy the sensor matrices of a TactileData into a compact buffer."""
+    for name, (finger, position) in TACTILE_SENSORS.items():
+        matrix = getattr(data, finger) if position is None else getattr(getattr(data, finger), position)
+        sensor_view(out, name, compact=True)[...] = matrix
+    return out
+
+
+def decode_tactile(buffer: npt.NDArray[np.int32], timestamp: float, compact: bool = False) -> TactileData:
+    """Build a TactileData whose sensor arrays are views into one sweep (or compact) buffer."""
+    views = {name: sensor_view(buffer, name, compact) for name in TACTILE_SENSORS}
+    return TactileData(
+        timestamp=timestamp,
+        pinky=FingerSensorData(views["PINKY_TOP_TAC"], views["PINKY_TIP_TAC"], views["PINKY_BASE_TAC"]),
+        ring=FingerSensorData(views["RING_TOP_TAC"], views["RING_TIP_TAC"], views["RING_BASE_TAC"]),
+        middle=FingerSensorData(views["MIDDLE_TOP_TAC"], views["MIDDLE_TIP_TAC"], views["MIDDLE_BASE_TAC"]),
+        index=FingerSensorData(views["INDEX_TOP_TAC"], views["INDEX_TIP_TAC"], views["INDEX_BASE_TAC"]),
+        thumb=ThumbSensorData(views["THUMB_TOP_TAC"], views["THUMB_TIP_TAC"], views["THUMB_MID_TAC"], views["THUMB_BASE_TAC"]),
+        palm=views["PALM_TAC"],
+    )
+
+
+def empty_tactile_data(timestamp: float) -> TactileData:
+    """TactileData with empty arrays, returned when a sweep fails."""
+    def empty() -> npt.NDArray[np.int32]:
+        return np.array([], dtype=np.int32)
+
+    return TactileData(
+        timestamp=timestamp,
+        pinky=FingerSensorData(empty(), empty(), empty()),
+        ring=FingerSensorData(empty(), empty(), empty()),
+        middle=FingerSensorData(empty(), empty(), empty()),
+        index=FingerSensorData(empty(), empty(), empty()),
+        thumb=ThumbSensorData(empty(), empty(), empty(), empty()),
+        palm=empty(),
+    )
+
+
+class TactileFrame:
+    """Reusable tactile sweep backed by one preallocated buffer.
+
+    `buffer` holds the raw sweep from address 3000 and `data` is a TactileData whose
+    sensor arrays are views into it, built once. InspireHandModbus.read_into()
+    refills the buffer in place, so polling allocates no new arrays. Copy the
+    arrays (or use copy()) to keep values past the next read.
+
+    Args:
+        dtype: Buffer element type, int32 (default, matches TactileData) or uint16
+    """
+
+    __slots__ = ("buffer", "data", "valid", "sequence")
+
+    def __init__(self, dtype: npt.DTypeLike = np.int32):
+        self.buffer = np.zeros(TACTILE_SPAN, dtype=dtype)
+        self.data = decode_tactile(self.buffer, 0.0)
+        self.valid = False  # False until the first successful read, and after a failed one
+        self.sequence = 0  # Incremented by every successful read
+
+    @property
+    def timestamp(self) -> float:
+        return self.data.timestamp
+
+    def sensor(self, reg_name: str) -> npt.NDArray:
+        """View of one sensor by register name (e.g. "INDEX_TIP_TAC")."""
+        return sensor_view(self.buffer, reg_name)
+
+    def copy(self) -> TactileData:
+        """Detached TactileData with its own buffer."""
+        return decode_tactile(self.buffer.copy(), self.data.timestamp)
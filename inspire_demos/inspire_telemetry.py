@@ -0,0 +1,167 @@
+"""
+Background telemetry polling with a shared latest-snapshot cache.
+
+TelemetryPoller reads the state window of one hand at a fixed rate on its own
+thread and publishes each result as an immutable TelemetrySnapshot. Any number
+of consumers (UI, safety monitor, logger) call latest() without touching the
+bus, so the device load no longer grows with the number of readers.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from loguru import logger
+
+from inspire_demos.inspire_serial import HandState
+
+
+@dataclass(frozen=True)
+class TelemetrySnapshot:
+    """One published state reading.
+
+    Attributes:
+        state: Decoded registers; HandState.timestamp is the wall-clock read time
+        sequence: Increments with every successful poll
+        received: time.monotonic() when the reply arrived, used for staleness
+    """
+    state: HandState
+    sequence: int
+    received: float
+
+    def age(self) -> float:
+        """Seconds since this snapshot was received."""
+        return time.monotonic() - self.received
+
+    def is_stale(self, max_age: float) -> bool:
+        """True if the snapshot is older than max_age seconds."""
+        return self.age() > max_age
+
+
+class TelemetryPoller:
+    """Polls read_state() on a dedicated thread and caches the newest snapshot.
+
+    Works with InspireHandSerial and InspireHandModbus. Extra keyword arguments
+    (e.g. hand_id=2 for serial) are passed to every read_state() call.
+
+    Publishing is a single reference swap of an immutable object, so readers
+    never take a lock and never observe a half-updated snapshot.
+    """
+
+    _logger = logger
+
+    def __init__(self, hand: Any, rate_hz: float = 50.0, **read_kwargs: Any):
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        self._hand = hand
+        self._period = 1.0 / rate_hz
+        self._read_kwargs = read_kwargs
+        self._snapshot: Optional[TelemetrySnapshot] = None
+        self._updated = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._polls = 0
+        self._failures = 0
+        self._overruns = 0
+        self._last_duration = 0.0
+
+    def start(self) -> "TelemetryPoller":
+        """Start the polling thread."""
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="inspire-telemetry-poller", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the polling thread. The last snapshot stays available."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "TelemetryPoller":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def latest(self, max_age: Optional[float] = None) -> Optional[TelemetrySnapshot]:
+        """Newest snapshot without any I/O.
+
+        Args:
+            max_age: If given, return None instead of a snapshot older than this (seconds)
+
+        Returns:
+            TelemetrySnapshot: Newest snapshot, or None before the first poll or if stale
+        """
+        snapshot = self._snapshot
+        if snapshot is None or (max_age is not None and snapshot.is_stale(max_age)):
+            return None
+        return snapshot
+
+    def get_state(self, max_age: Optional[float] = None) -> Optional[HandState]:
+        """HandState of the newest snapshot (see latest())."""
+        snapshot = self.latest(max_age)
+        return snapshot.state if snapshot is not None else None
+
+    def wait_for_update(self, after: int = -1, timeout: Optional[float] = None) -> Optional[TelemetrySnapshot]:
+        """Block until a snapshot with sequence > after is published.
+
+        Returns:
+            TelemetrySnapshot: The new snapshot, or None on timeout
+        """
+        with self._updated:
+            self._updated.wait_for(lambda: self._snapshot is not None and self._snapshot.sequence > after, timeout)
+            snapshot = self._snapshot
+        return snapshot if snapshot is not None and snapshot.sequence > after else None
+
+    def get_rate(self) -> float:
+        """Get the polling rate in Hz"""
+        return 1.0 / self._period
+
+    def set_rate(self, rate_hz: float) -> None:
+        """Set the polling rate in Hz"""
+        if rate_hz <= 0:
+            raise ValueError(f"rate_hz must be positive, got {rate_hz}")
+        self._period = 1.0 / rate_hz
+
+    def get_stats(self) -> dict:
+        """Poll counters and the duration of the last read in seconds."""
+        return {
+            "polls": self._polls,
+            "failures": self._failures,
+            "overruns": self._overruns,
+            "last_duration": self._last_duration,
+        }
+
+    def _run(self) -> None:
+        next_due = time.monotonic()
+        while not self._stop.is_set():
+            start = time.monotonic()
+            try:
+                state = self._hand.read_state(**self._read_kwargs)
+            except Exception as e:
+                self._logger.error(f"Telemetry poll failed: {e}")
+                state = None
+            end = time.monotonic()
+            self._last_duration = end - start
+
+            if state is None:
+                self._failures += 1
+            else:
+                self._polls += 1
+                with self._updated:
+                    self._snapshot = TelemetrySnapshot(state=state, sequence=self._polls, received=end)
+                    self._updated.notify_all()
+
+            next_due += self._period
+            if next_due < end:
+                # Fell behind: skip the missed slots instead of bursting to catch up
+                self._overruns += 1
+                next_due = end
+            self._stop.wait(next_due - end)
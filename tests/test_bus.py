@@ -0,0 +1,37 @@
+"""Tests for SerialBusScheduler polling"""
+
+import numpy as np
+
+from inspire_demos.inspire_bus import SerialBusScheduler
+from inspire_demos.inspire_serial import HandState
+
+
+class FakeHand:
+    """Stands in for InspireHandSerial; on_read runs while a poll is on the bus."""
+
+    def __init__(self):
+        self.on_read = None
+
+    def read_state(self, hand_id):
+        if self.on_read is not None:
+            self.on_read()
+        zeros = np.zeros(6, dtype=np.int32)
+        return HandState(0.0, zeros, zeros, zeros, zeros, zeros, zeros, zeros)
+
+
+def test_poll_publishes_state():
+    hand = FakeHand()
+    scheduler = SerialBusScheduler(hand, {1: 100.0})
+    scheduler._poll(scheduler._hands[1])
+    assert scheduler.get_state(1) is not None
+    assert scheduler.get_cycle_stats()[1]["polls"] == 1
+
+
+def test_poll_in_flight_does_not_publish_removed_hand():
+    hand = FakeHand()
+    scheduler = SerialBusScheduler(hand, {1: 100.0, 2: 100.0})
+    hand.on_read = lambda: scheduler.remove_hand(1)
+    scheduler._poll(scheduler._hands[1])
+    assert scheduler.get_state(1) is None
+    assert 1 not in scheduler.get_states()
+    assert list(scheduler.get_cycle_stats()) == [2]
@@ -0,0 +1,65 @@
+"""Tests for the tactile block codec and recording compression"""
+
+import numpy as np
+import pytest
+
+from inspire_demos.inspire_compression import (
+    LZ4_AVAILABLE,
+    ZSTD_AVAILABLE,
+    TactileCodec,
+    compress_recording,
+    decompress_recording,
+)
+from inspire_demos.inspire_recording import SessionRecorder, is_compressed
+from inspire_demos.inspire_tactile import TACTILE_SPAN, TACTILE_TAXELS
+
+CODECS = [
+    "zlib",
+    "none",
+    pytest.param("zstd", marks=pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not installed")),
+    pytest.param("lz4", marks=pytest.mark.skipif(not LZ4_AVAILABLE, reason="lz4 not installed")),
+]
+
+
+def tactile_block(frames, seed=0):
+    # Slowly drifting readings with noise, clipped like the 12-bit taxels
+    rng = np.random.default_rng(seed)
+    base = rng.integers(0, 4096, TACTILE_TAXELS)
+    drift = rng.integers(-8, 9, (frames, TACTILE_TAXELS)).cumsum(axis=0)
+    return np.clip(base + drift, 0, 4095).astype(np.uint16)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_codec_round_trip(codec):
+    tactile_codec = TactileCodec(codec)
+    frames = tactile_block(100)
+    decoded = tactile_codec.decode(tactile_codec.encode(frames))
+    assert decoded.dtype == np.uint16
+    np.testing.assert_array_equal(decoded, frames)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_codec_round_trip_full_range(codec):
+    # Wrap-around deltas between 0 and 0xFFFF must survive the zigzag coding
+    frames = np.random.default_rng(1).integers(0, 0x10000, (16, 40), dtype=np.uint16)
+    tactile_codec = TactileCodec(codec)
+    np.testing.assert_array_equal(tactile_codec.decode(tactile_codec.encode(frames, verify=True)), frames)
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_recording_round_trip(tmp_path, codec):
+    src = tmp_path / "session.insprec"
+    rng = np.random.default_rng(2)
+    with SessionRecorder(src, block_records=16) as recorder:
+        for i in range(50):
+            recorder.record(rng.integers(0, 4096, TACTILE_SPAN, dtype=np.uint16), timestamp=1000.0 + 0.01 * i)
+    with open(src, "ab") as f:
+        f.write(b"\x01\x02\x03")  # Partial record left by a crash
+
+    compressed = tmp_path / "session.insprec.z"
+    restored = tmp_path / "restored.insprec"
+    stats = compress_recording(src, compressed, codec=codec, block_frames=20)
+    assert stats.frames == 50
+    assert is_compressed(compressed)
+    assert decompress_recording(compressed, restored) == 50
+    assert restored.read_bytes() == src.read_bytes()
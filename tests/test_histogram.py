@@ -0,0 +1,71 @@
+"""Tests for LatencyHistogram against exact statistics"""
+
+import numpy as np
+import pytest
+
+from inspire_demos.inspire_histogram import LatencyHistogram
+
+PERCENTILES = (0.0, 1.0, 25.0, 50.0, 90.0, 99.0, 99.9, 100.0)
+NUMPY_NEAREST_RANK = tuple(int(part) for part in np.__version__.split(".")[:2]) >= (1, 22)
+
+
+def latencies(size=20000, seed=0):
+    # Log-normal around 200 us with a tail into the milliseconds, plus a few tiny values
+    rng = np.random.default_rng(seed)
+    values = rng.lognormal(np.log(200_000), 0.8, size).astype(np.int64)
+    values[:10] = np.arange(10)
+    return values
+
+
+@pytest.mark.skipif(not NUMPY_NEAREST_RANK, reason="numpy.percentile(method=...) needs numpy >= 1.22")
+@pytest.mark.parametrize("significant_figures", [1, 2, 3, 4])
+def test_percentiles_within_precision(significant_figures):
+    values = latencies()
+    histogram = LatencyHistogram(significant_figures)
+    histogram.record_many(values)
+    for p in PERCENTILES:
+        # Nearest rank, the definition the histogram uses
+        exact = int(np.percentile(values, p, method="inverted_cdf"))
+        reported = histogram.percentile(p)
+        # The highest equivalent value of the bucket is reported, so the error is one-sided
+        assert exact <= reported <= exact + exact * 10 ** -significant_figures, p
+    assert histogram.count == len(values)
+    assert histogram.min == values.min()
+    assert histogram.max == values.max()
+    assert histogram.mean == pytest.approx(values.mean(), rel=1e-12)
+    assert histogram.stdev == pytest.approx(values.std(), rel=1e-6)
+
+
+def test_record_matches_record_many():
+    values = latencies(2000, seed=1)
+    single = LatencyHistogram()
+    for value in values:
+        single.record(value)
+    vectorized = LatencyHistogram()
+    vectorized.record_many(values)
+    assert single.to_dict() == vectorized.to_dict()
+
+
+def test_merge_and_round_trip():
+    values = latencies(4000, seed=2)
+    merged = LatencyHistogram()
+    for part in np.array_split(values, 3):
+        histogram = LatencyHistogram()
+        histogram.record_many(part)
+        merged.merge(histogram)
+    whole = LatencyHistogram()
+    whole.record_many(values)
+    assert merged.to_dict() == whole.to_dict()
+    assert LatencyHistogram.from_dict(whole.to_dict()).percentiles() == whole.percentiles()
+
+
+def test_empty_and_invalid():
+    histogram = LatencyHistogram()
+    assert (histogram.count, histogram.min, histogram.max, histogram.mean) == (0, 0, 0, 0.0)
+    assert histogram.percentile(99.0) == 0
+    with pytest.raises(ValueError):
+        histogram.record(-1)
+    with pytest.raises(ValueError):
+        histogram.percentile(101.0)
+    with pytest.raises(ValueError):
+        LatencyHistogram(6)
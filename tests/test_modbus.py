@@ -0,0 +1,83 @@
+"""Tests for InspireHandModbus against the built-in simulator"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pymodbus")
+
+from inspire_demos.inspire_modbus import InspireHandModbus
+from inspire_demos.inspire_modbus_async import AsyncInspireHandModbus
+from inspire_demos.inspire_sim import ModbusHandSimulator, SimulatedHand
+
+ADDRESS = 3000
+COUNT = 600  # Five segments of up to 125 registers
+
+
+@pytest.fixture
+def simulator():
+    # Gen3 hands have no tactile model, so a pattern written into the register file stays put
+    hand = SimulatedHand(generation=3)
+    pattern = np.random.default_rng(0).integers(0, 0x10000, COUNT, dtype=np.uint16)
+    hand.write_registers(ADDRESS, pattern.tolist())
+    with ModbusHandSimulator("127.0.0.1", hand=hand) as sim:
+        yield sim, pattern
+
+
+def connect(sim, pipeline_depth):
+    hand = InspireHandModbus(ip=sim.host, port=sim.port, generation=3, pipeline_depth=pipeline_depth)
+    assert hand.connect()
+    return hand
+
+
+def test_pipelined_read_matches_segmented_read(simulator):
+    sim, pattern = simulator
+    segmented = connect(sim, 1)
+    pipelined = connect(sim, 4)
+    try:
+        timeout = pipelined._client.socket.gettimeout()
+        assert segmented._read_register(ADDRESS, COUNT) == pattern.tolist()
+        assert pipelined._read_register(ADDRESS, COUNT) == pattern.tolist()
+
+        out = np.zeros(COUNT, dtype=np.uint16)
+        assert pipelined._read_into(ADDRESS, out)
+        np.testing.assert_array_equal(out, pattern)
+
+        # The pipeline borrows pymodbus's socket and must leave its timeout alone
+        assert pipelined._client.socket.gettimeout() == timeout
+        assert pipelined._read_register(ADDRESS, 6) == pattern[:6].tolist()
+    finally:
+        segmented.disconnect()
+        pipelined.disconnect()
+
+
+def test_async_client_matches_sync_client(simulator):
+    sim, pattern = simulator
+    sync_hand = connect(sim, 1)
+    try:
+        expected = sync_hand.read_state()
+    finally:
+        sync_hand.disconnect()
+
+    async def read():
+        hand = AsyncInspireHandModbus(ip=sim.host, port=sim.port, generation=3)
+        assert await hand.connect()
+        try:
+            out = np.zeros(COUNT, dtype=np.uint16)
+            assert await hand._read_into(ADDRESS, out)
+            return out, await hand.read_state()
+        finally:
+            await hand.disconnect()
+
+    out, state = asyncio.run(read())
+    np.testing.assert_array_equal(out, pattern)
+    for field in ("pos", "angle", "force", "current", "error", "status", "temp"):
+        np.testing.assert_array_equal(getattr(state, field), getattr(expected, field))
+
+
+def test_simulator_start_failure_is_raised(simulator):
+    sim, _ = simulator
+    # The port is already taken by the running simulator
+    with pytest.raises(OSError):
+        ModbusHandSimulator(sim.host, port=sim.port).start_in_thread(timeout=5.0)
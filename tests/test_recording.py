@@ -0,0 +1,104 @@
+"""Tests for SessionRecorder and SessionReader"""
+
+import numpy as np
+import pytest
+
+from inspire_demos.inspire_recording import (
+    HEADER_ALIGN,
+    RECORD_DTYPE,
+    SessionReader,
+    SessionRecorder,
+    read_header,
+)
+from inspire_demos.inspire_serial import HandState
+from inspire_demos.inspire_tactile import TACTILE_SPAN, TactileFrame, sensor_view
+
+FRAMES = 40
+START = 1000.0
+PERIOD = 0.01
+
+
+def hand_state(rng, timestamp):
+    def joints(high):
+        return rng.integers(0, high, 6).astype(np.int32)
+    return HandState(timestamp=timestamp, pos=joints(1001), angle=joints(1001), force=joints(3000),
+                     current=joints(1000), error=joints(256), status=joints(4), temp=joints(100))
+
+
+@pytest.fixture
+def session(tmp_path):
+    rng = np.random.default_rng(0)
+    sweeps = rng.integers(0, 4096, (FRAMES, TACTILE_SPAN), dtype=np.uint16)
+    states = [hand_state(rng, START + PERIOD * i) for i in range(FRAMES)]
+    path = tmp_path / "session.insprec"
+    # Small blocks so the writer thread flushes several of them
+    with SessionRecorder(path, metadata={"rig": "test"}, block_records=8) as recorder:
+        for sweep, state in zip(sweeps, states):
+            recorder.record(sweep, state)
+    return path, sweeps, states
+
+
+def test_reader_returns_recorded_frames(session):
+    path, sweeps, states = session
+    with SessionReader(path) as reader:
+        assert len(reader) == FRAMES
+        assert reader.metadata["rig"] == "test"
+        np.testing.assert_array_equal(reader.timestamps, [state.timestamp for state in states])
+        assert reader.has_tactile().all() and reader.has_state().all()
+        for name in ("PALM_TAC", "INDEX_TIP_TAC", "THUMB_MID_TAC"):
+            np.testing.assert_array_equal(reader.sensor(name), sensor_view(sweeps, name))
+        for i in (0, FRAMES // 2, FRAMES - 1):
+            np.testing.assert_array_equal(reader.tactile(i).palm, sensor_view(sweeps[i], "PALM_TAC"))
+            state = reader.state(i)
+            for field in ("pos", "angle", "force", "current", "error", "status", "temp"):
+                np.testing.assert_array_equal(getattr(state, field), getattr(states[i], field))
+
+
+def test_index_at_clamps_to_session(session):
+    path, _, _ = session
+    with SessionReader(path) as reader:
+        assert reader.index_at(START - 1.0) == 0
+        assert reader.index_at(START) == 0
+        assert reader.index_at(START + 2.5 * PERIOD) == 2
+        assert reader.index_at(START + FRAMES * PERIOD + 1.0) == FRAMES - 1
+        assert reader.window(START + PERIOD, START + 3 * PERIOD) == slice(1, 3)
+
+
+def test_index_at_empty_session(tmp_path):
+    path = tmp_path / "empty.insprec"
+    SessionRecorder(path).close()
+    with SessionReader(path) as reader:
+        assert len(reader) == 0
+        with pytest.raises(IndexError):
+            reader.index_at(START)
+
+
+def test_writer_thread_flushes_every_block(tmp_path):
+    path = tmp_path / "blocks.insprec"
+    frames = 3 * 8 + 5  # Full blocks plus a partly filled one, more than the staging blocks
+    recorder = SessionRecorder(path, block_records=8, blocks=2)
+    for i in range(frames):
+        recorder.record(np.full(TACTILE_SPAN, i, dtype=np.uint16), timestamp=START + i)
+    recorder.close()
+    assert recorder.get_stats()["records"] == frames
+
+    header_size, record_size, metadata = read_header(path)
+    assert header_size % HEADER_ALIGN == 0
+    assert record_size == RECORD_DTYPE.itemsize
+    assert metadata["record_dtype"]
+    assert path.stat().st_size == header_size + frames * record_size
+    with SessionReader(path) as reader:
+        np.testing.assert_array_equal(reader.timestamps, START + np.arange(frames))
+        np.testing.assert_array_equal(reader.sensor("PALM_TAC")[:, 0, 0], np.arange(frames))
+
+
+def test_record_rejects_failed_reads(tmp_path):
+    with SessionRecorder(tmp_path / "rejected.insprec") as recorder:
+        frame = TactileFrame()  # Never read, so not valid
+        with pytest.raises(ValueError):
+            recorder.record(frame)
+        frame.valid = True
+        recorder.record(frame)
+        with pytest.raises(ValueError):
+            recorder.record(np.zeros(10, dtype=np.uint16))
+        assert recorder.get_stats()["records"] == 1
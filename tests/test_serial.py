@@ -0,0 +1,63 @@
+"""Tests for the serial frame encoding and decoding"""
+
+import numpy as np
+
+from inspire_demos.inspire_serial import (
+    CMD_READ,
+    CMD_WRITE,
+    REPLY_HEADER,
+    FrameDecoder,
+    FrameTemplate,
+    build_frame,
+)
+
+
+def reply(hand_id, cmd, addr, payload):
+    frame = bytearray(build_frame(hand_id, cmd, addr, payload))
+    frame[:2] = REPLY_HEADER  # Header bytes are not part of the checksum
+    return bytes(frame)
+
+
+def test_build_frame_layout_and_checksum():
+    frame = build_frame(1, CMD_READ, 1546, bytes((12,)))
+    # header, id, len (cmd + address + payload), cmd, address (little-endian), payload, checksum
+    assert frame == bytes.fromhex("eb90 01 04 11 0a06 0c 32")
+    assert frame[-1] == sum(frame[2:-1]) & 0xFF
+
+
+def test_decoder_resyncs_after_garbage():
+    decoder = FrameDecoder()
+    decoder.feed(b"\x00\x13\x90\xff" + reply(1, CMD_READ, 1546, b"\x01\x02"))
+    frame = decoder.next_frame()
+    assert (frame.hand_id, frame.cmd, frame.addr, frame.data) == (1, CMD_READ, 1546, b"\x01\x02")
+    assert decoder.dropped_bytes == 4
+    assert decoder.next_frame() is None
+
+
+def test_decoder_drops_frame_with_bad_checksum():
+    bad = bytearray(reply(1, CMD_READ, 1546, b"\x01\x02"))
+    bad[-1] ^= 0xFF
+    decoder = FrameDecoder()
+    decoder.feed(bytes(bad) + reply(2, CMD_WRITE, 1486, b"\x01"))
+    frame = decoder.next_frame()
+    assert (frame.hand_id, frame.cmd, frame.data) == (2, CMD_WRITE, b"\x01")
+    assert decoder.checksum_errors == 1
+    assert decoder.next_frame() is None
+
+
+def test_decoder_assembles_frame_split_across_chunks():
+    data = reply(1, CMD_READ, 1534, bytes(range(90)))
+    decoder = FrameDecoder()
+    for offset in range(0, len(data), 7):
+        assert decoder.next_frame() is None
+        decoder.feed(data[offset:offset + 7])
+    frame = decoder.next_frame()
+    assert frame.addr == 1534 and frame.data == bytes(range(90))
+
+
+def test_frame_template_matches_build_frame():
+    template = FrameTemplate(3, 1486, 12)
+    values = np.array([0, 100, 1000, 65535, 7, 500])
+    payload = values.astype("<u2").tobytes()
+    assert bytes(template.fill(payload)) == build_frame(3, CMD_WRITE, 1486, payload)
+    assert bytes(template.fill_words(values[::-1])) == build_frame(3, CMD_WRITE, 1486, values[::-1].astype("<u2").tobytes())
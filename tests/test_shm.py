@@ -0,0 +1,69 @@
+"""Tests for the shared-memory tactile ring"""
+
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+
+from inspire_demos.inspire_shm import TactileRingReader, TactileRingWriter
+from inspire_demos.inspire_tactile import TACTILE_SPAN
+
+FRAMES = 20000
+
+
+def write_frames(writer, frames):
+    buffer = np.empty(TACTILE_SPAN, dtype=np.uint16)
+    for seq in range(1, frames + 1):
+        buffer.fill(seq & 0xFFFF)
+        writer.write(buffer, float(seq))
+
+
+@pytest.fixture
+def ring():
+    writer = TactileRingWriter(slots=4)  # Few slots so the writer laps the reader often
+    try:
+        yield writer
+    finally:
+        writer.close()
+        writer.unlink()
+
+
+def test_latest_and_last(ring):
+    with TactileRingReader(ring.name) as reader:
+        assert reader.latest() is None
+        write_frames(ring, 6)
+        frame = reader.latest()
+        assert (frame.sequence, frame.timestamp) == (6, 6.0)
+        assert [f.sequence for f in reader.last(10)] == [4, 5, 6]
+        assert reader.is_current(frame)
+        ring.write(np.zeros(TACTILE_SPAN, dtype=np.uint16), 7.0)
+        ring.write(np.zeros(TACTILE_SPAN, dtype=np.uint16), 8.0)
+        assert reader.is_current(frame)
+        write_frames(ring, 2)  # Sequences 9 and 10 reuse slots
+        assert not reader.is_current(frame)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="needs fork")
+def test_reader_never_sees_torn_slot(ring):
+    writer_process = multiprocessing.get_context("fork").Process(target=write_frames, args=(ring, FRAMES))
+    with TactileRingReader(ring.name) as reader:
+        writer_process.start()
+        checked = 0
+        while writer_process.is_alive() or checked == 0:
+            frame = reader.latest()
+            if frame is None:
+                continue
+            buffer = frame.buffer.copy()
+            timestamp = frame.timestamp
+            if reader.is_current(frame):
+                # A slot that still carries its sequence after the copy was not written meanwhile
+                assert timestamp == frame.sequence
+                assert (buffer == (frame.sequence & 0xFFFF)).all()
+                checked += 1
+            copied = reader.copy_latest()
+            assert (copied.buffer == (copied.sequence & 0xFFFF)).all()
+        writer_process.join()
+        assert writer_process.exitcode == 0
+        assert reader.head() == FRAMES
+        assert checked > 0
@@ -0,0 +1,38 @@
+"""Tests for the tactile register layout helpers"""
+
+import pytest
+
+from inspire_demos.inspire_tactile import FINGERTIP_SENSORS, TACTILE_SENSORS, TactileSubscription, sensor_layout
+
+
+def covered(subscription):
+    registers = set()
+    for start, count in subscription.segments:
+        registers.update(range(start, start + count))
+    return registers
+
+
+def test_subscription_skips_gap_that_saves_no_transaction():
+    subscription = TactileSubscription(["PINKY_TOP_TAC", "PINKY_BASE_TAC"])
+    assert subscription.segments == [(0, 9), (105, 80)]
+    assert subscription.registers == 89
+
+
+def test_subscription_reads_gap_when_it_saves_a_transaction():
+    subscription = TactileSubscription(["PINKY_TOP_TAC", "PINKY_TIP_TAC"])
+    assert len(subscription.segments) == 1
+
+
+@pytest.mark.parametrize("sensors", [list(TACTILE_SENSORS), FINGERTIP_SENSORS + ("PALM_TAC",), ["PALM_TAC"]])
+def test_subscription_covers_sensors_within_window_limit(sensors):
+    subscription = TactileSubscription(sensors)
+    registers = covered(subscription)
+    for name in sensors:
+        offset, rows, cols = sensor_layout(name)
+        assert set(range(offset, offset + rows * cols)) <= registers
+    assert all(0 < count <= 125 for _, count in subscription.segments)
+
+
+def test_subscription_rejects_unknown_sensor():
+    with pytest.raises(ValueError):
+        TactileSubscription(["NOSE_TAC"])